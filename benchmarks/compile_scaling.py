@@ -0,0 +1,65 @@
+import argparse
+import os
+import time
+
+from benchmarks.synthetic import synthetic_model
+from compiler.builders.ir_builder import build_ir
+from compiler.sql.builders.sql_ir_builder import build_sql_ir_from_semantic
+from compiler.sql.coordinator.compile import compile_queries
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Measure SQL compile time across worker counts."
+    )
+    parser.add_argument("--facts", type=int, default=500)
+    parser.add_argument("--dimensions", type=int, default=50)
+    parser.add_argument("--measures", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument(
+        "--jobs",
+        default=None,
+        help="comma-separated worker counts (default: powers of two up to CPU count)",
+    )
+    args = parser.parse_args()
+
+    semantic_ir = build_ir(
+        synthetic_model(args.facts, args.dimensions, args.measures)
+    )
+    queries = build_sql_ir_from_semantic(semantic_ir)
+
+    if args.jobs:
+        worker_counts = [int(j) for j in args.jobs.split(",")]
+    else:
+        cpu_count = os.cpu_count() or 1
+        worker_counts = sorted(
+            {1, cpu_count} | {2 ** i for i in range(1, 6) if 2 ** i < cpu_count}
+        )
+
+    print(
+        f"{args.facts} facts, {args.dimensions} dimensions, "
+        f"{args.measures} measures, best of {args.repeat}\n"
+    )
+    print(f"{'jobs':>4}  {'seconds':>8}  {'speedup':>7}")
+
+    reference = None
+    baseline = None
+    for jobs in worker_counts:
+        best = float("inf")
+        for _ in range(args.repeat):
+            started = time.perf_counter()
+            compiled = compile_queries(semantic_ir, queries, jobs=jobs)
+            best = min(best, time.perf_counter() - started)
+
+        # Parallel output must be identical to sequential output
+        if reference is None:
+            reference = compiled
+        elif compiled != reference:
+            raise RuntimeError(f"non-deterministic output with jobs={jobs}")
+
+        baseline = baseline or best
+        print(f"{jobs:>4}  {best:>8.3f}  {baseline / best:>6.2f}x")
+
+
+if __name__ == "__main__":
+    main()
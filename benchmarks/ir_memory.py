@@ -0,0 +1,175 @@
+import argparse
+import gc
+import sys
+import tracemalloc
+from dataclasses import dataclass
+from typing import Callable, Dict, List
+
+from benchmarks.synthetic import synthetic_model
+from compiler.builders.ir_builder import build_ir
+from compiler.sql.builders.sql_ir_builder import build_sql_ir_from_semantic
+from compiler.sql.coordinator.compile import build_pipeline
+
+
+# ---------- Legacy representation (dict-backed, list fields) ----------
+
+@dataclass(frozen=True)
+class LegacyDimension:
+    name: str
+    key: str
+    grain: List[str]
+    attributes: List[str]
+
+@dataclass(frozen=True)
+class LegacyMeasure:
+    name: str
+
+@dataclass(frozen=True)
+class LegacyFact:
+    name: str
+    grain: List[str]
+    measures: List[LegacyMeasure]
+    foreign_keys: List[str]
+
+@dataclass(frozen=True)
+class LegacySelectColumn:
+    expression: str
+    alias: str
+
+@dataclass(frozen=True)
+class LegacyJoin:
+    table: str
+    on: str
+    join_type: str = "LEFT"
+
+@dataclass(frozen=True)
+class LegacyMeasureAggregation:
+    measure: str
+    aggregation: str
+
+@dataclass(frozen=True)
+class LegacyFactQuery:
+    select: List[LegacySelectColumn]
+    from_table: str
+    joins: List[LegacyJoin]
+    group_by: List[str]
+    grain_columns: List[str]
+    foreign_keys: List[str]
+    measures: List[str]
+    aggregations: Dict[str, LegacyMeasureAggregation]
+    dimension_columns: List[str]
+
+
+def build_legacy(model: dict) -> tuple:
+    facts = {
+        fact_name: LegacyFact(
+            name=fact_name,
+            grain=list(fact_def["grain"]),
+            measures=[LegacyMeasure(name=m) for m in fact_def["measures"]],
+            foreign_keys=list(fact_def["foreign_keys"]),
+        )
+        for fact_name, fact_def in model["facts"].items()
+    }
+    dimensions = {
+        dim_name: LegacyDimension(
+            name=dim_name,
+            key=dim_def["key"],
+            grain=list(dim_def["grain"]),
+            attributes=list(dim_def["attributes"]),
+        )
+        for dim_name, dim_def in model["dimensions"].items()
+    }
+
+    fk_to_dimension = {dim.key: dim for dim in dimensions.values()}
+    queries = []
+    for fact_name, fact in facts.items():
+        measures = [m.name for m in fact.measures]
+        joins = [
+            LegacyJoin(
+                table=fk_to_dimension[fk].name,
+                on=f"{fact_name}.{fk} = {fk_to_dimension[fk].name}.{fk}",
+            )
+            for fk in fact.foreign_keys
+        ]
+        queries.append(LegacyFactQuery(
+            select=[
+                LegacySelectColumn(expression=c, alias=c)
+                for c in fact.grain + fact.foreign_keys + measures
+            ],
+            from_table=fact_name,
+            joins=joins,
+            group_by=list(fact.grain),
+            grain_columns=list(fact.grain),
+            foreign_keys=list(fact.foreign_keys),
+            measures=measures,
+            aggregations={
+                m: LegacyMeasureAggregation(measure=m, aggregation="SUM")
+                for m in measures
+            },
+            dimension_columns=[f"{j.table}.{fk}" for j, fk in zip(joins, fact.foreign_keys)],
+        ))
+
+    return facts, dimensions, queries
+
+
+def build_current(model: dict) -> tuple:
+    semantic_ir = build_ir(model)
+    pipeline = build_pipeline(semantic_ir)
+    queries = pipeline.run_all(build_sql_ir_from_semantic(semantic_ir))
+    return semantic_ir, queries
+
+# ---------- Measurement ----------
+
+def traced_size(build: Callable[[dict], tuple], model: dict) -> int:
+    """
+    Bytes still allocated by the structure returned from `build`.
+    """
+    gc.collect()
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    result = build(model)
+    gc.collect()
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return after - before
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Compare IR memory footprint of legacy and slotted classes."
+    )
+    parser.add_argument("--facts", type=int, default=10_000)
+    parser.add_argument("--dimensions", type=int, default=200)
+    parser.add_argument("--measures", type=int, default=10)
+    args = parser.parse_args()
+
+    # Each run gets its own model so no strings are shared between them
+    legacy = traced_size(
+        build_legacy,
+        synthetic_model(args.facts, args.dimensions, args.measures),
+    )
+    current = traced_size(
+        build_current,
+        synthetic_model(args.facts, args.dimensions, args.measures),
+    )
+
+    model = synthetic_model(1, 4, args.measures)
+    legacy_fact = build_legacy(model)[0]["fact_00000"]
+    current_fact = build_ir(model).facts["fact_00000"]
+
+    print(
+        f"{args.facts} facts, {args.dimensions} dimensions, "
+        f"{args.measures} measures\n"
+    )
+    print(f"{'representation':<16} {'IR bytes':>14} {'Fact instance':>14}")
+    print(
+        f"{'legacy':<16} {legacy:>14,} "
+        f"{sys.getsizeof(legacy_fact) + sys.getsizeof(legacy_fact.__dict__):>14,}"
+    )
+    print(f"{'slotted':<16} {current:>14,} {sys.getsizeof(current_fact):>14,}")
+    print(f"\nreduction: {1 - current / legacy:.1%}")
+
+
+if __name__ == "__main__":
+    main()
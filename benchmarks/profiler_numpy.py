@@ -0,0 +1,91 @@
+import argparse
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, Tuple
+
+from benchmarks.synthetic import write_sales_extract
+from compiler.sql.coordinator.profile import profile_table
+from compiler.sql.cost import hyperloglog, profiler
+from compiler.sql.cost.statistics import Statistics
+
+
+@contextmanager
+def without_numpy() -> Iterator[None]:
+    """
+    Runs the profiler on its pure-Python path while NumPy is installed.
+    """
+    saved = hyperloglog.np, profiler.np
+    hyperloglog.np = profiler.np = None
+    try:
+        yield
+    finally:
+        hyperloglog.np, profiler.np = saved
+
+
+def timed_profile(
+    csv_path: Path,
+    stats_path: Path,
+    chunk_bytes: int,
+) -> Tuple[Statistics, float]:
+    started = time.perf_counter()
+    statistics = profile_table(
+        csv_path, chunk_bytes=chunk_bytes, stats_path=stats_path
+    )
+    return statistics, time.perf_counter() - started
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Profile one synthetic sales_data extract with and "
+                    "without NumPy; fail when the statistics differ."
+    )
+    parser.add_argument("--rows", type=int, default=50_000)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument(
+        "--chunk-bytes",
+        type=int,
+        default=256 * 1024,
+        help="small chunks so records span chunk boundaries (default: 256 KiB)",
+    )
+    args = parser.parse_args()
+
+    if profiler.np is None:
+        sys.exit("NumPy is not installed; nothing to compare")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        csv_path = root / "sales_data.csv"
+        write_sales_extract(csv_path, args.rows, args.seed)
+
+        with_numpy, numpy_seconds = timed_profile(
+            csv_path, root / "numpy.yml", args.chunk_bytes
+        )
+        with without_numpy():
+            pure, pure_seconds = timed_profile(
+                csv_path, root / "python.yml", args.chunk_bytes
+            )
+
+    print(f"sales_data rows: {args.rows} (seed {args.seed})\n")
+    print(f"{'path':<8} {'seconds':>10} {'rows/s':>12}")
+    for name, seconds in (("numpy", numpy_seconds), ("python", pure_seconds)):
+        print(f"{name:<8} {seconds:>10.3f} {args.rows / seconds:>12,.0f}")
+
+    expected, actual = pure.to_dict()["tables"], with_numpy.to_dict()["tables"]
+    mismatches = [
+        f"{table}: {actual.get(table)} != {expected.get(table)}"
+        for table in sorted(expected.keys() | actual.keys())
+        if expected.get(table) != actual.get(table)
+    ]
+    if mismatches:
+        print("\nFAIL: statistics differ between the NumPy and Python paths")
+        for mismatch in mismatches:
+            print(f"  {mismatch}")
+        sys.exit(1)
+    print(f"\nstatistics of {len(expected)} table(s) are identical")
+
+
+if __name__ == "__main__":
+    main()
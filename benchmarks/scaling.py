@@ -0,0 +1,202 @@
+import argparse
+import json
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, List
+
+from benchmarks.synthetic import synthetic_model, write_synthetic_project
+from compiler.builders.ir_builder import build_ir
+from compiler.sql.builders.sql_ir_builder import build_sql_ir_from_semantic
+from compiler.sql.coordinator.compile import build_pipeline
+from compiler.sql.renderers.fact_renderer import FactQueryRenderer
+from validation.engine import Validator, load_model
+
+
+HISTORY_PATH = Path("benchmarks/history.jsonl")
+DEFAULT_SIZES = "10,100,1000"
+STAGES = ("validate", "build_ir", "pipeline", "render")
+
+
+def best_of(repeat: int, fn: Callable[[], object]) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def measure_size(
+    facts: int,
+    dimensions: int,
+    measures: int,
+    repeat: int,
+) -> Dict[str, float]:
+    """
+    Throughput in facts per second for each stage at one model size.
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = write_synthetic_project(
+            Path(tmp), synthetic_model(facts, dimensions, measures)
+        )
+        validator = Validator(
+            paths["fact_sql_dir"], paths["dim_sql_dir"], paths["schema"]
+        )
+        model = load_model(paths["model"])
+
+        diagnostics = validator.validate(model)
+        if diagnostics:
+            raise RuntimeError(f"synthetic model is invalid: {diagnostics[0]}")
+
+        semantic_ir = build_ir(model)
+        queries = build_sql_ir_from_semantic(semantic_ir)
+        pipeline = build_pipeline(semantic_ir)
+        compiled = pipeline.run_all(queries)
+
+        timings = {
+            "validate": best_of(repeat, lambda: validator.validate(model)),
+            "build_ir": best_of(repeat, lambda: build_ir(model)),
+            "pipeline": best_of(
+                repeat, lambda: pipeline.run_all(queries)
+            ),
+            "render": best_of(
+                repeat,
+                lambda: [FactQueryRenderer(q).render() for q in compiled],
+            ),
+        }
+
+    return {stage: facts / seconds for stage, seconds in timings.items()}
+
+
+def load_history(path: Path) -> List[dict]:
+    if not path.exists():
+        return []
+    return [
+        json.loads(line)
+        for line in path.read_text().splitlines()
+        if line.strip()
+    ]
+
+
+def find_regressions(
+    run: dict,
+    history: List[dict],
+    threshold: float,
+    window: int,
+) -> List[str]:
+    """
+    Compares each stage against the median throughput of the last
+    `window` runs at the same size and model shape.
+    """
+    comparable = [
+        entry for entry in history
+        if entry.get("dimensions") == run["dimensions"]
+        and entry.get("measures") == run["measures"]
+    ]
+
+    regressions = []
+    for size, stages in run["results"].items():
+        previous = [
+            entry["results"][size]
+            for entry in comparable
+            if size in entry.get("results", {})
+        ][-window:]
+
+        for stage, throughput in stages.items():
+            samples = [p[stage] for p in previous if stage in p]
+            if not samples:
+                continue
+
+            baseline = statistics.median(samples)
+            if throughput < baseline * (1 - threshold):
+                regressions.append(
+                    f"{stage} @ {size} facts: {throughput:,.0f} facts/s "
+                    f"vs median {baseline:,.0f} facts/s "
+                    f"({throughput / baseline - 1:+.1%})"
+                )
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Measure validator and compiler throughput at several model sizes."
+    )
+    parser.add_argument(
+        "--sizes",
+        default=DEFAULT_SIZES,
+        help=f"comma-separated fact counts (default: {DEFAULT_SIZES})",
+    )
+    parser.add_argument("--dimensions", type=int, default=50)
+    parser.add_argument("--measures", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--history", type=Path, default=HISTORY_PATH)
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="exit non-zero when a stage regresses beyond --threshold",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.25,
+        help="allowed throughput drop vs history median (default: 0.25)",
+    )
+    parser.add_argument(
+        "--window",
+        type=int,
+        default=5,
+        help="number of previous runs forming the baseline (default: 5)",
+    )
+    parser.add_argument(
+        "--no-record",
+        action="store_true",
+        help="do not append this run to the history file",
+    )
+    args = parser.parse_args()
+
+    sizes = [int(size) for size in args.sizes.split(",")]
+
+    results = {}
+    print(f"{'facts':>7}  " + "  ".join(f"{stage:>12}" for stage in STAGES))
+    for facts in sizes:
+        throughput = measure_size(
+            facts, args.dimensions, args.measures, args.repeat
+        )
+        results[str(facts)] = throughput
+        print(
+            f"{facts:>7}  "
+            + "  ".join(f"{throughput[stage]:>12,.0f}" for stage in STAGES)
+        )
+    print(f"(facts per second, best of {args.repeat})")
+
+    run = {
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "dimensions": args.dimensions,
+        "measures": args.measures,
+        "results": results,
+    }
+
+    history = load_history(args.history)
+    regressions = find_regressions(run, history, args.threshold, args.window)
+
+    if not args.no_record:
+        args.history.parent.mkdir(parents=True, exist_ok=True)
+        with args.history.open("a") as f:
+            f.write(json.dumps(run, sort_keys=True) + "\n")
+
+    if regressions:
+        print("\nThroughput regressions:")
+        for regression in regressions:
+            print(f"  {regression}")
+        if args.check:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
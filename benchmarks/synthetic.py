@@ -0,0 +1,205 @@
+import csv
+import datetime
+import random
+from pathlib import Path
+
+import yaml
+
+
+def synthetic_model(
+    facts: int,
+    dimensions: int,
+    measures: int,
+    foreign_keys_per_fact: int = 4,
+) -> dict:
+    """
+    Builds a deterministic semantic model dict of the requested size.
+
+    Fact i references `foreign_keys_per_fact` dimensions, chosen
+    round-robin, and declares `measures` measures.
+    """
+    dims = {
+        f"dim_{d:05d}": {
+            "key": f"dim_{d:05d}_id",
+            "grain": [f"dim_{d:05d}_id"],
+            "attributes": [f"dim_{d:05d}_name"],
+        }
+        for d in range(dimensions)
+    }
+    dim_names = list(dims)
+    fk_count = min(foreign_keys_per_fact, dimensions)
+
+    facts_def = {}
+    for f in range(facts):
+        referenced = [
+            dim_names[(f + offset) % dimensions]
+            for offset in range(fk_count)
+        ]
+        facts_def[f"fact_{f:05d}"] = {
+            "grain": [f"fact_{f:05d}_line_id"],
+            "measures": [f"measure_{m:03d}" for m in range(measures)],
+            "foreign_keys": [dims[name]["key"] for name in referenced],
+            "attributes": [],
+        }
+
+    return {
+        "facts": facts_def,
+        "dimensions": dims,
+    }
+
+
+def fact_view_sql(fact_name: str, fact_def: dict) -> str:
+    """
+    Hand-written-style fact view satisfying the validator contract.
+    """
+    keys = fact_def["grain"] + fact_def["foreign_keys"]
+    projections = [f"    src.{column} AS {column}" for column in keys]
+    projections += [
+        f"    SUM(src.{measure}) AS {measure}"
+        for measure in fact_def["measures"]
+    ]
+    group_by = ",\n".join(f"    src.{column}" for column in keys)
+
+    return (
+        f"CREATE OR REPLACE VIEW {fact_name} AS\n"
+        f"SELECT\n"
+        + ",\n".join(projections)
+        + f"\nFROM {fact_name}_source src\n"
+        f"GROUP BY\n{group_by};\n"
+    )
+
+
+def dimension_view_sql(dim_name: str, dim_def: dict) -> str:
+    columns = [dim_def["key"]] + dim_def.get("attributes", [])
+    projections = ",\n".join(f"    src.{column} AS {column}" for column in columns)
+
+    return (
+        f"CREATE OR REPLACE VIEW {dim_name} AS\n"
+        f"SELECT DISTINCT\n{projections}\n"
+        f"FROM {dim_name}_source src\n"
+        f"WHERE src.{dim_def['key']} IS NOT NULL;\n"
+    )
+
+
+def schema_ddl(model: dict) -> str:
+    """
+    MySQL DDL of the source tables read by the synthetic views.
+    """
+    tables = []
+    for fact_name, fact_def in model["facts"].items():
+        columns = [
+            f"  `{column}` varchar(20) DEFAULT NULL"
+            for column in fact_def["grain"] + fact_def["foreign_keys"]
+        ]
+        columns += [
+            f"  `{measure}` decimal(12,2) DEFAULT NULL"
+            for measure in fact_def["measures"]
+        ]
+        tables.append((f"{fact_name}_source", columns))
+
+    for dim_name, dim_def in model["dimensions"].items():
+        columns = [
+            f"  `{column}` varchar(50) DEFAULT NULL"
+            for column in [dim_def["key"]] + dim_def.get("attributes", [])
+        ]
+        tables.append((f"{dim_name}_source", columns))
+
+    return "".join(
+        f"CREATE TABLE `{table}` (\n" + ",\n".join(columns) + "\n) ENGINE=InnoDB;\n\n"
+        for table, columns in tables
+    )
+
+
+def write_synthetic_project(root: Path, model: dict) -> dict:
+    """
+    Writes a model contract, the source schema and matching sql/facts
+    and sql/dimensions views under `root`, mirroring the repository layout.
+
+    Returns the paths used: model, schema, fact_sql_dir, dim_sql_dir.
+    """
+    root = Path(root)
+    model_path = root / "semantic" / "model.contract.yml"
+    schema_path = root / "schema" / "raw" / "mysql.sql"
+    fact_dir = root / "sql" / "facts"
+    dim_dir = root / "sql" / "dimensions"
+
+    for directory in (model_path.parent, schema_path.parent, fact_dir, dim_dir):
+        directory.mkdir(parents=True, exist_ok=True)
+
+    model_path.write_text(yaml.safe_dump(model, sort_keys=False))
+    schema_path.write_text(schema_ddl(model))
+
+    for fact_name, fact_def in model["facts"].items():
+        (fact_dir / f"{fact_name}.sql").write_text(
+            fact_view_sql(fact_name, fact_def)
+        )
+
+    for dim_name, dim_def in model["dimensions"].items():
+        (dim_dir / f"{dim_name}.sql").write_text(
+            dimension_view_sql(dim_name, dim_def)
+        )
+
+    return {
+        "model": str(model_path),
+        "schema": str(schema_path),
+        "fact_sql_dir": str(fact_dir),
+        "dim_sql_dir": str(dim_dir),
+    }
+
+
+SALES_COLUMNS = (
+    "OrderID",
+    "CustomerID",
+    "CustomerName",
+    "Region",
+    "ProductID",
+    "ProductName",
+    "Quantity",
+    "UnitPrice",
+    "TotalAmount",
+    "OrderDate",
+    "SalesChannel",
+)
+
+
+def write_sales_extract(path: Path, rows: int, seed: int = 42) -> None:
+    """
+    Writes a deterministic CSV extract of `sales_data` (schema/raw) with
+    a header row. Names contain commas and quotes, and about 2 % of the
+    fields are NULL, written as an empty field, NULL or \\N.
+    """
+    rng = random.Random(seed)
+    nulls = ("", "NULL", "\\N")
+    regions = ("North", "South", "East", "West")
+    channels = ("Online", "Retail", "Partner")
+    customers = max(1, rows // 50)
+    products = max(1, min(500, rows // 20))
+
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(SALES_COLUMNS)
+        for i in range(rows):
+            customer = rng.randrange(customers)
+            product = rng.randrange(products)
+            quantity = rng.randint(1, 20)
+            unit_price = round(1 + (product * 7.31) % 500, 2)
+            order_date = datetime.date(2023, 1, 1) + datetime.timedelta(
+                days=rng.randrange(730)
+            )
+            row = [
+                f"O{i // 3:08d}",
+                f"C{customer:07d}",
+                f'Customer {customer}, "{regions[customer % 4]}"',
+                regions[customer % len(regions)],
+                f"P{product:07d}",
+                f"Product {product}",
+                str(quantity),
+                f"{unit_price:.2f}",
+                f"{quantity * unit_price:.2f}",
+                order_date.isoformat(),
+                channels[(i + product) % len(channels)],
+            ]
+            writer.writerow(
+                rng.choice(nulls) if rng.random() < 0.02 else value
+                for value in row
+            )
@@ -1,39 +1,235 @@
+import sys
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from compiler.runtime.immutable import FrozenDict
 from compiler.runtime.ir import (
     SemanticModelIR,
+    SemanticIndex,
     Fact,
     Measure,
+    Calendar,
     Dimension,
+    Materialization,
+    Partitioning,
+    Rollup,
+    StorageModeThresholds,
+    SurrogateKey,
+    ROLE_GRAIN,
+    ROLE_FOREIGN_KEY,
+    ROLE_MEASURE,
+    ROLE_KEY,
+    ROLE_ATTRIBUTE,
 )
 
 
+def _names(values: Iterable[str]) -> Tuple[str, ...]:
+    # Interned names are shared across every fact/dimension using them
+    return tuple(sys.intern(v) for v in values)
+
+
 def build_ir(model: dict) -> SemanticModelIR:
     """
     Build Intermediate Representation (IR) from a validated semantic model.
     Assumes the model has already passed semantic validation.
     """
 
+    measures_ir: Dict[str, Measure] = {}
+
+    def measure(name: str) -> Measure:
+        name = sys.intern(name)
+        if name not in measures_ir:
+            measures_ir[name] = Measure(name=name)
+        return measures_ir[name]
+
     facts_ir = {}
     for fact_name, fact_def in model.get("facts", {}).items():
         facts_ir[fact_name] = Fact(
-            name=fact_name,
-            grain=fact_def.get("grain", []),
-            measures=[
-                Measure(name=m)
+            name=sys.intern(fact_name),
+            grain=_names(fact_def.get("grain", [])),
+            measures=tuple(
+                measure(m)
                 for m in fact_def.get("measures", [])
-            ],
-            foreign_keys=fact_def.get("foreign_keys", []),
+            ),
+            foreign_keys=_names(fact_def.get("foreign_keys", [])),
+            partitioning=build_partitioning(fact_def.get("incremental_refresh")),
         )
 
     dimensions_ir = {}
     for dim_name, dim_def in model.get("dimensions", {}).items():
         dimensions_ir[dim_name] = Dimension(
-            name=dim_name,
-            key=dim_def.get("key"),
-            grain=dim_def.get("grain", []),
-            attributes=dim_def.get("attributes", []),
+            name=sys.intern(dim_name),
+            key=sys.intern(dim_def.get("key")),
+            grain=_names(dim_def.get("grain", [])),
+            attributes=_names(dim_def.get("attributes", [])),
+            materialization=build_materialization(
+                dim_name, dim_def.get("materialization")
+            ),
+            calendar=build_calendar(dim_def.get("calendar")),
+            surrogate_key=build_surrogate_key(
+                dim_name, dim_def.get("key"), dim_def.get("surrogate_key")
+            ),
+        )
+
+    rollups_ir = {}
+    for rollup_name, rollup_def in (model.get("rollups") or {}).items():
+        fact = facts_ir[rollup_def["fact"]]
+        grain = _names(rollup_def.get("grain", []))
+        measure_names = rollup_def.get("measures")
+        if measure_names is None:
+            measure_names = [m.name for m in fact.measures]
+
+        # Coarser rollups are tried first by Power BI
+        precedence = rollup_def.get(
+            "precedence",
+            len(fact.grain) + len(fact.foreign_keys) - len(grain),
+        )
+
+        rollups_ir[rollup_name] = Rollup(
+            name=sys.intern(rollup_name),
+            fact=fact.name,
+            grain=grain,
+            measures=tuple(measure(m) for m in measure_names),
+            precedence=precedence,
         )
 
     return SemanticModelIR(
-        facts=facts_ir,
-        dimensions=dimensions_ir,
-    )
\ No newline at end of file
+        facts=FrozenDict(facts_ir),
+        dimensions=FrozenDict(dimensions_ir),
+        rollups=FrozenDict(rollups_ir),
+        index=build_index(facts_ir, dimensions_ir, rollups_ir),
+        storage_modes=build_storage_modes(model.get("storage_modes")),
+    )
+
+
+def build_partitioning(refresh_def: Optional[dict]) -> Optional[Partitioning]:
+    if not refresh_def:
+        return None
+
+    def iso_date(value) -> Optional[str]:
+        # YAML parses unquoted dates into datetime.date
+        return None if value is None else str(value)
+
+    return Partitioning(
+        column=sys.intern(refresh_def["partition_column"]),
+        granularity=refresh_def.get("granularity", "month"),
+        start=iso_date(refresh_def.get("start")),
+        end=iso_date(refresh_def.get("end")),
+        archive_periods=refresh_def.get("archive_periods"),
+        refresh_periods=refresh_def.get("refresh_periods", 1),
+    )
+
+
+def build_materialization(
+    dim_name: str,
+    materialization_def: Optional[dict],
+) -> Optional[Materialization]:
+    if materialization_def is None:
+        return None
+
+    watermark = materialization_def.get("watermark")
+    return Materialization(
+        table=sys.intern(
+            materialization_def.get("table", f"{dim_name}__materialized")
+        ),
+        watermark=sys.intern(watermark) if watermark else None,
+        lookback_days=materialization_def.get("lookback_days", 0),
+    )
+
+
+def build_calendar(calendar_def: Optional[dict]) -> Optional[Calendar]:
+    if not calendar_def:
+        return None
+
+    # YAML parses unquoted dates into datetime.date
+    return Calendar(
+        start=str(calendar_def["start"]),
+        end=str(calendar_def["end"]),
+    )
+
+
+def build_surrogate_key(
+    dim_name: str,
+    key: str,
+    surrogate_key_def,
+) -> Optional[SurrogateKey]:
+    # `surrogate_key: true` accepts the default names
+    if not surrogate_key_def:
+        return None
+    if surrogate_key_def is True:
+        surrogate_key_def = {}
+
+    # customer_id → customer_sk
+    stem = key[:-len("_id")] if key.endswith("_id") else key
+    return SurrogateKey(
+        table=sys.intern(surrogate_key_def.get("table", f"{dim_name}__key_map")),
+        column=sys.intern(surrogate_key_def.get("column", f"{stem}_sk")),
+    )
+
+
+def build_storage_modes(storage_modes_def: Optional[dict]) -> StorageModeThresholds:
+    if not storage_modes_def:
+        return StorageModeThresholds()
+
+    return StorageModeThresholds(
+        fact_import_max_rows=storage_modes_def.get("fact_import_max_rows"),
+        dimension_import_max_rows=storage_modes_def.get("dimension_import_max_rows"),
+    )
+
+
+def build_index(
+    facts: Dict[str, Fact],
+    dimensions: Dict[str, Dimension],
+    rollups: Optional[Dict[str, Rollup]] = None,
+) -> SemanticIndex:
+    """
+    Derives the lookup tables of SemanticIndex in a single pass
+    over facts, dimensions and rollups.
+    """
+
+    dimension_by_key: Dict[str, str] = {}
+    column_roles: Dict[str, Dict[str, str]] = {}
+
+    for dim_name, dim in dimensions.items():
+        # First definition wins; duplicate keys are rejected by validation
+        dimension_by_key.setdefault(dim.key, dim_name)
+
+        roles = {column: ROLE_ATTRIBUTE for column in dim.attributes}
+        roles[dim.key] = ROLE_KEY
+        column_roles[dim_name] = roles
+
+    facts_by_dimension: Dict[str, List[str]] = {
+        dim_name: [] for dim_name in dimensions
+    }
+
+    for fact_name, fact in facts.items():
+        roles = {}
+        for measure in fact.measures:
+            roles[measure.name] = ROLE_MEASURE
+        for fk in fact.foreign_keys:
+            roles[fk] = ROLE_FOREIGN_KEY
+            dim_name = dimension_by_key.get(fk)
+            if dim_name is not None:
+                facts_by_dimension[dim_name].append(fact_name)
+        for column in fact.grain:
+            roles[column] = ROLE_GRAIN
+        column_roles[fact_name] = roles
+
+    rollups_by_fact: Dict[str, List[str]] = {}
+    for rollup_name, rollup in (rollups or {}).items():
+        rollups_by_fact.setdefault(rollup.fact, []).append(rollup_name)
+
+    return SemanticIndex(
+        dimension_by_key=FrozenDict(dimension_by_key),
+        facts_by_dimension=FrozenDict({
+            dim_name: tuple(fact_names)
+            for dim_name, fact_names in facts_by_dimension.items()
+        }),
+        column_roles=FrozenDict({
+            table: FrozenDict(roles)
+            for table, roles in column_roles.items()
+        }),
+        rollups_by_fact=FrozenDict({
+            fact_name: tuple(rollup_names)
+            for fact_name, rollup_names in rollups_by_fact.items()
+        }),
+    )
@@ -8,10 +8,7 @@ class BindForeignKeysPass(CompilerPass):
     """
 
     def run(self, ir: SemanticModelIR) -> SemanticModelIR:
-        dimension_keys = {
-            dim.key: dim_name
-            for dim_name, dim in ir.dimensions.items()
-        }
+        dimension_keys = ir.index.dimension_by_key
 
         for fact_name, fact in ir.facts.items():
             for fk in fact.foreign_keys:
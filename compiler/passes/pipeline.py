@@ -1,5 +1,6 @@
-from typing import List
+from typing import List, Optional
 from compiler.runtime.ir import SemanticModelIR
+from compiler.runtime.instrumentation import PipelineHooks, run_passes
 from compiler.passes.base import CompilerPass
 
 
@@ -8,11 +9,16 @@ class CompilerPipeline:
     Sequential compiler pipeline executing registered passes.
     """
 
-    def __init__(self, passes: List[CompilerPass]):
+    def __init__(
+        self,
+        passes: List[CompilerPass],
+        hooks: Optional[List[PipelineHooks]] = None,
+    ):
         self._passes = passes
+        self._hooks = list(hooks or [])
+
+    def add_hook(self, hook: PipelineHooks) -> None:
+        self._hooks.append(hook)
 
     def run(self, ir: SemanticModelIR) -> SemanticModelIR:
-        current_ir = ir
-        for compiler_pass in self._passes:
-            current_ir = compiler_pass.run(current_ir)
-        return current_ir
\ No newline at end of file
+        return run_passes(self._passes, ir, self._hooks)
@@ -0,0 +1,62 @@
+from dataclasses import dataclass, fields
+
+
+class FrozenDict(dict):
+    """
+    Read-only, hashable dict for IR mappings.
+
+    Unlike MappingProxyType it is picklable, so IR holding it can be
+    shipped to worker processes.
+    """
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError(f"{type(self).__name__} is immutable")
+
+    __setitem__ = __delitem__ = __ior__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+
+    def __hash__(self) -> int:
+        return hash(frozenset(self.items()))
+
+    def __reduce__(self):
+        return (type(self), (dict(self),))
+
+
+def frozen_slots(cls):
+    """
+    Equivalent of @dataclass(frozen=True, slots=True), which requires
+    Python 3.10. Instances carry no per-instance __dict__.
+    """
+    cls = dataclass(frozen=True)(cls)
+
+    inherited = set()
+    for base in cls.__mro__[1:]:
+        inherited.update(getattr(base, "__slots__", ()))
+
+    field_names = tuple(f.name for f in fields(cls))
+
+    namespace = dict(cls.__dict__)
+    namespace["__slots__"] = tuple(
+        name for name in field_names if name not in inherited
+    )
+    for name in field_names:
+        # Defaults live in the generated __init__; class attributes
+        # would conflict with the slot descriptors.
+        namespace.pop(name, None)
+    namespace.pop("__dict__", None)
+    namespace.pop("__weakref__", None)
+
+    # Frozen instances cannot be restored through setattr
+    def __getstate__(self):
+        return tuple(getattr(self, name) for name in field_names)
+
+    def __setstate__(self, state):
+        for name, value in zip(field_names, state):
+            object.__setattr__(self, name, value)
+
+    namespace["__getstate__"] = __getstate__
+    namespace["__setstate__"] = __setstate__
+
+    slotted = type(cls)(cls.__name__, cls.__bases__, namespace)
+    slotted.__qualname__ = cls.__qualname__
+    return slotted
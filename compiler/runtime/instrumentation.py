@@ -0,0 +1,187 @@
+import cProfile
+import json
+import os
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+
+class PipelineHooks:
+    """
+    Observer interface for compiler pipelines.
+
+    Both CompilerPipeline and SqlCompilerPipeline call `before_pass`
+    and `after_pass` around every pass. Hooks must not modify the IR.
+    """
+
+    def before_pass(self, compiler_pass: Any, ir: Any) -> None:
+        pass
+
+    def after_pass(self, compiler_pass: Any, ir: Any, result: Any) -> None:
+        pass
+
+
+def run_passes(
+    passes: List[Any],
+    ir: Any,
+    hooks: List[PipelineHooks],
+    batch: bool = False,
+) -> Any:
+    """
+    Shared pass loop of the compiler pipelines.
+
+    With `batch`, `ir` is a list of queries and each pass runs over the
+    whole list (via `run_batch`) before the next pass starts.
+    """
+    current = ir
+    if not hooks:
+        for compiler_pass in passes:
+            current = (
+                compiler_pass.run_batch(current) if batch
+                else compiler_pass.run(current)
+            )
+        return current
+
+    for compiler_pass in passes:
+        for hook in hooks:
+            hook.before_pass(compiler_pass, current)
+        result = (
+            compiler_pass.run_batch(current) if batch
+            else compiler_pass.run(current)
+        )
+        for hook in reversed(hooks):
+            hook.after_pass(compiler_pass, current, result)
+        current = result
+    return current
+
+
+class PassTracer(PipelineHooks):
+    """
+    Records per-pass wall time and allocations, optionally under cProfile,
+    and exports them in Chrome trace format (chrome://tracing, Perfetto).
+
+    Allocations are measured with tracemalloc (bytes allocated and peak
+    during the pass) and sys.getallocatedblocks (net allocated blocks).
+    """
+
+    def __init__(self, track_allocations: bool = True, profile: bool = False):
+        self.track_allocations = track_allocations
+        self.profiler = cProfile.Profile() if profile else None
+        self.events: List[Dict[str, Any]] = []
+        self._origin = time.perf_counter()
+        self._stack: List[list] = []
+        self._started_tracemalloc = False
+
+        if self.track_allocations and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+
+    # ---------- hooks ----------
+
+    def before_pass(self, compiler_pass: Any, ir: Any) -> None:
+        self._begin()
+
+    def after_pass(self, compiler_pass: Any, ir: Any, result: Any) -> None:
+        args = {}
+        if isinstance(ir, list):
+            args["batch_size"] = len(ir)
+        else:
+            subject = getattr(ir, "from_table", None)
+            if subject is not None:
+                args["query"] = subject
+        self._end(type(compiler_pass).__name__, "pass", args)
+
+    @contextmanager
+    def span(self, name: str, category: str = "phase") -> Iterator[None]:
+        """
+        Traces a coordinator phase that is not a pass (load, validate, ...).
+        """
+        self._begin()
+        try:
+            yield
+        finally:
+            self._end(name, category, {})
+
+    # ---------- recording ----------
+
+    def _begin(self) -> None:
+        if self.profiler is not None and not self._stack:
+            self.profiler.enable()
+
+        traced = 0
+        if self.track_allocations:
+            traced, peak = tracemalloc.get_traced_memory()
+            if self._stack:
+                # Keep the enclosing span's peak before resetting it
+                self._stack[-1][3] = max(self._stack[-1][3], peak)
+            tracemalloc.reset_peak()
+
+        # [start time, allocated blocks, traced bytes, peak of nested spans]
+        self._stack.append(
+            [time.perf_counter(), sys.getallocatedblocks(), traced, traced]
+        )
+
+    def _end(self, name: str, category: str, args: Dict[str, Any]) -> None:
+        ended = time.perf_counter()
+        started, blocks, traced, nested_peak = self._stack.pop()
+
+        if self.profiler is not None and not self._stack:
+            self.profiler.disable()
+
+        args["allocated_blocks"] = sys.getallocatedblocks() - blocks
+        if self.track_allocations:
+            current, peak = tracemalloc.get_traced_memory()
+            peak = max(peak, nested_peak)
+            args["allocated_bytes"] = current - traced
+            args["peak_bytes"] = peak - traced
+            if self._stack:
+                self._stack[-1][3] = max(self._stack[-1][3], peak)
+
+        self.events.append({
+            "name": name,
+            "cat": category,
+            "ph": "X",
+            "ts": round((started - self._origin) * 1e6, 3),
+            "dur": round((ended - started) * 1e6, 3),
+            "pid": os.getpid(),
+            "tid": 0,
+            "args": args,
+        })
+
+    # ---------- export ----------
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """
+        Total wall time (ms) and call count per pass.
+        """
+        totals: Dict[str, Dict[str, float]] = {}
+        for event in self.events:
+            if event["cat"] != "pass":
+                continue
+            entry = totals.setdefault(event["name"], {"calls": 0, "ms": 0.0})
+            entry["calls"] += 1
+            entry["ms"] += event["dur"] / 1000
+        return totals
+
+    def write_chrome_trace(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        trace = {
+            "traceEvents": sorted(self.events, key=lambda e: e["ts"]),
+            "displayTimeUnit": "ms",
+        }
+        path.write_text(json.dumps(trace, indent=1) + "\n")
+
+    def write_profile(self, path: Path) -> Optional[Path]:
+        if self.profiler is None:
+            return None
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.profiler.dump_stats(str(path))
+        return path
+
+    def close(self) -> None:
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
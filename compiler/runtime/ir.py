@@ -1,31 +1,161 @@
-from dataclasses import dataclass
-from typing import List, Dict
+from typing import Mapping, Optional, Tuple
+
+from compiler.runtime.immutable import frozen_slots
 
 # ---------- Dimensions ----------
 
-@dataclass(frozen=True)
+@frozen_slots
+class Materialization:
+    """
+    Materialization of a dimension view into a keyed table.
+
+    table:         name of the materialized table
+    watermark:     source column bounding incremental loads to new rows;
+                   None reloads the whole source on every run
+    lookback_days: days before the stored watermark that each load
+                   re-reads, for rows arriving with an older value
+    """
+    table: str
+    watermark: Optional[str] = None
+    lookback_days: int = 0
+
+@frozen_slots
+class Calendar:
+    """
+    Date dimension generated as one row per day, end exclusive
+    (ISO dates). Replaces a hand-written dimension view.
+    """
+    start: str
+    end: str
+
+@frozen_slots
+class SurrogateKey:
+    """
+    Dense integer key assigned to every value of a dimension key
+    through a persistent key-map table.
+
+    table:  key-map table (natural key → surrogate key)
+    column: surrogate key column, carried by facts instead of the
+            natural key
+    """
+    table: str
+    column: str
+
+@frozen_slots
 class Dimension:
     name: str
     key: str
-    grain: List[str]
-    attributes: List[str]
+    grain: Tuple[str, ...]
+    attributes: Tuple[str, ...]
+    materialization: Optional[Materialization] = None
+    calendar: Optional[Calendar] = None
+    surrogate_key: Optional[SurrogateKey] = None
 
 # ---------- Facts ----------
 
-@dataclass(frozen=True)
+@frozen_slots
 class Measure:
     name: str
 
-@dataclass(frozen=True)
+@frozen_slots
+class Partitioning:
+    """
+    Incremental-refresh partitioning of a fact by a date column.
+
+    granularity: day, month, quarter or year
+    start / end: ISO dates bounding per-period partitions (end exclusive);
+                 None when no per-period partitions are generated
+    archive_periods / refresh_periods: periods kept / refreshed, counted
+                 back from the refresh date; no refresh policy without
+                 archive_periods and start / end
+    """
+    column: str
+    granularity: str
+    start: Optional[str] = None
+    end: Optional[str] = None
+    archive_periods: Optional[int] = None
+    refresh_periods: int = 1
+
+@frozen_slots
 class Fact:
     name: str
-    grain: List[str]
-    measures: List[Measure]
-    foreign_keys: List[str]
+    grain: Tuple[str, ...]
+    measures: Tuple[Measure, ...]
+    foreign_keys: Tuple[str, ...]
+    partitioning: Optional[Partitioning] = None
+
+# ---------- Rollups ----------
+
+@frozen_slots
+class Rollup:
+    """
+    Pre-aggregated summary of `fact` at a coarser grain.
+
+    grain:      subset of the fact's grain and foreign keys
+    measures:   fact measures carried into the rollup
+    precedence: Power BI aggregation precedence (higher is tried first)
+    """
+    name: str
+    fact: str
+    grain: Tuple[str, ...]
+    measures: Tuple[Measure, ...]
+    precedence: int
+
+# ---------- Storage modes ----------
+
+@frozen_slots
+class StorageModeThresholds:
+    """
+    Largest row counts imported into the Power BI model. Larger tables
+    are queried in the source (DirectQuery); None imports every table
+    of that kind.
+
+    fact_import_max_rows:      facts and the rollups derived from them
+    dimension_import_max_rows: dimensions
+    """
+    fact_import_max_rows: Optional[int] = None
+    dimension_import_max_rows: Optional[int] = None
+
+# ---------- Indexes ----------
+
+ROLE_GRAIN = "grain"
+ROLE_FOREIGN_KEY = "foreign_key"
+ROLE_MEASURE = "measure"
+ROLE_KEY = "key"
+ROLE_ATTRIBUTE = "attribute"
+
+@frozen_slots
+class SemanticIndex:
+    """
+    Read-only lookup tables derived once from facts and dimensions.
+
+    dimension_by_key:   dimension key column → dimension name
+    facts_by_dimension: dimension name → facts referencing it
+    column_roles:       table name → column → role
+    rollups_by_fact:    fact name → rollups derived from it
+    """
+    dimension_by_key: Mapping[str, str]
+    facts_by_dimension: Mapping[str, Tuple[str, ...]]
+    column_roles: Mapping[str, Mapping[str, str]]
+    rollups_by_fact: Mapping[str, Tuple[str, ...]]
 
 # ---------- Model ----------
 
-@dataclass(frozen=True)
+@frozen_slots
 class SemanticModelIR:
-    facts: Dict[str, Fact]
-    dimensions: Dict[str, Dimension]
\ No newline at end of file
+    facts: Mapping[str, Fact]
+    dimensions: Mapping[str, Dimension]
+    rollups: Mapping[str, Rollup]
+    index: SemanticIndex
+    storage_modes: StorageModeThresholds = StorageModeThresholds()
+
+    def dimension_for_key(self, key: str) -> Optional[Dimension]:
+        dim_name = self.index.dimension_by_key.get(key)
+        return self.dimensions[dim_name] if dim_name is not None else None
+
+    def rollups_for(self, fact_name: str) -> Tuple[Rollup, ...]:
+        return tuple(
+            self.rollups[rollup_name]
+            for rollup_name in self.index.rollups_by_fact.get(fact_name, ())
+        )
+
@@ -0,0 +1,288 @@
+import hashlib
+from typing import Dict, List, Optional, Tuple
+
+from compiler.runtime.immutable import frozen_slots
+from compiler.sql.runtime.ir import SqlFactQuery, SqlKeyMap, SqlMaterialization
+from validation.schema_catalog import SchemaCatalog
+from validation.sql_index import SqlView
+
+
+# ---------- ACCESS PATTERNS ----------
+
+ACCESS_GROUP_BY = "GROUP BY"
+ACCESS_DISTINCT = "DISTINCT"
+ACCESS_JOIN = "JOIN"
+ACCESS_RANGE = "RANGE"
+
+# MySQL identifier length limit
+MAX_INDEX_NAME = 64
+
+
+@frozen_slots
+class IndexUsage:
+    """
+    A view or generated query whose access pattern an index serves.
+    """
+    source: str
+    access: str
+
+
+@frozen_slots
+class IndexRecommendation:
+    """
+    A secondary index on a base table.
+
+    columns:  key columns, in index order
+    covering: trailing columns that let the index answer the query alone
+    """
+    table: str
+    columns: Tuple[str, ...]
+    covering: Tuple[str, ...]
+    usages: Tuple[IndexUsage, ...]
+
+    @property
+    def all_columns(self) -> Tuple[str, ...]:
+        return self.columns + self.covering
+
+    @property
+    def name(self) -> str:
+        name = "ix_" + "_".join(
+            part.lower() for part in (self.table,) + self.all_columns
+        )
+        if len(name) <= MAX_INDEX_NAME:
+            return name
+        digest = hashlib.sha256(name.encode("utf-8")).hexdigest()[:8]
+        return f"{name[:MAX_INDEX_NAME - 9]}_{digest}"
+
+
+# ---------- ADVISOR ----------
+
+class IndexAdvisor:
+    """
+    Derives MySQL index recommendations from hand-written views and
+    compiled queries.
+
+    Access patterns:
+    - GROUP BY columns (covering the aggregated columns)
+    - DISTINCT projections of dimension views
+    - join `on` columns of the joined table
+    - incremental-refresh range columns
+    - watermark columns of materialized dimension loads
+    - natural key reads of surrogate key map loads
+
+    View columns are traced through single-table views down to their
+    base table column in the schema catalog. Joins probe the joined
+    table: key maps are probed through their own unique natural key,
+    so they need no index, and a GROUP BY on joined columns (such as
+    surrogate keys) cannot be served by an index of the scanned table.
+    Candidates whose columns are a leftmost prefix of another index
+    (and add no covered column) are folded into it.
+    """
+
+    def __init__(self, catalog: SchemaCatalog):
+        self.catalog = catalog
+        self.views: Dict[str, SqlView] = {}
+        self._candidates: Dict[Tuple[str, Tuple[str, ...], Tuple[str, ...]], List[IndexUsage]] = {}
+        self._queries: List[Tuple[str, SqlFactQuery, Optional[str]]] = []
+
+    # ---------- inputs ----------
+
+    def add_view(self, source: str, view: SqlView) -> None:
+        self.views[view.name] = view
+
+        table = self._base_table(view)
+        if table is None:
+            return
+
+        if view.group_by:
+            key = []
+            for projection in view.projections:
+                if projection.aggregate is None and view.is_grouped(projection.alias):
+                    key.extend(projection.columns)
+            key.extend(sorted(set(view.group_by) - set(key)))
+            covering = [
+                column
+                for projection in view.projections
+                if projection.aggregate is not None
+                for column in projection.columns
+            ]
+            self._add(table, key, covering, IndexUsage(source, ACCESS_GROUP_BY))
+
+        elif view.distinct:
+            key = [
+                column
+                for projection in view.projections
+                for column in projection.columns
+            ]
+            self._add(table, key, [], IndexUsage(source, ACCESS_DISTINCT))
+
+    def add_query(
+        self,
+        source: str,
+        query: SqlFactQuery,
+        range_column: Optional[str] = None,
+    ) -> None:
+        """
+        Queries are resolved lazily, so views may be added afterwards.
+        """
+        self._queries.append((source, query, range_column))
+
+    def add_materialization(
+        self,
+        source: str,
+        materialization: SqlMaterialization,
+    ) -> None:
+        if materialization.watermark is not None:
+            self._add(
+                materialization.source_table,
+                [materialization.watermark],
+                [],
+                IndexUsage(source, ACCESS_RANGE),
+            )
+
+    def add_key_map(self, source: str, key_map: SqlKeyMap) -> None:
+        # The anti-join probes the key map's own unique natural key
+        self._add(
+            key_map.source_table,
+            [key_map.key_expression.rpartition(".")[2]],
+            [],
+            IndexUsage(source, ACCESS_DISTINCT),
+        )
+
+    # ---------- resolution ----------
+
+    def _base_table(self, view: SqlView) -> Optional[str]:
+        if len(view.tables) != 1 or self.catalog.table(view.tables[0]) is None:
+            return None
+        return view.tables[0]
+
+    def _resolve(self, relation: str, column: str) -> Optional[Tuple[str, str]]:
+        """
+        (base table, base column) read by `relation`.`column`.
+        """
+        relation, column = relation.lower(), column.lower()
+        if self.catalog.table(relation) is not None:
+            return relation, column
+
+        view = self.views.get(relation)
+        if view is None:
+            return None
+        table = self._base_table(view)
+        projection = view.projection(column)
+        if table is None or projection is None or len(projection.columns) != 1:
+            return None
+        return table, projection.columns[0]
+
+    def _resolve_all(self, relation: str, columns) -> Optional[Tuple[str, List[str]]]:
+        resolved = [self._resolve(relation, column) for column in columns]
+        if not resolved or None in resolved:
+            return None
+        tables = {table for table, _ in resolved}
+        if len(tables) != 1:
+            return None
+        return tables.pop(), [column for _, column in resolved]
+
+    def _add_query(
+        self,
+        source: str,
+        query: SqlFactQuery,
+        range_column: Optional[str],
+    ) -> None:
+        relation = query.from_table
+
+        group_by = []
+        for column in query.group_by:
+            table, _, name = column.rpartition(".")
+            if table and table != relation:
+                # Grouped by a joined table's column
+                group_by = []
+                break
+            group_by.append(name)
+
+        grouped = self._resolve_all(relation, group_by)
+        if grouped is not None:
+            table, key = grouped
+            measures = self._resolve_all(relation, query.aggregations)
+            covering = measures[1] if measures and measures[0] == table else []
+            self._add(table, key, covering, IndexUsage(source, ACCESS_GROUP_BY))
+
+        for join in query.joins:
+            for side in join.on.split("="):
+                side_relation, _, column = side.strip().partition(".")
+                if side_relation != join.table:
+                    continue
+                resolved = self._resolve(side_relation, column)
+                if resolved is not None:
+                    table, column = resolved
+                    self._add(table, [column], [], IndexUsage(source, ACCESS_JOIN))
+
+        if range_column is not None:
+            resolved = self._resolve(relation, range_column)
+            if resolved is not None:
+                table, column = resolved
+                self._add(table, [column], [], IndexUsage(source, ACCESS_RANGE))
+
+    def _add(self, table: str, key, covering, usage: IndexUsage) -> None:
+        catalog_table = self.catalog.table(table)
+
+        def declared(columns) -> Tuple[str, ...]:
+            # Unknown columns cannot be indexed
+            found = (catalog_table.column(c) for c in columns)
+            return tuple(dict.fromkeys(c.name for c in found if c is not None))
+
+        key_columns = declared(key)
+        covering_columns = tuple(
+            column for column in declared(covering) if column not in key_columns
+        )
+        if not key_columns:
+            return
+
+        usages = self._candidates.setdefault(
+            (catalog_table.name, key_columns, covering_columns), []
+        )
+        if usage not in usages:
+            usages.append(usage)
+
+    # ---------- output ----------
+
+    def recommend(self) -> List[IndexRecommendation]:
+        for source, query, range_column in self._queries:
+            self._add_query(source, query, range_column)
+        self._queries = []
+
+        # Widest candidates first, so narrower ones fold into them
+        candidates = sorted(
+            self._candidates.items(),
+            key=lambda item: (
+                item[0][0],
+                -len(item[0][1] + item[0][2]),
+                item[0][1] + item[0][2],
+            ),
+        )
+
+        kept: List[Tuple[str, Tuple[str, ...], Tuple[str, ...], List[IndexUsage]]] = []
+        for (table, key, covering), usages in candidates:
+            for kept_table, kept_key, kept_covering, kept_usages in kept:
+                kept_columns = kept_key + kept_covering
+                if (
+                    kept_table == table
+                    and kept_columns[:len(key)] == key
+                    and set(covering) <= set(kept_columns)
+                ):
+                    kept_usages.extend(u for u in usages if u not in kept_usages)
+                    break
+            else:
+                kept.append((table, key, covering, list(usages)))
+
+        return sorted(
+            (
+                IndexRecommendation(
+                    table=table,
+                    columns=key,
+                    covering=covering,
+                    usages=tuple(sorted(usages, key=lambda u: (u.source, u.access))),
+                )
+                for table, key, covering, usages in kept
+            ),
+            key=lambda r: (r.table, r.all_columns),
+        )
@@ -0,0 +1,102 @@
+import datetime
+from typing import Callable, Dict, List, Tuple
+
+from compiler.runtime.ir import Dimension
+from compiler.sql.runtime.ir import SqlCalendar, SqlCalendarColumn
+
+
+DATE_KEY = "date_key"
+
+# English names, independent of the compiler's locale
+MONTH_NAMES = (
+    "January", "February", "March", "April", "May", "June", "July",
+    "August", "September", "October", "November", "December",
+)
+DAY_NAMES = (
+    "Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday",
+    "Sunday",
+)
+
+
+def _date_key(d: datetime.date) -> int:
+    return d.year * 10000 + d.month * 100 + d.day
+
+
+# attribute → (MySQL type, value of a date)
+CALENDAR_ATTRIBUTES: Dict[str, Tuple[str, Callable[[datetime.date], object]]] = {
+    DATE_KEY: ("int", _date_key),
+    "year": ("smallint", lambda d: d.year),
+    "quarter": ("tinyint", lambda d: (d.month - 1) // 3 + 1),
+    "month": ("tinyint", lambda d: d.month),
+    "month_name": ("varchar(9)", lambda d: MONTH_NAMES[d.month - 1]),
+    "calendar_month": ("char(7)", lambda d: f"{d:%Y-%m}"),
+    "calendar_quarter": ("char(7)", lambda d: f"{d.year}-Q{(d.month - 1) // 3 + 1}"),
+    "day_of_month": ("tinyint", lambda d: d.day),
+    "day_of_year": ("smallint", lambda d: d.timetuple().tm_yday),
+    "day_of_week": ("tinyint", lambda d: d.isoweekday()),
+    "day_name": ("varchar(9)", lambda d: DAY_NAMES[d.weekday()]),
+    "iso_week": ("tinyint", lambda d: d.isocalendar()[1]),
+    "iso_year": ("smallint", lambda d: d.isocalendar()[0]),
+    "is_weekend": ("tinyint(1)", lambda d: int(d.weekday() >= 5)),
+}
+
+
+def build_calendar_table(dimension: Dimension) -> SqlCalendar:
+    """
+    Generates the calendar table of a dimension declaring `calendar`.
+
+    Compiler boundary:
+        Dimension  →  SqlCalendar
+
+    Responsibilities:
+    - one row per day of [start, end)
+    - integer date key (YYYYMMDD) plus the dimension key as a date
+    - only the calendar attributes the dimension declares
+
+    Explicitly DOES NOT:
+    - read source tables (rows are computed here, not in the database)
+
+    Raises ValueError for attributes that are not calendar attributes.
+    """
+    calendar = dimension.calendar
+    if calendar is None:
+        raise ValueError(f"dimension '{dimension.name}' has no calendar")
+
+    unknown = [a for a in dimension.attributes if a not in CALENDAR_ATTRIBUTES]
+    if unknown:
+        raise ValueError(
+            f"dimension '{dimension.name}' attributes {unknown} are not "
+            f"calendar attributes (available: {sorted(CALENDAR_ATTRIBUTES)})"
+        )
+
+    attributes = [
+        a for a in CALENDAR_ATTRIBUTES
+        if a != DATE_KEY and a in dimension.attributes
+    ]
+    columns = (
+        [SqlCalendarColumn(DATE_KEY, CALENDAR_ATTRIBUTES[DATE_KEY][0])]
+        + [SqlCalendarColumn(dimension.key, "date")]
+        + [SqlCalendarColumn(a, CALENDAR_ATTRIBUTES[a][0]) for a in attributes]
+    )
+    values = [CALENDAR_ATTRIBUTES[a][1] for a in attributes]
+
+    start = datetime.date.fromisoformat(calendar.start)
+    end = datetime.date.fromisoformat(calendar.end)
+
+    rows: List[Tuple] = []
+    day = start
+    while day < end:
+        rows.append(
+            (_date_key(day), day.isoformat()) + tuple(v(day) for v in values)
+        )
+        day += datetime.timedelta(days=1)
+
+    return SqlCalendar(
+        table=dimension.name,
+        date_key=DATE_KEY,
+        key=dimension.key,
+        columns=tuple(columns),
+        rows=tuple(rows),
+        start=calendar.start,
+        end=calendar.end,
+    )
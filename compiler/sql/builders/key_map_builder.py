@@ -0,0 +1,68 @@
+from compiler.runtime.ir import Dimension
+from compiler.sql.builders.materialization_builder import load_filter
+from compiler.sql.runtime.ir import SqlKeyMap
+from validation.schema_catalog import SchemaCatalog
+from validation.sql_index import SqlView
+
+
+def build_key_map(
+    dimension: Dimension,
+    view: SqlView,
+    catalog: SchemaCatalog,
+) -> SqlKeyMap:
+    """
+    Derives the surrogate key map of a dimension from its hand-written view.
+
+    Compiler boundary:
+        Dimension + SqlView  →  SqlKeyMap
+
+    Responsibilities:
+    - type the natural key from the source column it reads (schema catalog)
+    - carry over the view's FROM clause and WHERE predicate
+
+    Requires a single-table view selecting its key from one column.
+    Raises ValueError otherwise.
+    """
+    surrogate_key = dimension.surrogate_key
+    if surrogate_key is None:
+        raise ValueError(f"dimension '{dimension.name}' has no surrogate key")
+
+    if len(view.tables) != 1 or catalog.table(view.tables[0]) is None:
+        raise ValueError(
+            f"dimension '{dimension.name}' must read exactly one schema "
+            f"table to have a surrogate key"
+        )
+    table = catalog.table(view.tables[0])
+
+    key = dimension.key.lower()
+    projection = view.projection(key)
+    source = (
+        table.column(projection.columns[0])
+        if projection is not None
+        and len(projection.columns) == 1
+        and projection.aggregate is None
+        else None
+    )
+    if source is None:
+        raise ValueError(
+            f"dimension '{dimension.name}' view must select its key "
+            f"'{dimension.key}' from a single column of '{table.name}'"
+        )
+
+    key_type = source.declared_type
+    if source.unsigned:
+        key_type += " unsigned"
+
+    return SqlKeyMap(
+        dimension=dimension.name,
+        table=surrogate_key.table,
+        key=key,
+        key_type=key_type,
+        surrogate_key=surrogate_key.column,
+        key_expression=projection.expression,
+        source=view.source,
+        source_table=table.name,
+        filter=load_filter(view, projection.expression),
+        view=f"{dimension.name}__keyed",
+        columns=tuple(view.columns),
+    )
@@ -0,0 +1,105 @@
+from compiler.runtime.ir import Dimension
+from compiler.sql.runtime.ir import SqlMaterialization, SqlMaterializedColumn
+from validation.schema_catalog import SchemaCatalog
+from validation.sql_index import SqlView
+
+
+def load_filter(view: SqlView, key_expression: str) -> str:
+    """
+    WHERE predicate loading a keyed table from a dimension view: the
+    view's own filter, and a non-NULL key (it becomes a table key).
+    """
+    key_filter = f"{key_expression} IS NOT NULL"
+    if view.where is None or view.where.lower() == key_filter.lower():
+        return key_filter
+    return f"({view.where}) AND {key_filter}"
+
+
+def build_dimension_materialization(
+    dimension: Dimension,
+    view: SqlView,
+    catalog: SchemaCatalog,
+) -> SqlMaterialization:
+    """
+    Derives the keyed table and upsert load of a materialized dimension
+    from its hand-written view.
+
+    Compiler boundary:
+        Dimension + SqlView  →  SqlMaterialization
+
+    Responsibilities:
+    - type every column from the source column it reads (schema catalog)
+    - key the table on `Dimension.key`, which must never be NULL
+    - carry over the view's FROM clause and WHERE predicate
+    - resolve the watermark to its declared source column and carry
+      over its lookback window
+
+    Requires a single-table view whose projections each read one column.
+    Raises ValueError otherwise.
+    """
+    materialization = dimension.materialization
+    if materialization is None:
+        raise ValueError(f"dimension '{dimension.name}' is not materialized")
+
+    if len(view.tables) != 1 or catalog.table(view.tables[0]) is None:
+        raise ValueError(
+            f"dimension '{dimension.name}' must read exactly one schema "
+            f"table to be materialized"
+        )
+    table = catalog.table(view.tables[0])
+
+    columns = []
+    key_expression = None
+    for projection in view.projections:
+        source = (
+            table.column(projection.columns[0])
+            if len(projection.columns) == 1 and projection.aggregate is None
+            else None
+        )
+        if source is None:
+            raise ValueError(
+                f"dimension '{dimension.name}' column '{projection.alias}' "
+                f"does not read a single column of '{table.name}'"
+            )
+
+        is_key = projection.alias == dimension.key.lower()
+        if is_key:
+            key_expression = projection.expression
+        data_type = source.declared_type
+        if source.unsigned:
+            data_type += " unsigned"
+
+        columns.append(SqlMaterializedColumn(
+            name=projection.alias,
+            expression=projection.expression,
+            data_type=data_type,
+            nullable=source.nullable and not is_key,
+        ))
+
+    if key_expression is None:
+        raise ValueError(
+            f"dimension '{dimension.name}' view does not select its key "
+            f"'{dimension.key}'"
+        )
+
+    watermark = None
+    if materialization.watermark is not None:
+        watermark_column = table.column(materialization.watermark)
+        if watermark_column is None:
+            raise ValueError(
+                f"dimension '{dimension.name}' watermark column "
+                f"'{materialization.watermark}' does not exist in '{table.name}'"
+            )
+        watermark = watermark_column.name
+
+    return SqlMaterialization(
+        dimension=dimension.name,
+        table=materialization.table,
+        key=dimension.key.lower(),
+        columns=tuple(columns),
+        source=view.source,
+        source_table=table.name,
+        filter=load_filter(view, key_expression),
+        watermark=watermark,
+        lookback_days=materialization.lookback_days,
+    )
@@ -0,0 +1,83 @@
+import datetime
+from typing import Callable, Dict, List, Optional, Tuple
+
+from compiler.runtime.ir import Partitioning
+from compiler.sql.runtime.ir import (
+    RANGE_END_PARAMETER,
+    RANGE_START_PARAMETER,
+    SqlRangeFilter,
+)
+
+
+def _add_months(date: datetime.date, months: int) -> datetime.date:
+    month = date.month - 1 + months
+    return datetime.date(date.year + month // 12, month % 12 + 1, 1)
+
+
+# granularity → (period start containing a date, next period start, label)
+PERIODS: Dict[str, Tuple[
+    Callable[[datetime.date], datetime.date],
+    Callable[[datetime.date], datetime.date],
+    Callable[[datetime.date], str],
+]] = {
+    "day": (
+        lambda d: d,
+        lambda d: d + datetime.timedelta(days=1),
+        lambda d: f"{d:%Y_%m_%d}",
+    ),
+    "month": (
+        lambda d: d.replace(day=1),
+        lambda d: _add_months(d, 1),
+        lambda d: f"{d:%Y_%m}",
+    ),
+    "quarter": (
+        lambda d: datetime.date(d.year, (d.month - 1) // 3 * 3 + 1, 1),
+        lambda d: _add_months(d, 3),
+        lambda d: f"{d.year}_q{(d.month - 1) // 3 + 1}",
+    ),
+    "year": (
+        lambda d: datetime.date(d.year, 1, 1),
+        lambda d: datetime.date(d.year + 1, 1, 1),
+        lambda d: f"{d.year}",
+    ),
+}
+
+
+def build_refresh_filter(partitioning: Partitioning) -> SqlRangeFilter:
+    """
+    Range filter bound to the RangeStart / RangeEnd refresh parameters.
+    """
+    return SqlRangeFilter(
+        column=partitioning.column,
+        lower=RANGE_START_PARAMETER,
+        upper=RANGE_END_PARAMETER,
+        label="incremental",
+    )
+
+
+def build_partition_filters(
+    partitioning: Optional[Partitioning],
+) -> List[SqlRangeFilter]:
+    """
+    One range filter per period between `start` (aligned down to its
+    period) and `end` (exclusive). Empty when no range is declared.
+    """
+    if partitioning is None or not partitioning.start or not partitioning.end:
+        return []
+
+    period_start, next_period, label = PERIODS[partitioning.granularity]
+    current = period_start(datetime.date.fromisoformat(partitioning.start))
+    end = datetime.date.fromisoformat(partitioning.end)
+
+    filters: List[SqlRangeFilter] = []
+    while current < end:
+        upper = next_period(current)
+        filters.append(SqlRangeFilter(
+            column=partitioning.column,
+            lower=f"'{current.isoformat()}'",
+            upper=f"'{upper.isoformat()}'",
+            label=label(current),
+        ))
+        current = upper
+
+    return filters
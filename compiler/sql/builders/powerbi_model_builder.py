@@ -0,0 +1,335 @@
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple
+
+from compiler.runtime.ir import Dimension, SemanticModelIR
+from compiler.sql.cost.model_size import POWERBI_DOUBLE, POWERBI_INT64, POWERBI_STRING
+from compiler.sql.passes.narrow_column_types import powerbi_type
+from compiler.sql.runtime.ir import (
+    STORAGE_DIRECTQUERY,
+    STORAGE_IMPORT,
+    SqlAlternateOf,
+    SqlCalendar,
+    SqlFactQuery,
+    SqlKeyMap,
+    SqlModel,
+    SqlModelColumn,
+    SqlModelRelationship,
+    SqlModelTable,
+    SqlRefreshPolicy,
+    SqlRollupQuery,
+    SqlStorageMode,
+)
+from validation.schema_catalog import Column
+
+
+# SqlMeasureAggregation → TMSL summarization
+SUMMARIZATIONS: Dict[str, str] = {
+    "SUM": "sum",
+    "COUNT": "count",
+    "MIN": "min",
+    "MAX": "max",
+}
+
+
+def _mysql_column(name: str, data_type: str) -> Column:
+    """
+    Column of a generated table from its MySQL type, e.g. `varchar(9)`
+    or `int unsigned`.
+    """
+    words = data_type.split()
+    base, _, args = words[0].partition("(")
+    return Column(
+        name=name,
+        data_type=base,
+        args=tuple(int(a) for a in args.rstrip(")").split(",") if a),
+        unsigned="unsigned" in words[1:],
+    )
+
+
+def _result_columns(query: SqlFactQuery) -> List[str]:
+    """
+    Result column names of a compiled fact or rollup, in SELECT order.
+    """
+    columns: List[str] = []
+    for column in query.grain_columns + query.dimension_columns:
+        name = column.rpartition(".")[2]
+        if name not in columns:
+            columns.append(name)
+    return columns
+
+
+def build_powerbi_model(
+    semantic_ir: SemanticModelIR,
+    fact_queries: Sequence[Tuple[SqlFactQuery, str, Optional[str]]],
+    rollup_queries: Sequence[Tuple[SqlRollupQuery, str]],
+    storage_modes: Mapping[str, SqlStorageMode],
+    dimension_columns: Optional[Mapping[str, Mapping[str, Column]]] = None,
+    calendars: Optional[Mapping[str, SqlCalendar]] = None,
+    key_maps: Optional[Mapping[str, SqlKeyMap]] = None,
+) -> SqlModel:
+    """
+    Derives the Power BI model of the whole contract from the compiled
+    fact and rollup queries.
+
+    Compiler boundary:
+        SemanticModelIR + SqlFactQuery + SqlRollupQuery  →  SqlModel
+
+    Responsibilities:
+    - one table per fact, rollup and dimension, reading the generated
+      SQL (facts, rollups), the keyed dimension view (surrogate keys),
+      the materialized table or the dimension view / calendar table
+    - column types from the narrowed column types of facts and from
+      the schema catalog or generated DDL of dimensions
+    - default summarization of measures from their SQL aggregation
+    - relationships from every fact and rollup key column (natural or
+      surrogate) to its dimension
+    - rollups as hidden aggregation tables mapped to their detail fact
+      when it uses DirectQuery (Power BI only redirects DirectQuery
+      queries); otherwise as plain tables
+    - incremental refresh policies for imported partitioned facts
+
+    Explicitly DOES NOT:
+    - choose storage modes (see cost/storage_mode.py)
+    - render SQL (fact and rollup queries are passed in rendered)
+
+    fact_queries:      (compiled fact, its SQL, its incremental-refresh
+                       SQL or None)
+    rollup_queries:    (rollup, its SQL)
+    storage_modes:     table name → storage mode
+    dimension_columns: dimension → column → schema catalog Column
+                       (hand-written views); other columns import as text
+    calendars:         calendar dimension → generated table
+    key_maps:          dimension → surrogate key map
+    """
+    surrogate_dims = {
+        dim.surrogate_key.column: dim
+        for dim in semantic_ir.dimensions.values()
+        if dim.surrogate_key is not None
+    }
+
+    tables: List[SqlModelTable] = []
+    relationships: List[SqlModelRelationship] = []
+
+    for query, sql, refresh_sql in fact_queries:
+        storage = storage_modes[query.from_table]
+        tables.append(SqlModelTable(
+            name=query.from_table,
+            source=sql,
+            columns=tuple(_fact_columns(query, surrogate_dims)),
+            storage=storage,
+            refresh_policy=_refresh_policy(
+                semantic_ir, query, refresh_sql, storage
+            ),
+        ))
+        relationships += _relationships(
+            semantic_ir, surrogate_dims, query.from_table, query
+        )
+
+    for query, sql in rollup_queries:
+        is_aggregation = (
+            storage_modes[query.from_table].mode == STORAGE_DIRECTQUERY
+        )
+        if is_aggregation:
+            columns = _rollup_columns(query, surrogate_dims)
+        else:
+            columns = _fact_columns(query, surrogate_dims)
+        tables.append(SqlModelTable(
+            name=query.name,
+            source=sql,
+            columns=tuple(columns),
+            storage=storage_modes[query.name],
+            is_hidden=is_aggregation,
+        ))
+        relationships += _relationships(
+            semantic_ir, surrogate_dims, query.name, query
+        )
+
+    for dimension in semantic_ir.dimensions.values():
+        tables.append(_dimension_table(
+            dimension,
+            storage_modes[dimension.name],
+            (dimension_columns or {}).get(dimension.name, {}),
+            (calendars or {}).get(dimension.name),
+            (key_maps or {}).get(dimension.name),
+        ))
+
+    return SqlModel(tables=tuple(tables), relationships=tuple(relationships))
+
+# ---------- facts and rollups ----------
+
+def _fact_columns(
+    query: SqlFactQuery,
+    surrogate_dims: Mapping[str, Dimension],
+) -> List[SqlModelColumn]:
+    # Relationship columns are hidden; grain columns stay visible
+    grain = {column.rpartition(".")[2] for column in query.grain_columns}
+    return [
+        SqlModelColumn(
+            name=name,
+            data_type=_key_type(query, name, surrogate_dims),
+            is_hidden=name not in grain,
+        )
+        for name in _result_columns(query)
+    ] + _measure_columns(query)
+
+
+def _rollup_columns(
+    query: SqlRollupQuery,
+    surrogate_dims: Mapping[str, Dimension],
+) -> List[SqlModelColumn]:
+    columns = [
+        SqlModelColumn(
+            name=name,
+            data_type=_key_type(query, name, surrogate_dims),
+            is_hidden=True,
+            alternate_of=SqlAlternateOf(query.from_table, name, "groupBy"),
+        )
+        for name in _result_columns(query)
+    ]
+    columns += [
+        SqlModelColumn(
+            name=column.name,
+            data_type=column.data_type,
+            summarize_by=column.summarize_by,
+            is_hidden=True,
+            alternate_of=SqlAlternateOf(
+                query.from_table, column.name, column.summarize_by
+            ),
+        )
+        for column in _measure_columns(query)
+    ]
+    return columns
+
+
+def _key_type(
+    query: SqlFactQuery,
+    name: str,
+    surrogate_dims: Mapping[str, Dimension],
+) -> str:
+    column_type = query.column_types.get(name)
+    if column_type is not None:
+        return column_type.powerbi_type
+    if name in surrogate_dims:
+        return POWERBI_INT64
+    return POWERBI_STRING
+
+
+def _measure_columns(query: SqlFactQuery) -> List[SqlModelColumn]:
+    columns = []
+    for measure, aggregation in query.aggregations.items():
+        summarization = SUMMARIZATIONS.get(aggregation.aggregation)
+        if summarization is None:
+            raise ValueError(
+                f"table '{query.from_table}' measure '{measure}': "
+                f"aggregation {aggregation.aggregation} has no "
+                f"Power BI summarization"
+            )
+
+        column_type = query.column_types.get(measure)
+        if column_type is not None:
+            data_type = column_type.powerbi_type
+        elif aggregation.aggregation == "COUNT":
+            data_type = POWERBI_INT64
+        else:
+            data_type = POWERBI_DOUBLE
+
+        columns.append(SqlModelColumn(
+            name=measure,
+            data_type=data_type,
+            summarize_by=summarization,
+        ))
+    return columns
+
+
+def _refresh_policy(
+    semantic_ir: SemanticModelIR,
+    query: SqlFactQuery,
+    refresh_sql: Optional[str],
+    storage: SqlStorageMode,
+) -> Optional[SqlRefreshPolicy]:
+    partitioning = semantic_ir.facts[query.from_table].partitioning
+    if (
+        partitioning is None
+        or partitioning.archive_periods is None
+        or partitioning.start is None
+        or refresh_sql is None
+        or storage.mode != STORAGE_IMPORT
+    ):
+        return None
+
+    # Power BI counts both windows back from the refresh date, so they
+    # come from the contract rather than the fixed start / end range
+    return SqlRefreshPolicy(
+        granularity=partitioning.granularity,
+        archive_periods=partitioning.archive_periods,
+        refresh_periods=partitioning.refresh_periods,
+        start=partitioning.start,
+        end=partitioning.end,
+        source=refresh_sql,
+    )
+
+
+def _relationships(
+    semantic_ir: SemanticModelIR,
+    surrogate_dims: Mapping[str, Dimension],
+    table: str,
+    query: SqlFactQuery,
+) -> List[SqlModelRelationship]:
+    relationships = []
+    for name in _result_columns(query):
+        dim = surrogate_dims.get(name) or semantic_ir.dimension_for_key(name)
+        if dim is not None:
+            relationships.append(SqlModelRelationship(table, name, dim.name, name))
+    return relationships
+
+# ---------- dimensions ----------
+
+def _dimension_table(
+    dimension: Dimension,
+    storage: SqlStorageMode,
+    physical: Mapping[str, Column],
+    calendar: Optional[SqlCalendar],
+    key_map: Optional[SqlKeyMap],
+) -> SqlModelTable:
+    if calendar is not None:
+        physical = {
+            column.name: _mysql_column(column.name, column.data_type)
+            for column in calendar.columns
+        }
+        names = [column.name for column in calendar.columns]
+    else:
+        names = [dimension.key] + [
+            a for a in dimension.attributes if a != dimension.key
+        ]
+
+    key = dimension.key
+    if key_map is not None:
+        # Facts relate to the keyed view through the surrogate key
+        physical = {
+            **physical,
+            key_map.surrogate_key: Column(key_map.surrogate_key, "int"),
+        }
+        names = [key_map.surrogate_key] + names
+        key = key_map.surrogate_key
+        table = key_map.view
+    elif dimension.materialization is not None:
+        table = dimension.materialization.table
+    else:
+        table = dimension.name
+
+    columns = []
+    for name in names:
+        column = physical.get(name)
+        columns.append(SqlModelColumn(
+            name=name,
+            data_type=powerbi_type(column) if column is not None else POWERBI_STRING,
+            is_key=name == key,
+            is_hidden=key_map is not None and name == key,
+        ))
+
+    return SqlModelTable(
+        name=dimension.name,
+        source=f"SELECT {', '.join(names)} FROM {table}",
+        columns=tuple(columns),
+        storage=storage,
+        is_date_table=calendar is not None,
+    )
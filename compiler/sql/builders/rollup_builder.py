@@ -0,0 +1,84 @@
+from typing import List
+
+from compiler.runtime.immutable import FrozenDict
+from compiler.runtime.ir import SemanticModelIR
+from compiler.sql.runtime.ir import SqlFactQuery, SqlJoin, SqlRollupQuery
+
+
+def build_rollup_queries(
+    semantic_ir: SemanticModelIR,
+    fact_query: SqlFactQuery,
+) -> List[SqlRollupQuery]:
+    """
+    Derives the rollups declared for a fact from its compiled query.
+
+    Compiler boundary:
+        SqlFactQuery  →  SqlRollupQuery
+
+    Responsibilities:
+    - narrow the grain to the rollup's GROUP BY columns
+    - reuse the fact's bound measure aggregations
+    - group by the fact's surrogate keys, through its key map joins
+    - keep the fact's narrowed column types (rollup sums are bounded
+      by the fact's)
+
+    Explicitly DOES NOT:
+    - join dimensions (rollups group by the fact's own keys or
+      their surrogate keys)
+    - re-aggregate other rollups
+    """
+
+    rollups: List[SqlRollupQuery] = []
+    joins_by_table = {join.table: join for join in fact_query.joins}
+
+    for rollup in semantic_ir.rollups_for(fact_query.from_table):
+        measures = tuple(m.name for m in rollup.measures)
+
+        grain: List[str] = []
+        joins: List[SqlJoin] = []
+        for column in rollup.grain:
+            dim = semantic_ir.dimension_for_key(column)
+            surrogate_key = dim.surrogate_key if dim is not None else None
+            join = (
+                joins_by_table.get(surrogate_key.table)
+                if surrogate_key is not None
+                else None
+            )
+            if join is None:
+                grain.append(column)
+            else:
+                joins.append(join)
+                grain.append(f"{surrogate_key.table}.{surrogate_key.column}")
+        result_columns = {column.rpartition(".")[2] for column in grain}
+
+        rollups.append(SqlRollupQuery(
+            select=tuple(
+                column
+                for column in fact_query.select
+                if column.alias in rollup.grain or column.alias in measures
+            ),
+            from_table=fact_query.from_table,
+            joins=tuple(joins),
+            group_by=tuple(grain),
+            grain_columns=tuple(grain),
+            foreign_keys=tuple(
+                fk for fk in fact_query.foreign_keys if fk in rollup.grain
+            ),
+            measures=measures,
+            aggregations=FrozenDict(
+                (measure, fact_query.aggregations[measure])
+                for measure in measures
+            ),
+            dimension_columns=(),
+            eliminated_joins=(),
+            estimate=None,
+            column_types=FrozenDict(
+                (column, column_type)
+                for column, column_type in fact_query.column_types.items()
+                if column in measures or column in result_columns
+            ),
+            name=rollup.name,
+            precedence=rollup.precedence,
+        ))
+
+    return rollups
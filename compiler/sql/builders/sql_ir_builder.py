@@ -1,4 +1,4 @@
-from typing import List
+from typing import Dict, List
 
 from compiler.runtime.ir import SemanticModelIR
 from compiler.sql.runtime.ir import (
@@ -30,41 +30,37 @@ def build_sql_ir_from_semantic(
 
     queries: List[SqlQuery] = []
 
+    # Identical projections are shared across all fact queries
+    shared_columns: Dict[str, SqlSelectColumn] = {}
+
+    def select_column(column: str) -> SqlSelectColumn:
+        if column not in shared_columns:
+            shared_columns[column] = SqlSelectColumn(
+                expression=column,
+                alias=column,
+            )
+        return shared_columns[column]
+
     for fact_name, fact in semantic_ir.facts.items():
         select_columns: List[SqlSelectColumn] = []
 
         # --- Grain columns ---
         for column in fact.grain:
-            select_columns.append(
-                SqlSelectColumn(
-                    expression=column,
-                    alias=column,
-                )
-            )
+            select_columns.append(select_column(column))
 
         # --- Foreign keys ---
         for fk in fact.foreign_keys:
-            select_columns.append(
-                SqlSelectColumn(
-                    expression=fk,
-                    alias=fk,
-                )
-            )
+            select_columns.append(select_column(fk))
 
         # --- Measures (raw, no aggregation yet) ---
         for measure in fact.measures:
-            select_columns.append(
-                SqlSelectColumn(
-                    expression=measure.name,
-                    alias=measure.name,
-                )
-            )
+            select_columns.append(select_column(measure.name))
 
         query = SqlQuery(
-            select=select_columns,
+            select=tuple(select_columns),
             from_table=fact_name,
-            group_by=list(fact.grain),
-            joins=[],  # ← REQUIRED by SqlQuery contract
+            group_by=fact.grain,
+            joins=(),  # ← REQUIRED by SqlQuery contract
         )
 
         queries.append(query)
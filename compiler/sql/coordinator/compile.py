@@ -1,64 +1,901 @@
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
 from pathlib import Path
-import yaml
-import subprocess
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
 
 from compiler.builders.ir_builder import build_ir
+from compiler.sql.advisor.index_advisor import IndexAdvisor
+from compiler.runtime.instrumentation import PassTracer, PipelineHooks
+from compiler.runtime.ir import SemanticModelIR
+from compiler.sql.builders.partition_builder import (
+    build_partition_filters,
+    build_refresh_filter,
+)
+from compiler.sql.builders.calendar_builder import build_calendar_table
+from compiler.sql.builders.key_map_builder import build_key_map
+from compiler.sql.builders.materialization_builder import (
+    build_dimension_materialization,
+)
+from compiler.sql.builders.powerbi_model_builder import build_powerbi_model
+from compiler.sql.builders.rollup_builder import build_rollup_queries
 from compiler.sql.builders.sql_ir_builder import build_sql_ir_from_semantic
+from compiler.sql.cost.statistics import STATS_PATH, Statistics, load_statistics
+from compiler.sql.cost.storage_mode import choose_storage_modes
 from compiler.sql.passes.pipeline import SqlCompilerPipeline
 from compiler.sql.passes.normalize_fact_query import NormalizeFactQueryPass
 from compiler.sql.passes.bind_measure_aggregation import BindMeasureAggregationPass
 from compiler.sql.passes.bind_dimension_joins import BindDimensionJoinsPass
+from compiler.sql.passes.bind_surrogate_keys import BindSurrogateKeysPass
+from compiler.sql.passes.eliminate_dimension_joins import EliminateDimensionJoinsPass
+from compiler.sql.passes.estimate_query_cost import EstimateQueryCostPass
+from compiler.sql.passes.narrow_column_types import NarrowColumnTypesPass
+from compiler.sql.renderers.calendar_renderer import CalendarTableRenderer
+from compiler.sql.renderers.column_type_renderer import ColumnTypeReportRenderer
 from compiler.sql.renderers.fact_renderer import FactQueryRenderer
+from compiler.sql.renderers.index_renderer import IndexDdlRenderer, IndexReportRenderer
+from compiler.sql.renderers.key_map_renderer import (
+    KeyedDimensionViewRenderer,
+    KeyMapLoadRenderer,
+    KeyMapTableRenderer,
+)
+from compiler.sql.renderers.incremental_refresh_renderer import (
+    IncrementalRefreshQueryRenderer,
+)
+from compiler.sql.renderers.materialization_renderer import (
+    MaterializationLoadRenderer,
+    MaterializedTableRenderer,
+)
+from compiler.sql.renderers.rollup_mapping_renderer import RollupMappingRenderer
+from compiler.sql.renderers.tmsl_renderer import TmslModelRenderer
+from compiler.sql.coordinator.manifest import (
+    BuildManifest,
+    fact_input_hash,
+    model_input_hash,
+)
+from compiler.sql.runtime.ir import SqlKeyMap, SqlMaterialization, SqlQuery
+from validation.engine import SqlArtifactCache, Validator, load_model
+from validation.schema_catalog import Column, physical_columns
 
 
 SEMANTIC_MODEL_PATH = Path("semantic/model.contract.yml")
 OUTPUT_SQL_DIR = Path("output/sql")
+OUTPUT_POWERBI_DIR = Path("output/powerbi")
+OUTPUT_INDEX_DIR = Path("output/indexes")
+OUTPUT_MATERIALIZED_DIR = Path("output/materialized")
+OUTPUT_CALENDAR_DIR = Path("output/calendar")
+OUTPUT_KEYS_DIR = Path("output/keys")
+MANIFEST_PATH = Path("output/manifest.json")
+TRACE_PATH = Path("output/trace/compile.trace.json")
+PROFILE_PATH = Path("output/trace/compile.prof")
 
+# Bump whenever a pass or renderer changes generated SQL, so that
+# incremental builds do not keep outputs from an older compiler.
+COMPILER_VERSION = "15"
 
-def compile_sql() -> None:
+
+PhysicalColumns = Dict[str, Dict[str, Column]]
+# Fact → the schema table its hand-written view reads
+SourceTables = Dict[str, str]
+
+
+def build_pipeline(
+    semantic_ir: SemanticModelIR,
+    hooks: Optional[List[PipelineHooks]] = None,
+    physical: Optional[PhysicalColumns] = None,
+    statistics: Optional[Statistics] = None,
+    source_tables: Optional[SourceTables] = None,
+) -> SqlCompilerPipeline:
+    return SqlCompilerPipeline(
+        passes=[
+            NormalizeFactQueryPass(),
+            BindMeasureAggregationPass(physical),
+            BindDimensionJoinsPass(semantic_ir),
+            EliminateDimensionJoinsPass(semantic_ir),
+            BindSurrogateKeysPass(semantic_ir),
+            NarrowColumnTypesPass(
+                semantic_ir, physical, statistics, source_tables
+            ),
+            EstimateQueryCostPass(statistics),
+        ],
+        hooks=hooks,
+    )
+
+
+def resolve_physical_columns(
+    semantic_ir: SemanticModelIR,
+    sql: SqlArtifactCache,
+) -> PhysicalColumns:
     """
-    Orchestrates full SQL compilation from semantic model to SQL artifacts.
+    Maps every fact column to its schema catalog column through the
+    hand-written fact view: fact → column → Column. Empty when the
+    schema is unavailable.
+    """
+    catalog = sql.catalog()
+    if catalog is None:
+        return {}
+
+    resolved = {}
+    for fact_name in semantic_ir.facts:
+        view = sql.fact(fact_name).view
+        if view is not None:
+            resolved[fact_name] = physical_columns(view, catalog)
+    return resolved
+
+
+def resolve_source_tables(
+    semantic_ir: SemanticModelIR,
+    sql: SqlArtifactCache,
+) -> SourceTables:
+    """
+    Maps every fact whose hand-written view reads exactly one table of
+    the schema catalog to that table. Empty when the schema is
+    unavailable.
+    """
+    catalog = sql.catalog()
+    if catalog is None:
+        return {}
+
+    resolved = {}
+    for fact_name in semantic_ir.facts:
+        view = sql.fact(fact_name).view
+        if (
+            view is not None
+            and len(view.tables) == 1
+            and catalog.table(view.tables[0]) is not None
+        ):
+            resolved[fact_name] = view.tables[0]
+    return resolved
+
+
+FactOutputs = Dict[str, str]
+
+# Compiled query of a fact and its rendered outputs (empty when only
+# the query was needed)
+CompiledFact = Tuple[SqlQuery, FactOutputs]
+
+
+def render_fact_outputs(
+    semantic_ir: SemanticModelIR,
+    compiled_query: SqlQuery,
+) -> FactOutputs:
+    """
+    Renders a compiled fact query, its incremental-refresh and period
+    partition variants, the rollups derived from it and the report of
+    its column types.
+    Returns output path → content.
+    """
+    fact_name = compiled_query.from_table
+    outputs = {
+        str(OUTPUT_SQL_DIR / f"{fact_name}.sql"):
+            FactQueryRenderer(compiled_query).render(),
+    }
+    if compiled_query.column_types:
+        outputs[str(OUTPUT_POWERBI_DIR / f"{fact_name}.types.md")] = (
+            ColumnTypeReportRenderer(compiled_query).render()
+        )
+
+    partitioning = semantic_ir.facts[fact_name].partitioning
+    if partitioning is not None:
+        refresh_sql = FactQueryRenderer(
+            compiled_query, build_refresh_filter(partitioning)
+        ).render()
+        outputs[str(OUTPUT_SQL_DIR / f"{fact_name}.incremental.sql")] = refresh_sql
+        outputs[str(OUTPUT_POWERBI_DIR / f"{fact_name}.incremental.m")] = (
+            IncrementalRefreshQueryRenderer(refresh_sql).render()
+        )
+
+        for range_filter in build_partition_filters(partitioning):
+            partition_path = OUTPUT_SQL_DIR / f"{fact_name}__{range_filter.label}.sql"
+            outputs[str(partition_path)] = FactQueryRenderer(
+                compiled_query, range_filter
+            ).render()
+
+    for rollup_query in build_rollup_queries(semantic_ir, compiled_query):
+        outputs[str(OUTPUT_SQL_DIR / f"{rollup_query.name}.sql")] = (
+            FactQueryRenderer(rollup_query).render()
+        )
+        outputs[str(OUTPUT_POWERBI_DIR / f"{rollup_query.name}.aggregation.json")] = (
+            RollupMappingRenderer(rollup_query).render()
+        )
+
+    return outputs
+
+
+def compile_batch(
+    semantic_ir: SemanticModelIR,
+    pipeline: SqlCompilerPipeline,
+    queries: List[SqlQuery],
+    render: bool = True,
+) -> List[Tuple[str, CompiledFact]]:
     """
+    Runs the pass pipeline over a batch of queries and, with `render`,
+    renders each one. Returns (fact name, (query, outputs)) pairs.
+    """
+    return [
+        (
+            compiled_query.from_table,
+            (
+                compiled_query,
+                render_fact_outputs(semantic_ir, compiled_query) if render else {},
+            ),
+        )
+        for compiled_query in pipeline.run_all(queries)
+    ]
+
 
-    # --- Validate semantic model ---
-    result = subprocess.run(
-        ["python3", "validation/engine.py"],
-        check=False,
+# ---------- Parallel compilation ----------
+
+# Per-worker pipeline, built once from the SemanticModelIR shipped to
+# the worker at startup instead of once per task.
+_worker_semantic_ir: Optional[SemanticModelIR] = None
+_worker_pipeline: Optional[SqlCompilerPipeline] = None
+
+
+def _init_worker(
+    semantic_ir: SemanticModelIR,
+    physical: Optional[PhysicalColumns],
+    statistics: Optional[Statistics],
+    source_tables: Optional[SourceTables],
+) -> None:
+    global _worker_semantic_ir, _worker_pipeline
+    _worker_semantic_ir = semantic_ir
+    _worker_pipeline = build_pipeline(
+        semantic_ir,
+        physical=physical,
+        statistics=statistics,
+        source_tables=source_tables,
     )
 
-    if result.returncode != 0:
-        raise RuntimeError("Semantic model validation failed")
 
-    # --- Load semantic model ---
-    with SEMANTIC_MODEL_PATH.open() as f:
-        semantic_model_dict = yaml.safe_load(f)
+def _compile_in_worker(
+    queries: List[SqlQuery],
+    render: bool,
+) -> List[Tuple[str, CompiledFact]]:
+    return compile_batch(_worker_semantic_ir, _worker_pipeline, queries, render)
+
 
-    # --- Build Semantic IR ---
-    semantic_ir = build_ir(semantic_model_dict)
+def compile_queries(
+    semantic_ir: SemanticModelIR,
+    queries: List[SqlQuery],
+    jobs: int = 1,
+    hooks: Optional[List[PipelineHooks]] = None,
+    physical: Optional[PhysicalColumns] = None,
+    statistics: Optional[Statistics] = None,
+    render: bool = True,
+    source_tables: Optional[SourceTables] = None,
+) -> Dict[str, CompiledFact]:
+    """
+    Compiles queries into fact name → (compiled query, outputs),
+    optionally across a process pool. Without `render`, outputs are
+    left empty.
 
-    # --- Build SQL IR ---
-    sql_queries = build_sql_ir_from_semantic(semantic_ir)
+    The SemanticModelIR is sent once to each worker and only read there.
+    The result is ordered by fact name, so output does not depend on
+    worker scheduling. Pipeline hooks observe in-process passes only,
+    so passing hooks forces sequential compilation.
+    """
+    if hooks or jobs <= 1 or len(queries) <= 1:
+        pipeline = build_pipeline(
+            semantic_ir, hooks, physical, statistics, source_tables
+        )
+        results = compile_batch(semantic_ir, pipeline, queries, render)
+    else:
+        batch_size = max(1, len(queries) // (jobs * 4))
+        batches = [
+            queries[i:i + batch_size]
+            for i in range(0, len(queries), batch_size)
+        ]
+        with ProcessPoolExecutor(
+            max_workers=jobs,
+            initializer=_init_worker,
+            initargs=(semantic_ir, physical, statistics, source_tables),
+        ) as pool:
+            results = [
+                result
+                for batch in pool.map(
+                    _compile_in_worker, batches, [render] * len(batches)
+                )
+                for result in batch
+            ]
 
-    # --- SQL compiler pipeline ---
-    pipeline = SqlCompilerPipeline(
-        passes=[
-            NormalizeFactQueryPass(),
-            BindMeasureAggregationPass(),
-            BindDimensionJoinsPass(semantic_ir),
+    return dict(sorted(results, key=lambda result: result[0]))
+
+
+def write_outputs(outputs: FactOutputs, only_changed: bool = False) -> None:
+    for output_path, content in outputs.items():
+        path = Path(output_path)
+        if only_changed and path.exists() and path.read_text() == content:
+            continue
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content)
+
+
+# ---------- Outputs spanning the whole model ----------
+
+# Manifest names of the outputs derived from every fact at once
+POWERBI_MODEL_OUTPUT = "powerbi_model"
+INDEX_ADVICE_OUTPUT = "index_advice"
+# Manifest names of the dimension outputs, regenerated on every build;
+# recording them deletes scripts of features removed from the model
+CALENDARS_OUTPUT = "calendars"
+MATERIALIZATIONS_OUTPUT = "materializations"
+KEY_MAPS_OUTPUT = "key_maps"
+
+
+def model_sources(
+    semantic_ir: SemanticModelIR,
+    sql: SqlArtifactCache,
+) -> Dict[str, Optional[str]]:
+    """
+    Hand-written SQL of every fact and dimension (path → content) and
+    the hash of the schema DDL, for model_input_hash.
+    """
+    sources = {}
+    for name in semantic_ir.facts:
+        artifact = sql.fact(name)
+        sources[artifact.path] = artifact.content
+    for name in semantic_ir.dimensions:
+        artifact = sql.dimension(name)
+        sources[artifact.path] = artifact.content
+
+    catalog = sql.catalog()
+    sources[sql.schema_path] = catalog.source_hash if catalog is not None else None
+    return sources
+
+
+def compile_model_queries(
+    semantic_ir: SemanticModelIR,
+    physical: Optional[PhysicalColumns] = None,
+    statistics: Optional[Statistics] = None,
+    hooks: Optional[List[PipelineHooks]] = None,
+    compiled: Optional[Mapping[str, SqlQuery]] = None,
+    jobs: int = 1,
+    source_tables: Optional[SourceTables] = None,
+) -> Dict[str, SqlQuery]:
+    """
+    Compiled query of every fact, for the outputs spanning the whole
+    model. `compiled` holds queries already compiled from the current
+    inputs (in this run, or kept warm by watch mode); only the other
+    facts run through the pass pipeline, across `jobs` workers.
+    Returns fact name → query, in contract order.
+    """
+    compiled = compiled or {}
+    pending = [
+        query
+        for query in build_sql_ir_from_semantic(semantic_ir)
+        if query.from_table not in compiled
+    ]
+    fresh = {}
+    if pending:
+        fresh = {
+            fact_name: query
+            for fact_name, (query, _) in compile_queries(
+                semantic_ir,
+                pending,
+                jobs=jobs,
+                hooks=hooks,
+                physical=physical,
+                statistics=statistics,
+                render=False,
+                source_tables=source_tables,
+            ).items()
+        }
+
+    return {
+        fact_name: compiled.get(fact_name) or fresh[fact_name]
+        for fact_name in semantic_ir.facts
+    }
+
+
+# ---------- Calendar dimensions ----------
+
+def generate_calendars(semantic_ir: SemanticModelIR) -> FactOutputs:
+    """
+    Renders the generated table of every dimension declaring `calendar`.
+    Returns output path → content.
+    """
+    return {
+        str(OUTPUT_CALENDAR_DIR / f"{dim_name}.sql"):
+            CalendarTableRenderer(build_calendar_table(dimension)).render()
+        for dim_name, dimension in semantic_ir.dimensions.items()
+        if dimension.calendar is not None
+    }
+
+
+# ---------- Dimension materialization ----------
+
+def build_materializations(
+    semantic_ir: SemanticModelIR,
+    sql: SqlArtifactCache,
+) -> List[SqlMaterialization]:
+    """
+    SqlMaterialization of every dimension declaring `materialization`,
+    built from its hand-written view. Empty when the schema catalog is
+    unavailable.
+    """
+    catalog = sql.catalog()
+    if catalog is None:
+        return []
+
+    materializations = []
+    for dim_name, dimension in semantic_ir.dimensions.items():
+        view = sql.dimension(dim_name).view
+        if dimension.materialization is not None and view is not None:
+            materializations.append(
+                build_dimension_materialization(dimension, view, catalog)
+            )
+    return materializations
+
+
+def materialize_dimensions(
+    materializations: List[SqlMaterialization],
+) -> FactOutputs:
+    """
+    Renders the table DDL and the upsert load script of every
+    materialized dimension. Returns output path → content.
+    """
+    outputs = {}
+    for materialization in materializations:
+        name = materialization.dimension
+        outputs[str(OUTPUT_MATERIALIZED_DIR / f"{name}.create.sql")] = (
+            MaterializedTableRenderer(materialization).render()
+        )
+        outputs[str(OUTPUT_MATERIALIZED_DIR / f"{name}.load.sql")] = (
+            MaterializationLoadRenderer(materialization).render()
+        )
+    return outputs
+
+
+# ---------- Surrogate keys ----------
+
+def build_key_maps(
+    semantic_ir: SemanticModelIR,
+    sql: SqlArtifactCache,
+) -> List[SqlKeyMap]:
+    """
+    SqlKeyMap of every dimension declaring `surrogate_key`, built from
+    its hand-written view. Empty when the schema catalog is unavailable.
+    """
+    catalog = sql.catalog()
+    if catalog is None:
+        return []
+
+    key_maps = []
+    for dim_name, dimension in semantic_ir.dimensions.items():
+        view = sql.dimension(dim_name).view
+        if dimension.surrogate_key is not None and view is not None:
+            key_maps.append(build_key_map(dimension, view, catalog))
+    return key_maps
+
+
+def generate_key_maps(key_maps: List[SqlKeyMap]) -> FactOutputs:
+    """
+    Renders the table DDL and load script of every surrogate key map,
+    and the keyed dimension views facts relate to.
+    Returns output path → content.
+    """
+    outputs = {}
+    for key_map in key_maps:
+        name = key_map.dimension
+        outputs[str(OUTPUT_KEYS_DIR / f"{name}.create.sql")] = (
+            KeyMapTableRenderer(key_map).render()
+        )
+        outputs[str(OUTPUT_KEYS_DIR / f"{name}.load.sql")] = (
+            KeyMapLoadRenderer(key_map).render()
+        )
+        outputs[str(OUTPUT_KEYS_DIR / "views" / f"{key_map.view}.sql")] = (
+            KeyedDimensionViewRenderer(key_map).render()
+        )
+    return outputs
+
+
+# ---------- Power BI model ----------
+
+def generate_powerbi_model(
+    semantic_ir: SemanticModelIR,
+    sql: SqlArtifactCache,
+    fact_queries: Iterable[SqlQuery],
+    statistics: Optional[Statistics] = None,
+    key_maps: Optional[List[SqlKeyMap]] = None,
+) -> FactOutputs:
+    """
+    Renders the Power BI model of the whole contract (TMSL model.bim):
+    every fact, rollup and dimension with its storage mode, and their
+    relationships. Returns output path → content.
+
+    The model spans all facts: `fact_queries` holds the compiled query
+    of every fact (see compile_model_queries).
+    """
+    facts = []
+    rollups = []
+    for query in fact_queries:
+        partitioning = semantic_ir.facts[query.from_table].partitioning
+        refresh_sql = (
+            FactQueryRenderer(query, build_refresh_filter(partitioning)).render()
+            if partitioning is not None
+            else None
+        )
+        facts.append((query, FactQueryRenderer(query).render(), refresh_sql))
+        rollups += [
+            (rollup_query, FactQueryRenderer(rollup_query).render())
+            for rollup_query in build_rollup_queries(semantic_ir, query)
         ]
+
+    catalog = sql.catalog()
+    dimension_columns = {}
+    for dim_name in semantic_ir.dimensions:
+        view = sql.dimension(dim_name).view
+        if catalog is not None and view is not None:
+            dimension_columns[dim_name] = physical_columns(view, catalog)
+
+    model = build_powerbi_model(
+        semantic_ir,
+        facts,
+        rollups,
+        choose_storage_modes(
+            semantic_ir,
+            [query for query, _, _ in facts],
+            [query for query, _ in rollups],
+            statistics,
+        ),
+        dimension_columns=dimension_columns,
+        calendars={
+            dim_name: build_calendar_table(dimension)
+            for dim_name, dimension in semantic_ir.dimensions.items()
+            if dimension.calendar is not None
+        },
+        key_maps={key_map.dimension: key_map for key_map in key_maps or ()},
+    )
+    return {
+        str(OUTPUT_POWERBI_DIR / "model.bim"): TmslModelRenderer(model).render(),
+    }
+
+
+# ---------- Index advice ----------
+
+def advise_indexes(
+    semantic_ir: SemanticModelIR,
+    sql: SqlArtifactCache,
+    fact_queries: Iterable[SqlQuery],
+    materializations: Optional[List[SqlMaterialization]] = None,
+    key_maps: Optional[List[SqlKeyMap]] = None,
+) -> FactOutputs:
+    """
+    Recommends indexes for the whole model from the hand-written views,
+    every compiled fact, partition and rollup query, and the source
+    reads of materialized dimension and key map loads.
+    Returns output path → content (MySQL DDL and a Markdown report).
+
+    Index advice spans all facts: `fact_queries` holds the compiled
+    query of every fact (see compile_model_queries). Nothing is
+    returned when the schema catalog is unavailable.
+    """
+    catalog = sql.catalog()
+    if catalog is None:
+        return {}
+    advisor = IndexAdvisor(catalog)
+
+    artifacts = [sql.dimension(name) for name in semantic_ir.dimensions]
+    artifacts += [sql.fact(name) for name in semantic_ir.facts]
+    for artifact in artifacts:
+        if artifact.view is not None:
+            advisor.add_view(artifact.path, artifact.view)
+
+    for query in fact_queries:
+        fact_name = query.from_table
+        advisor.add_query(str(OUTPUT_SQL_DIR / f"{fact_name}.sql"), query)
+
+        partitioning = semantic_ir.facts[fact_name].partitioning
+        if partitioning is not None:
+            advisor.add_query(
+                str(OUTPUT_SQL_DIR / f"{fact_name}.incremental.sql"),
+                query,
+                range_column=partitioning.column,
+            )
+
+        for rollup_query in build_rollup_queries(semantic_ir, query):
+            advisor.add_query(
+                str(OUTPUT_SQL_DIR / f"{rollup_query.name}.sql"), rollup_query
+            )
+
+    for materialization in materializations or ():
+        advisor.add_materialization(
+            str(OUTPUT_MATERIALIZED_DIR / f"{materialization.dimension}.load.sql"),
+            materialization,
+        )
+
+    for key_map in key_maps or ():
+        advisor.add_key_map(
+            str(OUTPUT_KEYS_DIR / f"{key_map.dimension}.load.sql"), key_map
+        )
+
+    recommendations = advisor.recommend()
+    return {
+        str(OUTPUT_INDEX_DIR / "mysql.sql"):
+            IndexDdlRenderer(recommendations).render(),
+        str(OUTPUT_INDEX_DIR / "report.md"):
+            IndexReportRenderer(recommendations).render(),
+    }
+
+
+def compile_sql(
+    skip_validate: bool = False,
+    force: bool = False,
+    jobs: int = 1,
+    trace: bool = False,
+    profile: bool = False,
+) -> None:
+    """
+    Orchestrates full SQL compilation from semantic model to SQL artifacts.
+
+    The semantic model is parsed once and the same dict is validated
+    in-process and handed to build_ir. `skip_validate` is intended for
+    trusted inner-loop runs on an already-validated contract.
+
+    Compilation is incremental: facts whose inputs are unchanged according
+    to the build manifest are neither recompiled nor rewritten.
+    `force` ignores the manifest and rebuilds every fact.
+    `jobs` > 1 fans the stale facts out to a process pool.
+
+    Dimensions declaring `surrogate_key` get a key map (output/keys/),
+    and facts and rollups carry their integer surrogate keys.
+
+    The Power BI model of all facts, rollups and dimensions is written
+    to output/powerbi/model.bim, with storage modes chosen from the
+    contract's `storage_modes` thresholds.
+
+    Table statistics (stats/tables.yml) are optional; when present,
+    joins are ordered smallest-first and every fact query carries a
+    cost estimate, rendered as a comment.
+
+    `trace` writes per-phase and per-pass timings and allocations as a
+    Chrome trace to output/trace/; `profile` additionally captures a
+    cProfile dump of the same run.
+    """
+
+    tracer = PassTracer(profile=profile) if trace or profile else None
+    validator = Validator()
+    sql_cache = validator.new_cache()
+    hooks = [tracer] if tracer else None
+
+    def phase(name: str):
+        return tracer.span(name) if tracer else nullcontext()
+
+    try:
+        # --- Load semantic model ---
+        with phase("load_model"):
+            semantic_model_dict = load_model(str(SEMANTIC_MODEL_PATH))
+
+        # --- Validate semantic model ---
+        if not skip_validate:
+            with phase("validate"):
+                diagnostics = validator.validate(semantic_model_dict, sql=sql_cache)
+            if diagnostics:
+                for diagnostic in diagnostics:
+                    print(diagnostic)
+                raise RuntimeError("Semantic model validation failed")
+
+        # --- Build Semantic IR ---
+        with phase("build_ir"):
+            semantic_ir = build_ir(semantic_model_dict)
+            statistics = load_statistics(STATS_PATH)
+
+        # --- Select facts whose inputs changed ---
+        with phase("manifest"):
+            manifest = BuildManifest.load(MANIFEST_PATH)
+            manifest.prune(semantic_ir.facts)
+
+            physical = resolve_physical_columns(semantic_ir, sql_cache)
+            source_tables = resolve_source_tables(semantic_ir, sql_cache)
+            input_hashes = {
+                fact_name: fact_input_hash(
+                    semantic_ir, fact_name, COMPILER_VERSION, statistics,
+                    physical, source_tables,
+                )
+                for fact_name in semantic_ir.facts
+            }
+            stale_facts = {
+                fact_name
+                for fact_name, input_hash in input_hashes.items()
+                if force or not manifest.is_fresh(fact_name, input_hash)
+            }
+
+        # --- Build SQL IR ---
+        with phase("build_sql_ir"):
+            sql_queries = [
+                query
+                for query in build_sql_ir_from_semantic(semantic_ir)
+                if query.from_table in stale_facts
+            ]
+
+        # --- SQL compiler pipeline ---
+        with phase("compile_queries"):
+            compiled = compile_queries(
+                semantic_ir,
+                sql_queries,
+                jobs=jobs,
+                hooks=hooks,
+                physical=physical,
+                statistics=statistics,
+                source_tables=source_tables,
+            )
+
+        # --- Write SQL ---
+        with phase("write_outputs"):
+            for fact_name, (_, outputs) in compiled.items():
+                write_outputs(outputs)
+                manifest.record(fact_name, input_hashes[fact_name], outputs)
+
+            manifest.save()
+        compiled_queries = {
+            fact_name: query for fact_name, (query, _) in compiled.items()
+        }
+
+        model_hash = model_input_hash(
+            semantic_ir, input_hashes, COMPILER_VERSION, statistics,
+            model_sources(semantic_ir, sql_cache),
+        )
+
+        # --- Calendar dimensions ---
+        with phase("generate_calendars"):
+            outputs = generate_calendars(semantic_ir)
+            write_outputs(outputs, only_changed=True)
+            manifest.record_model_output(CALENDARS_OUTPUT, model_hash, outputs)
+
+        # --- Dimension materialization ---
+        with phase("materialize_dimensions"):
+            materializations = build_materializations(semantic_ir, sql_cache)
+            outputs = materialize_dimensions(materializations)
+            write_outputs(outputs, only_changed=True)
+            manifest.record_model_output(
+                MATERIALIZATIONS_OUTPUT, model_hash, outputs
+            )
+
+        # --- Surrogate key maps ---
+        with phase("generate_key_maps"):
+            key_maps = build_key_maps(semantic_ir, sql_cache)
+            outputs = generate_key_maps(key_maps)
+            write_outputs(outputs, only_changed=True)
+            manifest.record_model_output(KEY_MAPS_OUTPUT, model_hash, outputs)
+            manifest.save()
+
+        # --- Outputs spanning the whole model ---
+        # Rebuilt only when an input of any fact, dimension, rollup or
+        # the statistics changed; all of them share one compiled IR
+        model_queries: Optional[Dict[str, SqlQuery]] = None
+
+        # --- Power BI model ---
+        with phase("generate_powerbi_model"):
+            if force or not manifest.is_model_output_fresh(
+                POWERBI_MODEL_OUTPUT, model_hash
+            ):
+                model_queries = compile_model_queries(
+                    semantic_ir,
+                    physical,
+                    statistics,
+                    hooks,
+                    compiled=compiled_queries,
+                    jobs=jobs,
+                    source_tables=source_tables,
+                )
+                outputs = generate_powerbi_model(
+                    semantic_ir,
+                    sql_cache,
+                    model_queries.values(),
+                    statistics,
+                    key_maps,
+                )
+                write_outputs(outputs, only_changed=True)
+                manifest.record_model_output(
+                    POWERBI_MODEL_OUTPUT, model_hash, outputs
+                )
+                manifest.save()
+
+        # --- Index advice ---
+        with phase("advise_indexes"):
+            if force or not manifest.is_model_output_fresh(
+                INDEX_ADVICE_OUTPUT, model_hash
+            ):
+                if model_queries is None:
+                    model_queries = compile_model_queries(
+                        semantic_ir,
+                        physical,
+                        statistics,
+                        hooks,
+                        compiled=compiled_queries,
+                        jobs=jobs,
+                        source_tables=source_tables,
+                    )
+                outputs = advise_indexes(
+                    semantic_ir,
+                    sql_cache,
+                    model_queries.values(),
+                    materializations,
+                    key_maps,
+                )
+                write_outputs(outputs, only_changed=True)
+                manifest.record_model_output(
+                    INDEX_ADVICE_OUTPUT, model_hash, outputs
+                )
+                manifest.save()
+
+        print(
+            f"Compiled {len(sql_queries)} fact(s), "
+            f"{len(semantic_ir.facts) - len(sql_queries)} unchanged"
+        )
+    finally:
+        if tracer:
+            tracer.close()
+            tracer.write_chrome_trace(TRACE_PATH)
+            tracer.write_profile(PROFILE_PATH)
+            for pass_name, totals in tracer.summary().items():
+                print(
+                    f"  {pass_name}: {totals['ms']:.2f} ms "
+                    f"over {totals['calls']:.0f} call(s)"
+                )
+            print(f"Trace written to {TRACE_PATH}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Compile SQL artifacts from the semantic model."
+    )
+    parser.add_argument(
+        "--skip-validate",
+        action="store_true",
+        help="skip semantic validation (trusted inner-loop runs only)",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="ignore the build manifest and recompile every fact",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="number of worker processes for fact compilation (default: 1)",
+    )
+    parser.add_argument(
+        "--trace",
+        action="store_true",
+        help="write per-pass timings and allocations as a Chrome trace",
     )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="also capture a cProfile dump of the run (implies --trace)",
+    )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="keep state warm and recompile affected facts on every change",
+    )
+    args = parser.parse_args()
 
-    # --- Render & write SQL ---
-    OUTPUT_SQL_DIR.mkdir(parents=True, exist_ok=True)
+    if args.watch:
+        if args.trace or args.profile:
+            parser.error("--trace and --profile cannot be combined with --watch")
 
-    for query in sql_queries:
-        compiled_query = pipeline.run(query)
-        renderer = FactQueryRenderer(compiled_query)
-        sql = renderer.render()
+        from compiler.sql.coordinator.watch import WatchSession
 
-        output_path = OUTPUT_SQL_DIR / f"{compiled_query.from_table}.sql"
-        output_path.write_text(sql)
+        WatchSession(
+            skip_validate=args.skip_validate,
+            force=args.force,
+            jobs=args.jobs,
+        ).run()
+        return
+
+    compile_sql(
+        skip_validate=args.skip_validate,
+        force=args.force,
+        jobs=args.jobs,
+        trace=args.trace,
+        profile=args.profile,
+    )
 
 
 if __name__ == "__main__":
-    compile_sql()
\ No newline at end of file
+    main()
@@ -0,0 +1,217 @@
+import hashlib
+import json
+import os
+from dataclasses import asdict
+from pathlib import Path
+from typing import Dict, Iterable, Mapping, Optional
+
+from compiler.runtime.ir import SemanticModelIR
+from compiler.sql.cost.statistics import Statistics
+from validation.schema_catalog import Column
+
+
+MANIFEST_FORMAT = 1
+
+
+def content_hash(content: str) -> str:
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+def fact_input_hash(
+    semantic_ir: SemanticModelIR,
+    fact_name: str,
+    compiler_version: str,
+    statistics: Optional[Statistics] = None,
+    physical: Optional[Mapping[str, Mapping[str, Column]]] = None,
+    source_tables: Optional[Mapping[str, str]] = None,
+) -> str:
+    """
+    Hash of everything that determines a fact's compiled output:
+    the fact definition, the dimensions its foreign keys reference,
+    the rollups derived from it, the statistics of those tables and
+    of the fact's source table, the physical types of its columns and
+    the compiler version.
+    """
+    fact = semantic_ir.facts[fact_name]
+
+    referenced_dimensions = {}
+    for fk in fact.foreign_keys:
+        dim = semantic_ir.dimension_for_key(fk)
+        if dim is not None:
+            referenced_dimensions[dim.name] = asdict(dim)
+
+    payload = {
+        "compiler_version": compiler_version,
+        "fact": asdict(fact),
+        "dimensions": referenced_dimensions,
+        "rollups": [asdict(r) for r in semantic_ir.rollups_for(fact_name)],
+    }
+    if statistics is not None:
+        source_table = (source_tables or {}).get(fact_name)
+        payload["statistics"] = statistics.subset(
+            [fact_name, *referenced_dimensions]
+            + ([source_table] if source_table else [])
+        )
+    if physical is not None and fact_name in physical:
+        payload["physical"] = {
+            name: asdict(column)
+            for name, column in physical[fact_name].items()
+        }
+    return content_hash(json.dumps(payload, sort_keys=True))
+
+
+def model_input_hash(
+    semantic_ir: SemanticModelIR,
+    fact_hashes: Mapping[str, str],
+    compiler_version: str,
+    statistics: Optional[Statistics] = None,
+    sources: Optional[Mapping[str, Optional[str]]] = None,
+) -> str:
+    """
+    Hash of everything that determines the outputs spanning the whole
+    model (Power BI model, index advice): the input hash of every fact,
+    every dimension and rollup, the storage mode thresholds, all
+    statistics, the hand-written SQL and schema they read (`sources`:
+    name → content) and the compiler version.
+    """
+    payload = {
+        "compiler_version": compiler_version,
+        "facts": dict(fact_hashes),
+        "dimensions": {
+            name: asdict(dim) for name, dim in semantic_ir.dimensions.items()
+        },
+        "rollups": {
+            name: asdict(rollup) for name, rollup in semantic_ir.rollups.items()
+        },
+        "storage_modes": asdict(semantic_ir.storage_modes),
+        "statistics": statistics.to_dict() if statistics is not None else None,
+        "sources": dict(sources or {}),
+    }
+    return content_hash(json.dumps(payload, sort_keys=True))
+
+
+def _remove_outputs(output_paths: Iterable[str]) -> None:
+    for output_path in sorted(output_paths):
+        try:
+            os.remove(output_path)
+        except FileNotFoundError:
+            pass
+
+
+def _is_fresh(entry: Optional[dict], input_hash: str) -> bool:
+    if not entry or entry.get("input_hash") != input_hash:
+        return False
+
+    for output_path, output_hash in entry.get("outputs", {}).items():
+        try:
+            current = Path(output_path).read_text()
+        except OSError:
+            return False
+        if content_hash(current) != output_hash:
+            return False
+
+    return True
+
+
+def _entry(
+    previous: Optional[dict],
+    input_hash: str,
+    outputs: Dict[str, str],
+) -> dict:
+    # Outputs recorded earlier but no longer produced are deleted
+    _remove_outputs(set((previous or {}).get("outputs", {})) - set(outputs))
+    return {
+        "input_hash": input_hash,
+        "outputs": {
+            path: content_hash(content)
+            for path, content in sorted(outputs.items())
+        },
+    }
+
+
+class BuildManifest:
+    """
+    Records, per fact, the input hash it was compiled from and the
+    hash of every output file written for it; likewise for each output
+    spanning the whole model (see model_input_hash).
+
+    A fact (or model output) is fresh when its input hash is unchanged
+    and all of its recorded outputs still exist with the recorded
+    content.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        facts: Optional[Dict[str, dict]] = None,
+        model_outputs: Optional[Dict[str, dict]] = None,
+    ):
+        self.path = path
+        self.facts: Dict[str, dict] = facts or {}
+        self.model_outputs: Dict[str, dict] = model_outputs or {}
+
+    @classmethod
+    def load(cls, path: Path) -> "BuildManifest":
+        try:
+            data = json.loads(path.read_text())
+        except (OSError, ValueError):
+            return cls(path)
+
+        if not isinstance(data, dict) or data.get("format") != MANIFEST_FORMAT:
+            return cls(path)
+
+        return cls(path, data.get("facts", {}), data.get("model_outputs", {}))
+
+    def is_fresh(self, fact_name: str, input_hash: str) -> bool:
+        return _is_fresh(self.facts.get(fact_name), input_hash)
+
+    def is_model_output_fresh(self, name: str, input_hash: str) -> bool:
+        return _is_fresh(self.model_outputs.get(name), input_hash)
+
+    def record(
+        self,
+        fact_name: str,
+        input_hash: str,
+        outputs: Dict[str, str],
+    ) -> None:
+        """
+        outputs: output path → rendered content
+
+        Outputs recorded for the fact earlier but no longer produced
+        (e.g. a removed rollup) are deleted.
+        """
+        self.facts[fact_name] = _entry(
+            self.facts.get(fact_name), input_hash, outputs
+        )
+
+    def record_model_output(
+        self,
+        name: str,
+        input_hash: str,
+        outputs: Dict[str, str],
+    ) -> None:
+        """
+        Like record, for an output spanning the whole model.
+        """
+        self.model_outputs[name] = _entry(
+            self.model_outputs.get(name), input_hash, outputs
+        )
+
+    def prune(self, known_facts: Iterable[str]) -> None:
+        """
+        Drops entries (and generated outputs) of facts no longer in the model.
+        """
+        known = set(known_facts)
+        for fact_name in sorted(set(self.facts) - known):
+            _remove_outputs(self.facts.pop(fact_name).get("outputs", {}))
+
+    def save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        data = {
+            "format": MANIFEST_FORMAT,
+            "facts": dict(sorted(self.facts.items())),
+            "model_outputs": dict(sorted(self.model_outputs.items())),
+        }
+        tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+        tmp_path.write_text(json.dumps(data, indent=2, sort_keys=True) + "\n")
+        os.replace(tmp_path, self.path)
@@ -0,0 +1,209 @@
+import argparse
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from compiler.builders.ir_builder import build_ir
+from compiler.runtime.immutable import FrozenDict
+from compiler.runtime.ir import SemanticModelIR
+from compiler.sql.cost.profiler import (
+    DEFAULT_CHUNK_BYTES,
+    TableProfile,
+    profile_csv,
+)
+from compiler.sql.cost.statistics import (
+    STATS_PATH,
+    RangeValue,
+    Statistics,
+    TableStatistics,
+    dump_statistics,
+    load_statistics,
+)
+from compiler.sql.coordinator.compile import SEMANTIC_MODEL_PATH
+from validation.engine import SqlArtifactCache, load_model
+from validation.sql_index import SqlView
+
+
+DEFAULT_TABLE = "sales_data"
+
+
+def contract_views(
+    semantic_ir: SemanticModelIR,
+    sql: SqlArtifactCache,
+    table: str,
+) -> Dict[str, SqlView]:
+    """
+    Hand-written fact and dimension views reading only `table`:
+    contract table → view. Calendar dimensions have no view.
+    """
+    artifacts = [(name, sql.fact(name)) for name in semantic_ir.facts]
+    artifacts += [(name, sql.dimension(name)) for name in semantic_ir.dimensions]
+
+    views = {}
+    for name, artifact in artifacts:
+        view = artifact.view
+        if view is not None and view.tables == (table.lower(),):
+            views[name] = view
+    return views
+
+
+def _row_key(view: SqlView) -> Optional[Tuple[str, ...]]:
+    """
+    Source columns whose distinct tuples are the rows of the view:
+    its GROUP BY, or every column of a SELECT DISTINCT; None when each
+    source row is a view row.
+    """
+    if view.group_by:
+        return tuple(sorted(view.group_by))
+    if view.distinct:
+        columns = []
+        for projection in view.projections:
+            columns += [c for c in projection.columns if c not in columns]
+        return tuple(columns)
+    return None
+
+
+def _aggregate_range(
+    aggregate: str,
+    value_range: Optional[Tuple[RangeValue, RangeValue]],
+    source_rows: int,
+) -> Optional[Tuple[RangeValue, RangeValue]]:
+    """
+    Range of an aggregate over groups of at most `source_rows` rows.
+
+    SUM keeps the per-row range of the summed column, like every range
+    in the statistics file: NarrowColumnTypesPass scales it by the row
+    count itself.
+    """
+    if aggregate == "count":
+        return 0, source_rows
+    if value_range is None:
+        return None
+    if aggregate in ("min", "max", "avg"):
+        return value_range
+    if aggregate != "sum" or isinstance(value_range[0], str):
+        return None
+    return value_range
+
+
+def view_statistics(profile: TableProfile, view: SqlView) -> TableStatistics:
+    """
+    Statistics of a view over the profiled table, ignoring its WHERE
+    predicate (an upper bound for filtered views).
+
+    - rows: distinct GROUP BY / DISTINCT tuples, else the source rows
+    - columns reading one source column: its distinct count and range
+    - aggregated columns: ranges that hold for any group, per row for
+      SUM (no distinct)
+    """
+    key = _row_key(view)
+    rows = profile.key_distinct(key) if key is not None else profile.rows
+
+    distinct = {}
+    ranges = {}
+    for projection in view.projections:
+        if len(projection.columns) != 1:
+            continue
+        source = profile.columns.get(projection.columns[0])
+        if source is None:
+            continue
+
+        if projection.aggregate is None:
+            distinct[projection.alias] = min(rows, source.distinct)
+            value_range = source.range
+        else:
+            value_range = _aggregate_range(
+                projection.aggregate, source.range, profile.rows
+            )
+        if value_range is not None:
+            ranges[projection.alias] = value_range
+
+    return TableStatistics(
+        rows=rows,
+        distinct=FrozenDict(distinct),
+        ranges=FrozenDict(ranges),
+    )
+
+
+def source_statistics(profile: TableProfile) -> TableStatistics:
+    distinct = {}
+    ranges = {}
+    null_fractions = {}
+    for name, column in profile.columns.items():
+        distinct[name] = column.distinct
+        null_fractions[name] = round(column.null_fraction, 6)
+        if column.range is not None:
+            ranges[name] = column.range
+
+    return TableStatistics(
+        rows=profile.rows,
+        distinct=FrozenDict(distinct),
+        ranges=FrozenDict(ranges),
+        null_fractions=FrozenDict(null_fractions),
+    )
+
+
+def profile_table(
+    csv_path: Path,
+    table: str = DEFAULT_TABLE,
+    chunk_bytes: int = DEFAULT_CHUNK_BYTES,
+    stats_path: Path = STATS_PATH,
+) -> Statistics:
+    """
+    Profiles a CSV extract of a source table and merges its statistics,
+    and those of the contract's facts and dimensions reading it, into
+    the statistics file. Statistics of other tables are kept.
+
+    Returns the statistics of the profiled tables.
+    """
+    semantic_ir = build_ir(load_model(str(SEMANTIC_MODEL_PATH)))
+    views = contract_views(semantic_ir, SqlArtifactCache(), table)
+    keys = {key for key in map(_row_key, views.values()) if key is not None}
+
+    profile = profile_csv(csv_path, sorted(keys), chunk_bytes)
+
+    profiled = {table.lower(): source_statistics(profile)}
+    for name, view in views.items():
+        profiled[name.lower()] = view_statistics(profile, view)
+
+    existing = load_statistics(stats_path)
+    tables = dict(existing.tables) if existing is not None else {}
+    tables.update(profiled)
+    dump_statistics(Statistics(tables=FrozenDict(tables)), stats_path)
+
+    return Statistics(tables=FrozenDict(profiled))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Profile a CSV extract of a source table into table statistics."
+        )
+    )
+    parser.add_argument("csv", type=Path, help="CSV extract with a header row")
+    parser.add_argument(
+        "--table",
+        default=DEFAULT_TABLE,
+        help=f"source table the extract holds (default: {DEFAULT_TABLE})",
+    )
+    parser.add_argument(
+        "--chunk-bytes",
+        type=int,
+        default=DEFAULT_CHUNK_BYTES,
+        help="bytes read per chunk (default: 64 MiB)",
+    )
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=STATS_PATH,
+        help=f"statistics file to update (default: {STATS_PATH})",
+    )
+    args = parser.parse_args()
+
+    statistics = profile_table(args.csv, args.table, args.chunk_bytes, args.output)
+    print(f"Profiled {args.csv} into {args.output}")
+    for name in sorted(statistics.tables):
+        print(f"  {name}: {statistics.tables[name].rows:,} rows")
+
+
+if __name__ == "__main__":
+    main()
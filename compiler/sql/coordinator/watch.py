@@ -0,0 +1,343 @@
+import os
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Optional, Set, Tuple
+
+from compiler.builders.ir_builder import build_ir
+from compiler.runtime.ir import SemanticModelIR
+from compiler.sql.builders.sql_ir_builder import build_sql_ir_from_semantic
+from compiler.sql.cost.statistics import (
+    STATS_PATH,
+    Statistics,
+    StatisticsLoadError,
+    load_statistics,
+)
+from compiler.sql.coordinator.compile import (
+    CALENDARS_OUTPUT,
+    COMPILER_VERSION,
+    INDEX_ADVICE_OUTPUT,
+    KEY_MAPS_OUTPUT,
+    MATERIALIZATIONS_OUTPUT,
+    MANIFEST_PATH,
+    POWERBI_MODEL_OUTPUT,
+    SEMANTIC_MODEL_PATH,
+    PhysicalColumns,
+    SourceTables,
+    advise_indexes,
+    build_key_maps,
+    build_materializations,
+    compile_model_queries,
+    compile_queries,
+    generate_calendars,
+    generate_key_maps,
+    generate_powerbi_model,
+    materialize_dimensions,
+    model_sources,
+    resolve_physical_columns,
+    resolve_source_tables,
+    write_outputs,
+)
+from compiler.sql.coordinator.manifest import (
+    BuildManifest,
+    fact_input_hash,
+    model_input_hash,
+)
+from compiler.sql.runtime.ir import SqlQuery
+from validation.engine import (
+    DIM_SQL_DIR,
+    FACT_SQL_DIR,
+    ModelLoadError,
+    Validator,
+    load_model,
+)
+
+
+Snapshot = Dict[str, Tuple[int, int]]
+
+
+def log(message: str) -> None:
+    print(f"[{datetime.now():%H:%M:%S}] {message}", flush=True)
+
+
+class WatchSession:
+    """
+    Long-lived compile session that keeps the parsed model, the parsed
+    SQL artifacts and the IR in memory between rebuilds.
+
+    The source tree (model, SQL views, physical schema and table
+    statistics) is polled by mtime and size (no extra dependencies).
+    On change, only modified SQL files are re-parsed, validation runs
+    against the warm artifact cache, and only facts whose input hash
+    changed are recompiled and rewritten. Compiled fact queries stay in
+    memory, so outputs spanning the whole model (Power BI model, index
+    advice) are rebuilt from them, and only when the model's inputs
+    changed.
+
+    `skip_validate`, `force` and `jobs` mean what they mean for
+    compile_sql; `force` applies to the first build only.
+    """
+
+    def __init__(
+        self,
+        model_path: Path = SEMANTIC_MODEL_PATH,
+        sql_dirs: Tuple[str, ...] = (FACT_SQL_DIR, DIM_SQL_DIR),
+        skip_validate: bool = False,
+        force: bool = False,
+        jobs: int = 1,
+    ):
+        self.model_path = model_path
+        self.sql_dirs = sql_dirs
+        self.skip_validate = skip_validate
+        self.force = force
+        self.jobs = jobs
+
+        self.validator = Validator()
+        self.sql_cache = self.validator.new_cache()
+        self.manifest = BuildManifest.load(MANIFEST_PATH)
+
+        self.model: Optional[dict] = None
+        self.semantic_ir: Optional[SemanticModelIR] = None
+        self.statistics: Optional[Statistics] = None
+        self.physical: PhysicalColumns = {}
+        self.source_tables: SourceTables = {}
+        self.compiled_hashes: Dict[str, str] = {}
+        # Compiled query of facts compiled in this session, by fact name
+        self.compiled_queries: Dict[str, SqlQuery] = {}
+        self.snapshot: Snapshot = {}
+
+    # ---------- change detection ----------
+
+    def scan(self) -> Snapshot:
+        snapshot: Snapshot = {}
+        paths = [str(self.model_path), self.sql_cache.schema_path, str(STATS_PATH)]
+        for root in self.sql_dirs:
+            for directory, _, files in os.walk(root):
+                paths.extend(
+                    os.path.join(directory, name)
+                    for name in files
+                    if name.endswith(".sql")
+                )
+
+        for path in paths:
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                continue
+            snapshot[path] = (stat.st_mtime_ns, stat.st_size)
+        return snapshot
+
+    def poll(self) -> Set[str]:
+        current = self.scan()
+        changed = {
+            path
+            for path in current.keys() | self.snapshot.keys()
+            if current.get(path) != self.snapshot.get(path)
+        }
+        self.snapshot = current
+        return changed
+
+    # ---------- rebuild ----------
+
+    def rebuild(self, changed: Set[str]) -> None:
+        """
+        Rebuilds after `changed` paths changed. A failing rebuild is
+        logged and watching continues: outputs it did not reach keep
+        their previous content, and the IR is rebuilt on the next change
+        so no half-updated state survives.
+        """
+        try:
+            self._rebuild(changed)
+        except Exception as e:
+            self.semantic_ir = None
+            log(f"FAIL: {type(e).__name__}: {e}")
+            log("rebuild failed; still watching")
+
+    def _rebuild(self, changed: Set[str]) -> None:
+        started = time.perf_counter()
+        model_changed = self.model is None or str(self.model_path) in changed
+
+        for path in changed:
+            self.sql_cache.invalidate(path)
+
+        if model_changed:
+            try:
+                self.model = load_model(str(self.model_path))
+            except ModelLoadError as e:
+                log(f"FAIL: {e}")
+                self.model = None
+                return
+
+        diagnostics = []
+        if not self.skip_validate:
+            diagnostics = self.validator.validate(self.model, sql=self.sql_cache)
+        if diagnostics:
+            for diagnostic in diagnostics:
+                log(str(diagnostic))
+            log(f"{len(diagnostics)} validation error(s); outputs not updated")
+            return
+
+        if model_changed or self.semantic_ir is None:
+            self.semantic_ir = build_ir(self.model)
+
+        if model_changed or str(STATS_PATH) in changed:
+            try:
+                self.statistics = load_statistics(STATS_PATH)
+            except StatisticsLoadError as e:
+                log(f"FAIL: {e}")
+                return
+
+        recompiled = self.recompile()
+        model_hash = model_input_hash(
+            self.semantic_ir, self.compiled_hashes, COMPILER_VERSION,
+            self.statistics, model_sources(self.semantic_ir, self.sql_cache),
+        )
+
+        if model_changed:
+            outputs = generate_calendars(self.semantic_ir)
+            write_outputs(outputs, only_changed=True)
+            self.manifest.record_model_output(CALENDARS_OUTPUT, model_hash, outputs)
+        materializations = build_materializations(self.semantic_ir, self.sql_cache)
+        outputs = materialize_dimensions(materializations)
+        write_outputs(outputs, only_changed=True)
+        self.manifest.record_model_output(
+            MATERIALIZATIONS_OUTPUT, model_hash, outputs
+        )
+        key_maps = build_key_maps(self.semantic_ir, self.sql_cache)
+        outputs = generate_key_maps(key_maps)
+        write_outputs(outputs, only_changed=True)
+        self.manifest.record_model_output(KEY_MAPS_OUTPUT, model_hash, outputs)
+        self.manifest.save()
+
+        if self.force or not self.manifest.is_model_output_fresh(
+            POWERBI_MODEL_OUTPUT, model_hash
+        ):
+            outputs = generate_powerbi_model(
+                self.semantic_ir,
+                self.sql_cache,
+                self.model_queries().values(),
+                self.statistics,
+                key_maps,
+            )
+            write_outputs(outputs, only_changed=True)
+            self.manifest.record_model_output(
+                POWERBI_MODEL_OUTPUT, model_hash, outputs
+            )
+            self.manifest.save()
+
+        if self.force or not self.manifest.is_model_output_fresh(
+            INDEX_ADVICE_OUTPUT, model_hash
+        ):
+            outputs = advise_indexes(
+                self.semantic_ir,
+                self.sql_cache,
+                self.model_queries().values(),
+                materializations,
+                key_maps,
+            )
+            write_outputs(outputs, only_changed=True)
+            self.manifest.record_model_output(
+                INDEX_ADVICE_OUTPUT, model_hash, outputs
+            )
+            self.manifest.save()
+
+        self.force = False
+
+        elapsed = (time.perf_counter() - started) * 1000
+        verb = "applied" if self.skip_validate else "validated"
+        log(
+            f"{verb} {len(changed)} change(s), recompiled "
+            f"{recompiled} fact(s) in {elapsed:.1f} ms"
+        )
+
+    def model_queries(self) -> Dict[str, SqlQuery]:
+        """
+        Compiled query of every fact, compiling only those not compiled
+        in this session yet (fresh on disk at startup).
+        """
+        self.compiled_queries = compile_model_queries(
+            self.semantic_ir,
+            self.physical,
+            self.statistics,
+            compiled=self.compiled_queries,
+            jobs=self.jobs,
+            source_tables=self.source_tables,
+        )
+        return self.compiled_queries
+
+    def recompile(self) -> int:
+        semantic_ir = self.semantic_ir
+
+        physical = resolve_physical_columns(semantic_ir, self.sql_cache)
+        source_tables = resolve_source_tables(semantic_ir, self.sql_cache)
+        self.physical = physical
+        self.source_tables = source_tables
+        input_hashes = {
+            fact_name: fact_input_hash(
+                semantic_ir, fact_name, COMPILER_VERSION, self.statistics,
+                physical, source_tables,
+            )
+            for fact_name in semantic_ir.facts
+        }
+
+        if not self.compiled_hashes and not self.force:
+            # First build: trust outputs that the manifest proves current
+            self.compiled_hashes = {
+                fact_name: input_hash
+                for fact_name, input_hash in input_hashes.items()
+                if self.manifest.is_fresh(fact_name, input_hash)
+            }
+
+        affected = {
+            fact_name
+            for fact_name, input_hash in input_hashes.items()
+            if self.compiled_hashes.get(fact_name) != input_hash
+        }
+        removed = self.compiled_hashes.keys() - input_hashes.keys()
+        for fact_name in affected | removed:
+            self.compiled_queries.pop(fact_name, None)
+
+        if not affected and not removed:
+            return 0
+
+        queries = [
+            query
+            for query in build_sql_ir_from_semantic(semantic_ir)
+            if query.from_table in affected
+        ]
+        compiled = compile_queries(
+            semantic_ir,
+            queries,
+            jobs=self.jobs,
+            physical=physical,
+            statistics=self.statistics,
+            source_tables=source_tables,
+        )
+
+        for fact_name, (compiled_query, outputs) in compiled.items():
+            write_outputs(outputs)
+            self.manifest.record(fact_name, input_hashes[fact_name], outputs)
+            self.compiled_queries[fact_name] = compiled_query
+
+        self.manifest.prune(semantic_ir.facts)
+        self.manifest.save()
+
+        self.compiled_hashes = input_hashes
+        return len(queries)
+
+    # ---------- loop ----------
+
+    def run(self, interval: float = 0.25) -> None:
+        log(f"watching {self.model_path} and {', '.join(self.sql_dirs)}")
+        self.rebuild(self.poll())
+
+        try:
+            while True:
+                time.sleep(interval)
+                changed = self.poll()
+                if changed:
+                    for path in sorted(changed):
+                        log(f"changed: {path}")
+                    self.rebuild(changed)
+        except KeyboardInterrupt:
+            log("stopped")
@@ -0,0 +1,179 @@
+import math
+from typing import Iterable, List, Optional, Sequence
+
+try:
+    import numpy as np
+except ImportError:  # pure-Python fallback with identical results
+    np = None
+
+
+PRECISION = 14
+REGISTERS = 1 << PRECISION
+
+# Hashes are 64-bit: the top PRECISION bits pick a register, the rank
+# is the position of the first 1 bit in the remaining ones
+_REMAINDER_BITS = 64 - PRECISION
+_REMAINDER_MASK = (1 << _REMAINDER_BITS) - 1
+_MAX_RANK = _REMAINDER_BITS + 1
+_MASK64 = (1 << 64) - 1
+
+_SEED = 0x9E3779B97F4A7C15
+_MIX_1 = 0xBF58476D1CE4E5B9
+_MIX_2 = 0x94D049BB133111EB
+
+# Hash of NULL inside composite keys (GROUP BY / DISTINCT count NULL
+# as one value); NULL never counts towards a single column
+NULL_HASH = 0x6A09E667F3BCC908
+
+
+def _mix(h: int) -> int:
+    # splitmix64 finalizer
+    h ^= h >> 30
+    h = (h * _MIX_1) & _MASK64
+    h ^= h >> 27
+    h = (h * _MIX_2) & _MASK64
+    return h ^ (h >> 31)
+
+
+def hash_value(value: str) -> int:
+    """
+    Deterministic 64-bit hash of a string, independent of
+    PYTHONHASHSEED: code points are mixed two per 64-bit lane, then
+    the length.
+    """
+    h = _SEED
+    for i in range(0, len(value), 2):
+        lane = ord(value[i])
+        if i + 1 < len(value):
+            lane |= ord(value[i + 1]) << 32
+        h = _mix(h ^ lane)
+    return _mix(h ^ len(value))
+
+
+def combine_hashes(hashes: Sequence[int]) -> int:
+    """
+    Order-sensitive hash of a tuple of value hashes (composite keys).
+    """
+    h = _SEED
+    for value_hash in hashes:
+        h = _mix(h ^ value_hash)
+    return h
+
+# ---------- NumPy ----------
+
+def _mix_array(h: "np.ndarray") -> "np.ndarray":
+    h = h ^ (h >> np.uint64(30))
+    h *= np.uint64(_MIX_1)
+    h ^= h >> np.uint64(27)
+    h *= np.uint64(_MIX_2)
+    return h ^ (h >> np.uint64(31))
+
+
+def hash_array(values: "np.ndarray") -> "np.ndarray":
+    """
+    hash_value of every element of a NumPy unicode array, as uint64.
+
+    The array's fixed-width UTF-32 storage is read as code point lanes;
+    lanes past each value's length (padding) are not mixed, so a hash
+    does not depend on the widest value of the array.
+    """
+    count = len(values)
+    width = values.dtype.itemsize // 4
+    lengths = np.char.str_len(values)
+    codes = np.ascontiguousarray(values).view(np.uint32).reshape(count, width)
+
+    h = np.full(count, _SEED, dtype=np.uint64)
+    for i in range(0, width, 2):
+        lane = codes[:, i].astype(np.uint64)
+        if i + 1 < width:
+            lane |= codes[:, i + 1].astype(np.uint64) << np.uint64(32)
+        h = np.where(i < lengths, _mix_array(h ^ lane), h)
+    return _mix_array(h ^ lengths.astype(np.uint64))
+
+
+def combine_hash_arrays(arrays: Sequence["np.ndarray"]) -> "np.ndarray":
+    """
+    combine_hashes of every row of the given hash arrays.
+    """
+    h = np.full(len(arrays[0]), _SEED, dtype=np.uint64)
+    for value_hashes in arrays:
+        h = _mix_array(h ^ value_hashes)
+    return h
+
+# ---------- SKETCH ----------
+
+class HyperLogLog:
+    """
+    Fixed-size (REGISTERS bytes) estimate of the number of distinct
+    hashes added, with a standard error of about 1.04 / sqrt(REGISTERS)
+    (0.8 %). Small cardinalities use linear counting.
+
+    Uses NumPy when it is installed; both paths give identical counts.
+    """
+
+    __slots__ = ("registers",)
+
+    def __init__(self):
+        if np is not None:
+            self.registers = np.zeros(REGISTERS, dtype=np.uint8)
+        else:
+            self.registers = bytearray(REGISTERS)
+
+    def add_hashes(self, hashes) -> None:
+        """
+        hashes: uint64 NumPy array (with NumPy), else ints
+        """
+        if np is not None:
+            hashes = np.asarray(hashes, dtype=np.uint64)
+            index = (hashes >> np.uint64(_REMAINDER_BITS)).astype(np.intp)
+            remainder = hashes & np.uint64(_REMAINDER_MASK)
+            # The remainder fits a double's mantissa exactly: frexp's
+            # exponent is its bit length (0 for 0)
+            bit_length = np.frexp(remainder.astype(np.float64))[1]
+            rank = (_MAX_RANK - bit_length).astype(np.uint8)
+            np.maximum.at(self.registers, index, rank)
+            return
+
+        registers = self.registers
+        for h in hashes:
+            index = h >> _REMAINDER_BITS
+            rank = _MAX_RANK - (h & _REMAINDER_MASK).bit_length()
+            if rank > registers[index]:
+                registers[index] = rank
+
+    def merge(self, other: "HyperLogLog") -> None:
+        if np is not None:
+            np.maximum(self.registers, other.registers, out=self.registers)
+        else:
+            self.registers = bytearray(map(max, self.registers, other.registers))
+
+    def _histogram(self) -> List[int]:
+        if np is not None:
+            return np.bincount(self.registers, minlength=_MAX_RANK + 1).tolist()
+        histogram = [0] * (_MAX_RANK + 1)
+        for rank in self.registers:
+            histogram[rank] += 1
+        return histogram
+
+    def cardinality(self) -> int:
+        # Summing per rank keeps the estimate identical across paths
+        histogram = self._histogram()
+        harmonic = math.fsum(
+            count * 2.0 ** -rank for rank, count in enumerate(histogram)
+        )
+        alpha = 0.7213 / (1 + 1.079 / REGISTERS)
+        estimate = alpha * REGISTERS * REGISTERS / harmonic
+
+        empty = histogram[0]
+        if estimate <= 2.5 * REGISTERS and empty:
+            estimate = REGISTERS * math.log(REGISTERS / empty)
+        return int(round(estimate))
+
+
+def count_distinct(values: Iterable[Optional[str]]) -> int:
+    """
+    Estimated number of distinct non-NULL values.
+    """
+    sketch = HyperLogLog()
+    sketch.add_hashes([hash_value(v) for v in values if v is not None])
+    return sketch.cardinality()
@@ -0,0 +1,63 @@
+import math
+from typing import Optional
+
+# Power BI (VertiPaq) column types, as named in TMSL
+POWERBI_INT64 = "int64"
+POWERBI_DECIMAL = "decimal"  # fixed decimal: int64 scaled by 10^4
+POWERBI_DOUBLE = "double"
+POWERBI_DATE = "date"
+POWERBI_DATETIME = "dateTime"
+POWERBI_STRING = "string"
+
+INT64_MIN = -(2 ** 63)
+INT64_MAX = 2 ** 63 - 1
+
+FIXED_DECIMAL_SCALE = 4
+FIXED_DECIMAL_MAX = INT64_MAX / 10 ** FIXED_DECIMAL_SCALE
+
+# Types whose values VertiPaq can store as offsets from a base value
+VALUE_ENCODED_TYPES = frozenset({POWERBI_INT64, POWERBI_DECIMAL})
+
+# Dictionary bytes per distinct value; strings are unknown
+VALUE_WIDTHS = {
+    POWERBI_INT64: 8,
+    POWERBI_DECIMAL: 8,
+    POWERBI_DOUBLE: 8,
+    POWERBI_DATE: 8,
+    POWERBI_DATETIME: 8,
+}
+
+
+def _bits(values: int) -> int:
+    return max(1, math.ceil(math.log2(max(values, 1))))
+
+
+def column_bytes(
+    powerbi_type: str,
+    rows: int,
+    distinct: Optional[int] = None,
+    span: Optional[int] = None,
+) -> Optional[int]:
+    """
+    Estimated in-memory size of an imported column, before run-length
+    compression (which depends on sort order).
+
+    - hash encoding: a dictionary of `distinct` values plus one
+      dictionary index per row
+    - value encoding (whole and fixed decimal numbers only): one offset
+      per row wide enough for `span`, the number of representable
+      values between min and max
+
+    VertiPaq picks the smaller encoding. None when neither can be
+    estimated.
+    """
+    sizes = []
+
+    width = VALUE_WIDTHS.get(powerbi_type)
+    if distinct is not None and width is not None:
+        sizes.append(distinct * width + math.ceil(rows * _bits(distinct) / 8))
+
+    if span is not None and powerbi_type in VALUE_ENCODED_TYPES:
+        sizes.append(math.ceil(rows * _bits(span + 1) / 8))
+
+    return min(sizes) if sizes else None
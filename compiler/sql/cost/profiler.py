@@ -0,0 +1,325 @@
+import csv
+import datetime
+import io
+import math
+import mmap
+import os
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+from compiler.sql.cost.hyperloglog import (
+    NULL_HASH,
+    HyperLogLog,
+    combine_hash_arrays,
+    combine_hashes,
+    hash_array,
+    hash_value,
+    np,
+)
+from compiler.sql.cost.statistics import RangeValue
+
+
+DEFAULT_CHUNK_BYTES = 64 * 1024 * 1024
+
+# Field values read as NULL (MySQL exports write \N)
+NULL_MARKERS = ("", "NULL", "\\N")
+
+KIND_NUMBER = "number"
+KIND_DATE = "date"
+KIND_TEXT = "text"
+
+ISO_DATE_LENGTH = len("2024-01-01")
+
+
+class ProfileError(Exception):
+    """
+    Raised when a CSV extract cannot be profiled.
+    """
+
+# ---------- CHUNKED READER ----------
+
+def _record_end(chunk: bytes) -> int:
+    """
+    Offset just past the last newline of `chunk` that ends a record,
+    i.e. is not inside a quoted field (an even number of quotes
+    precedes it); -1 when there is none.
+    """
+    cut = chunk.rfind(b"\n")
+    while cut != -1 and chunk.count(b'"', 0, cut) % 2:
+        cut = chunk.rfind(b"\n", 0, cut)
+    return cut + 1 if cut != -1 else -1
+
+
+def read_records(
+    path: Union[str, Path],
+    chunk_bytes: int = DEFAULT_CHUNK_BYTES,
+) -> Iterator[List[List[str]]]:
+    """
+    Streams the records of a CSV file (header included) in batches of
+    about `chunk_bytes`.
+
+    The file is memory-mapped rather than read: only the pages of the
+    current chunk need to be resident, so files larger than RAM stream
+    in bounded memory. Chunks are cut after complete records, so quoted
+    fields may contain newlines. A record longer than `chunk_bytes`
+    grows its chunk.
+    """
+    if chunk_bytes <= 0:
+        raise ProfileError("chunk size must be positive")
+
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            if hasattr(mmap, "MADV_SEQUENTIAL"):
+                mapped.madvise(mmap.MADV_SEQUENTIAL)
+
+            start = 0
+            length = chunk_bytes
+            while start < size:
+                chunk = mapped[start:start + length]
+                end = len(chunk)
+                if start + end < size:
+                    end = _record_end(chunk)
+                    if end == -1:
+                        length *= 2
+                        continue
+
+                text = chunk[:end].decode("utf-8-sig" if start == 0 else "utf-8")
+                yield [
+                    record
+                    for record in csv.reader(io.StringIO(text, newline=""))
+                    if record
+                ]
+                start += end
+                length = chunk_bytes
+
+# ---------- COLUMN PROFILES ----------
+
+def _number(value: float) -> Union[int, float]:
+    return int(value) if value.is_integer() else value
+
+
+class ColumnProfile:
+    """
+    Streaming statistics of one CSV column: values, NULLs, an estimated
+    distinct count (HyperLogLog) and, while every value parses as a
+    number or as an ISO date, the min and max.
+    """
+
+    __slots__ = ("name", "rows", "nulls", "kind", "low", "high", "sketch")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.rows = 0
+        self.nulls = 0
+        # None until a non-NULL value is seen, then KIND_*; a column
+        # only ever moves towards KIND_TEXT
+        self.kind: Optional[str] = None
+        self.low: Optional[RangeValue] = None
+        self.high: Optional[RangeValue] = None
+        self.sketch = HyperLogLog()
+
+    @property
+    def distinct(self) -> int:
+        return min(self.rows - self.nulls, self.sketch.cardinality())
+
+    @property
+    def null_fraction(self) -> float:
+        return self.nulls / self.rows if self.rows else 0.0
+
+    @property
+    def range(self) -> Optional[Tuple[RangeValue, RangeValue]]:
+        if self.kind == KIND_TEXT or self.low is None:
+            return None
+        return self.low, self.high
+
+    def add(self, values: Sequence[str]):
+        """
+        Profiles a batch of values; returns their hashes (NULL_HASH for
+        NULLs) for composite keys: a uint64 array with NumPy, else a list.
+        """
+        self.rows += len(values)
+        if np is not None:
+            return self._add_array(np.array(values, dtype=str))
+
+        hashes = []
+        present = []
+        present_hashes = []
+        for value in values:
+            if value in NULL_MARKERS:
+                hashes.append(NULL_HASH)
+                continue
+            value_hash = hash_value(value)
+            hashes.append(value_hash)
+            present.append(value)
+            present_hashes.append(value_hash)
+        self.nulls += len(values) - len(present)
+        self.sketch.add_hashes(present_hashes)
+        if present and self.kind != KIND_TEXT:
+            self._observe(present)
+        return hashes
+
+    def _observe(self, present: List[str]) -> None:
+        if self.kind in (None, KIND_NUMBER):
+            try:
+                numbers = [float(value) for value in present]
+            except ValueError:
+                numbers = None
+            if numbers is not None and all(map(math.isfinite, numbers)):
+                self._widen(
+                    KIND_NUMBER, _number(min(numbers)), _number(max(numbers))
+                )
+                return
+
+        if self.kind in (None, KIND_DATE):
+            try:
+                if any(len(value) != ISO_DATE_LENGTH for value in present):
+                    raise ValueError
+                dates = [datetime.date.fromisoformat(value) for value in present]
+            except ValueError:
+                dates = None
+            if dates is not None:
+                self._widen(
+                    KIND_DATE, min(dates).isoformat(), max(dates).isoformat()
+                )
+                return
+
+        self._widen(KIND_TEXT, None, None)
+
+    # ---------- NumPy ----------
+
+    def _add_array(self, values: "np.ndarray") -> "np.ndarray":
+        nulls = np.zeros(len(values), dtype=bool)
+        for marker in NULL_MARKERS:
+            nulls |= values == marker
+        self.nulls += int(nulls.sum())
+
+        hashes = hash_array(values)
+        self.sketch.add_hashes(hashes[~nulls])
+        hashes[nulls] = NULL_HASH
+
+        present = values[~nulls]
+        if len(present) and self.kind != KIND_TEXT:
+            self._observe_array(present)
+        return hashes
+
+    def _observe_array(self, present: "np.ndarray") -> None:
+        if self.kind in (None, KIND_NUMBER):
+            try:
+                numbers = present.astype(np.float64)
+            except ValueError:
+                numbers = None
+            if numbers is not None and np.isfinite(numbers).all():
+                self._widen(
+                    KIND_NUMBER,
+                    _number(float(numbers.min())),
+                    _number(float(numbers.max())),
+                )
+                return
+
+        if self.kind in (None, KIND_DATE):
+            try:
+                if (np.char.str_len(present) != ISO_DATE_LENGTH).any():
+                    raise ValueError
+                dates = present.astype("datetime64[D]")
+            except ValueError:
+                dates = None
+            if dates is not None:
+                self._widen(KIND_DATE, str(dates.min()), str(dates.max()))
+                return
+
+        self._widen(KIND_TEXT, None, None)
+
+    def _widen(
+        self,
+        kind: str,
+        low: Optional[RangeValue],
+        high: Optional[RangeValue],
+    ) -> None:
+        if kind == KIND_TEXT:
+            self.kind, self.low, self.high = KIND_TEXT, None, None
+            return
+        self.kind = kind
+        self.low = low if self.low is None else min(self.low, low)
+        self.high = high if self.high is None else max(self.high, high)
+
+
+class TableProfile:
+    """
+    Streaming statistics of a CSV extract: one ColumnProfile per
+    header column, and the estimated distinct count of each requested
+    composite key (tuples of columns, NULL counting as a value).
+    """
+
+    def __init__(self, header: Sequence[str], keys: Sequence[Tuple[str, ...]] = ()):
+        self.columns: Dict[str, ColumnProfile] = {}
+        for name in header:
+            name = name.strip().lower()
+            if not name or name in self.columns:
+                raise ProfileError(f"CSV header: empty or duplicate column '{name}'")
+            self.columns[name] = ColumnProfile(name)
+
+        self.keys: Dict[Tuple[str, ...], HyperLogLog] = {}
+        for key in keys:
+            missing = [column for column in key if column not in self.columns]
+            if missing:
+                raise ProfileError(
+                    f"CSV header has no column(s) {', '.join(missing)}"
+                )
+            self.keys[tuple(key)] = HyperLogLog()
+        self.rows = 0
+
+    def add(self, records: List[List[str]]) -> None:
+        width = len(self.columns)
+        for offset, record in enumerate(records):
+            if len(record) != width:
+                raise ProfileError(
+                    f"record {self.rows + offset + 1}: expected {width} "
+                    f"fields, found {len(record)}"
+                )
+        self.rows += len(records)
+        if not records:
+            return
+
+        hashes = {
+            profile.name: profile.add(values)
+            for profile, values in zip(self.columns.values(), zip(*records))
+        }
+        for key, sketch in self.keys.items():
+            if np is not None:
+                sketch.add_hashes(combine_hash_arrays([hashes[c] for c in key]))
+            else:
+                sketch.add_hashes(
+                    combine_hashes(row) for row in zip(*(hashes[c] for c in key))
+                )
+
+    def key_distinct(self, key: Tuple[str, ...]) -> int:
+        return min(self.rows, self.keys[key].cardinality())
+
+
+def profile_csv(
+    path: Union[str, Path],
+    keys: Sequence[Tuple[str, ...]] = (),
+    chunk_bytes: int = DEFAULT_CHUNK_BYTES,
+) -> TableProfile:
+    """
+    Profiles a CSV extract with a header row in one streaming pass.
+
+    Memory is bounded by one chunk and its parsed records, plus one
+    HyperLogLog sketch per column and composite key. Column names are
+    lowercased; `keys` use the lowercased names.
+    """
+    profile = None
+    for records in read_records(path, chunk_bytes):
+        if profile is None:
+            if not records:
+                continue
+            profile = TableProfile(records[0], keys)
+            records = records[1:]
+        profile.add(records)
+
+    if profile is None:
+        raise ProfileError(f"{path}: empty file, expected a header row")
+    return profile
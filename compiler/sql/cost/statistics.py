@@ -0,0 +1,206 @@
+import datetime
+import os
+from pathlib import Path
+from typing import Iterable, Mapping, Optional, Tuple, Union
+
+import yaml
+
+from compiler.runtime.immutable import FrozenDict, frozen_slots
+
+
+STATS_PATH = Path("stats/tables.yml")
+
+# Numbers, or ISO dates for date columns
+RangeValue = Union[int, float, str]
+
+
+class StatisticsLoadError(Exception):
+    """
+    Raised when a statistics file exists but is malformed.
+    """
+
+
+@frozen_slots
+class TableStatistics:
+    """
+    Row count of a table, and distinct counts, value ranges (min, max)
+    and fractions of NULL values of (some of) its columns.
+    """
+    rows: int
+    distinct: Mapping[str, int]
+    ranges: Mapping[str, Tuple[RangeValue, RangeValue]] = FrozenDict()
+    null_fractions: Mapping[str, float] = FrozenDict()
+
+
+@frozen_slots
+class Statistics:
+    """
+    Table statistics keyed by lowercased table name (fact, dimension
+    or source table).
+    """
+    tables: Mapping[str, TableStatistics]
+
+    def table(self, name: str) -> Optional[TableStatistics]:
+        return self.tables.get(name.lower())
+
+    def rows(self, table: str) -> Optional[int]:
+        stats = self.table(table)
+        return stats.rows if stats is not None else None
+
+    def distinct(self, table: str, column: str) -> Optional[int]:
+        stats = self.table(table)
+        if stats is None:
+            return None
+        return stats.distinct.get(column.lower())
+
+    def range(self, table: str, column: str) -> Optional[Tuple[RangeValue, RangeValue]]:
+        stats = self.table(table)
+        if stats is None:
+            return None
+        return stats.ranges.get(column.lower())
+
+    def subset(self, tables: Iterable[str]) -> dict:
+        """
+        Plain-dict form of the given tables only, for input hashing.
+        """
+        return {
+            name: _table_to_dict(self.tables[name])
+            for name in sorted({t.lower() for t in tables})
+            if name in self.tables
+        }
+
+    def to_dict(self) -> dict:
+        return {"tables": self.subset(self.tables)}
+
+
+def _table_to_dict(stats: TableStatistics) -> dict:
+    columns = {}
+    names = stats.distinct.keys() | stats.ranges.keys() | stats.null_fractions.keys()
+    for column in sorted(names):
+        column_stats = {}
+        if column in stats.distinct:
+            column_stats["distinct"] = stats.distinct[column]
+        if column in stats.ranges:
+            column_stats["min"], column_stats["max"] = stats.ranges[column]
+        if column in stats.null_fractions:
+            column_stats["null_fraction"] = stats.null_fractions[column]
+        columns[column] = column_stats
+    return {"rows": stats.rows, "columns": columns}
+
+
+def _count(value, where: str) -> int:
+    if isinstance(value, bool) or not isinstance(value, int) or value < 0:
+        raise StatisticsLoadError(f"{where}: expected a non-negative integer")
+    return value
+
+
+def _fraction(value, where: str) -> float:
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        raise StatisticsLoadError(f"{where}: expected a number between 0 and 1")
+    if not 0 <= value <= 1:
+        raise StatisticsLoadError(f"{where}: expected a number between 0 and 1")
+    return value
+
+
+def _range_value(value, where: str) -> RangeValue:
+    # YAML parses unquoted dates into datetime.date; dump_statistics
+    # writes them back as quoted ISO strings
+    if isinstance(value, datetime.date):
+        return value.isoformat()
+    if isinstance(value, str):
+        try:
+            return datetime.date.fromisoformat(value).isoformat()
+        except ValueError:
+            raise StatisticsLoadError(f"{where}: expected a number or a date")
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        raise StatisticsLoadError(f"{where}: expected a number or a date")
+    return value
+
+
+def _range(column_stats: dict, where: str) -> Optional[Tuple[RangeValue, RangeValue]]:
+    if "min" not in column_stats and "max" not in column_stats:
+        return None
+    low = _range_value(column_stats.get("min"), f"{where} min")
+    high = _range_value(column_stats.get("max"), f"{where} max")
+    if isinstance(low, str) != isinstance(high, str):
+        raise StatisticsLoadError(f"{where}: min and max must both be numbers or dates")
+    if low > high:
+        raise StatisticsLoadError(f"{where}: min must not exceed max")
+    return low, high
+
+
+def parse_statistics(data: dict) -> Statistics:
+    """
+    Builds Statistics from the file layout:
+
+        tables:
+          <table>:
+            rows: <int>
+            columns:
+              <column>:
+                distinct: <int>      (optional)
+                min: <number|date>   (optional, with max)
+                max: <number|date>
+                null_fraction: <0..1> (optional)
+    """
+    if not isinstance(data, dict) or not isinstance(data.get("tables"), dict):
+        raise StatisticsLoadError("statistics must define a 'tables' mapping")
+
+    tables = {}
+    for name, table in data["tables"].items():
+        if not isinstance(table, dict):
+            raise StatisticsLoadError(f"table '{name}': expected a mapping")
+        rows = _count(table.get("rows"), f"table '{name}' rows")
+
+        distinct = {}
+        ranges = {}
+        null_fractions = {}
+        for column, column_stats in (table.get("columns") or {}).items():
+            where = f"table '{name}' column '{column}'"
+            if not isinstance(column_stats, dict):
+                raise StatisticsLoadError(f"{where}: expected a mapping")
+            column = str(column).lower()
+
+            if "distinct" in column_stats:
+                distinct[column] = min(
+                    rows, _count(column_stats["distinct"], f"{where} distinct")
+                )
+            value_range = _range(column_stats, where)
+            if value_range is not None:
+                ranges[column] = value_range
+            if "null_fraction" in column_stats:
+                null_fractions[column] = _fraction(
+                    column_stats["null_fraction"], f"{where} null_fraction"
+                )
+
+        tables[str(name).lower()] = TableStatistics(
+            rows=rows,
+            distinct=FrozenDict(distinct),
+            ranges=FrozenDict(ranges),
+            null_fractions=FrozenDict(null_fractions),
+        )
+
+    return Statistics(tables=FrozenDict(tables))
+
+
+def load_statistics(path: Path = STATS_PATH) -> Optional[Statistics]:
+    """
+    Loads the optional statistics file; None when it does not exist.
+    """
+    if not os.path.exists(path):
+        return None
+
+    with open(path, "r") as f:
+        try:
+            data = yaml.safe_load(f)
+        except yaml.YAMLError as e:
+            raise StatisticsLoadError(f"invalid YAML in {path}: {e}")
+
+    return parse_statistics(data)
+
+
+def dump_statistics(statistics: Statistics, path: Path = STATS_PATH) -> None:
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w") as f:
+        yaml.safe_dump(statistics.to_dict(), f, sort_keys=False)
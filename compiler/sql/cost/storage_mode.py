@@ -0,0 +1,151 @@
+import datetime
+from typing import Dict, Iterable, List, Optional
+
+from compiler.runtime.ir import Dimension, SemanticModelIR
+from compiler.sql.cost.statistics import Statistics
+from compiler.sql.runtime.ir import (
+    STORAGE_DIRECTQUERY,
+    STORAGE_DUAL,
+    STORAGE_IMPORT,
+    SqlFactQuery,
+    SqlRollupQuery,
+    SqlStorageMode,
+)
+
+
+def _threshold_mode(
+    rows: Optional[int],
+    threshold: Optional[int],
+    threshold_name: str,
+) -> SqlStorageMode:
+    if threshold is None:
+        return SqlStorageMode(
+            STORAGE_IMPORT, rows, f"no {threshold_name} declared"
+        )
+    if rows is None:
+        return SqlStorageMode(
+            STORAGE_IMPORT, None, "row count unknown (no statistics)"
+        )
+    if rows > threshold:
+        return SqlStorageMode(
+            STORAGE_DIRECTQUERY, rows,
+            f"{rows:,} rows > {threshold_name} {threshold:,}",
+        )
+    return SqlStorageMode(
+        STORAGE_IMPORT, rows, f"{rows:,} rows <= {threshold_name} {threshold:,}"
+    )
+
+
+def _fact_rows(query: SqlFactQuery, statistics: Optional[Statistics]) -> Optional[int]:
+    if query.estimate is not None:
+        return query.estimate.rows
+    if statistics is None:
+        return None
+    return statistics.rows(query.from_table)
+
+
+def _rollup_rows(
+    semantic_ir: SemanticModelIR,
+    query: SqlRollupQuery,
+    fact_rows: Optional[int],
+    statistics: Optional[Statistics],
+) -> Optional[int]:
+    """
+    Declared rollup rows, else the product of the distinct counts of
+    its grain on the fact, capped by the fact rows.
+    """
+    if statistics is None:
+        return None
+    rows = statistics.rows(query.name)
+    if rows is not None or fact_rows is None:
+        return rows
+
+    groups = 1
+    for column in semantic_ir.rollups[query.name].grain:
+        distinct = statistics.distinct(query.from_table, column)
+        if distinct is None:
+            return fact_rows
+        groups *= distinct
+    return min(fact_rows, groups)
+
+
+def _dimension_rows(dimension: Dimension, statistics: Optional[Statistics]) -> Optional[int]:
+    if dimension.calendar is not None:
+        return (
+            datetime.date.fromisoformat(dimension.calendar.end)
+            - datetime.date.fromisoformat(dimension.calendar.start)
+        ).days
+    if statistics is None:
+        return None
+    return statistics.rows(dimension.name)
+
+
+def choose_storage_modes(
+    semantic_ir: SemanticModelIR,
+    fact_queries: Iterable[SqlFactQuery],
+    rollup_queries: Iterable[SqlRollupQuery],
+    statistics: Optional[Statistics] = None,
+) -> Dict[str, SqlStorageMode]:
+    """
+    Power BI storage mode of every fact, rollup and dimension, from the
+    row-count thresholds declared in the contract (`storage_modes`).
+
+    - facts and rollups up to `fact_import_max_rows` are imported,
+      larger ones use DirectQuery
+    - dimensions above `dimension_import_max_rows` use DirectQuery
+    - other dimensions are Dual when a fact or rollup relating to them
+      uses DirectQuery (so filters on them reach both imported rollups
+      and the source), else imported
+
+    Row counts come from the fact's cost estimate or statistics; rollups
+    without statistics are estimated from the distinct counts of their
+    grain on the fact. Tables of unknown size are imported.
+
+    Returns table name → SqlStorageMode.
+    """
+    thresholds = semantic_ir.storage_modes
+    modes: Dict[str, SqlStorageMode] = {}
+    fact_rows: Dict[str, Optional[int]] = {}
+    related: Dict[str, List[str]] = {name: [] for name in semantic_ir.dimensions}
+
+    for query in fact_queries:
+        rows = _fact_rows(query, statistics)
+        fact_rows[query.from_table] = rows
+        modes[query.from_table] = _threshold_mode(
+            rows, thresholds.fact_import_max_rows, "fact_import_max_rows"
+        )
+        for fk in semantic_ir.facts[query.from_table].foreign_keys:
+            dim = semantic_ir.dimension_for_key(fk)
+            if dim is not None:
+                related[dim.name].append(query.from_table)
+
+    for query in rollup_queries:
+        rows = _rollup_rows(
+            semantic_ir, query, fact_rows.get(query.from_table), statistics
+        )
+        modes[query.name] = _threshold_mode(
+            rows, thresholds.fact_import_max_rows, "fact_import_max_rows"
+        )
+        for column in semantic_ir.rollups[query.name].grain:
+            dim = semantic_ir.dimension_for_key(column)
+            if dim is not None:
+                related[dim.name].append(query.name)
+
+    for dim_name, dimension in semantic_ir.dimensions.items():
+        mode = _threshold_mode(
+            _dimension_rows(dimension, statistics),
+            thresholds.dimension_import_max_rows,
+            "dimension_import_max_rows",
+        )
+        direct = [
+            table for table in related[dim_name]
+            if modes[table].mode == STORAGE_DIRECTQUERY
+        ]
+        if mode.mode == STORAGE_IMPORT and direct:
+            mode = SqlStorageMode(
+                STORAGE_DUAL, mode.rows,
+                f"{mode.reason}; related to DirectQuery {', '.join(direct)}",
+            )
+        modes[dim_name] = mode
+
+    return modes
@@ -1,12 +1,79 @@
+import dataclasses
 from abc import ABC, abstractmethod
+from typing import FrozenSet, List, Sequence, Tuple
+
 from compiler.sql.runtime.ir import SqlQuery
 
 
 class SqlCompilerPass(ABC):
     """
     Base class for all SQL compiler passes.
+
+    Passes declare which query fields they read and write. Fields not
+    listed in `writes` are carried over to the result by reference,
+    so a pass never copies structure it does not change. The pipeline
+    checks that every field a pass reads is set upstream
+    (check_field_flow); `derive` rejects writes to undeclared fields.
     """
 
+    reads: FrozenSet[str] = frozenset()
+    writes: FrozenSet[str] = frozenset()
+
     @abstractmethod
     def run(self, query: SqlQuery) -> SqlQuery:
-        raise NotImplementedError
\ No newline at end of file
+        raise NotImplementedError
+
+    def run_batch(self, queries: Sequence[SqlQuery]) -> List[SqlQuery]:
+        """
+        Runs the pass over all queries of a model. Passes with per-model
+        setup can override this to do that work once per batch.
+        """
+        return [self.run(query) for query in queries]
+
+    def derive(self, query: SqlQuery, **changes) -> SqlQuery:
+        """
+        Returns `query` with the given fields replaced; every other
+        field is shared with the input.
+        """
+        undeclared = changes.keys() - self.writes
+        if undeclared:
+            raise ValueError(
+                f"{type(self).__name__} writes undeclared fields: "
+                f"{sorted(undeclared)}"
+            )
+        return dataclasses.replace(query, **changes)
+
+
+def check_field_flow(
+    passes: Sequence[SqlCompilerPass],
+    initial: FrozenSet[str],
+) -> None:
+    """
+    Raises ValueError when a pass reads a field that is neither set on
+    the pipeline's input queries (`initial`) nor written by an earlier
+    pass.
+    """
+    available = set(initial)
+    for compiler_pass in passes:
+        unset = compiler_pass.reads - available
+        if unset:
+            raise ValueError(
+                f"{type(compiler_pass).__name__} reads fields no earlier "
+                f"pass writes: {sorted(unset)}"
+            )
+        available |= compiler_pass.writes
+
+
+def fact_group_by(
+    grain_columns: Sequence[str],
+    dimension_columns: Sequence[str],
+) -> Tuple[str, ...]:
+    """
+    GROUP BY of a fact query: every column it selects unaggregated,
+    i.e. its grain, then its dimension columns.
+    """
+    group_by: List[str] = []
+    for column in list(grain_columns) + list(dimension_columns):
+        if column not in group_by:
+            group_by.append(column)
+    return tuple(group_by)
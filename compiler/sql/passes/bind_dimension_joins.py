@@ -1,4 +1,4 @@
-from compiler.sql.passes.base import SqlCompilerPass
+from compiler.sql.passes.base import SqlCompilerPass, fact_group_by
 from compiler.sql.runtime.ir import SqlQuery, SqlFactQuery, SqlJoin
 
 
@@ -10,8 +10,19 @@ class BindDimensionJoinsPass(SqlCompilerPass):
     - map foreign keys to dimension tables
     - attach deterministic LEFT JOIN clauses
     - expose dimension key columns for SELECT
+    - keep dimension columns that are not foreign keys (dates), which
+      relate to their dimension without a join
+    - group by every selected dimension column next to the grain
     """
 
+    reads = frozenset({
+        "from_table",
+        "foreign_keys",
+        "grain_columns",
+        "dimension_columns",
+    })
+    writes = frozenset({"joins", "group_by", "dimension_columns"})
+
     def __init__(self, semantic_ir):
         """
         semantic_ir: SemanticModelIR
@@ -26,19 +37,14 @@ class BindDimensionJoinsPass(SqlCompilerPass):
         joins = []
         dimension_columns = []
 
-        # Build FK → dimension mapping from semantic IR
-        fk_to_dimension = {}
-        for dim_name, dim in self.semantic_ir.dimensions.items():
-            fk_to_dimension[dim.key] = dim_name
-
         for fk in query.foreign_keys:
-            if fk not in fk_to_dimension:
+            dim = self.semantic_ir.dimension_for_key(fk)
+            if dim is None:
                 # Skip unknown FKs (semantic validator should catch this)
                 continue
 
-            dim_name = fk_to_dimension[fk]
-            dim_table = dim_name  # e.g. dim_customer
-            dim_key = self.semantic_ir.dimensions[dim_name].key
+            dim_table = dim.name  # e.g. dim_customer
+            dim_key = dim.key
 
             joins.append(
                 SqlJoin(
@@ -50,14 +56,15 @@ class BindDimensionJoinsPass(SqlCompilerPass):
             # Expose dimension key in SELECT
             dimension_columns.append(f"{dim_table}.{dim_key}")
 
-        return SqlFactQuery(
-            select=query.select,
-            from_table=query.from_table,
-            joins=joins,
-            group_by=query.group_by,
-            grain_columns=query.grain_columns,
-            foreign_keys=query.foreign_keys,
-            measures=query.measures,
-            aggregations=query.aggregations,
-            dimension_columns=dimension_columns,
+        foreign_keys = set(query.foreign_keys)
+        dimension_columns += [
+            column for column in query.dimension_columns
+            if column not in foreign_keys
+        ]
+
+        return self.derive(
+            query,
+            joins=tuple(joins),
+            group_by=fact_group_by(query.grain_columns, dimension_columns),
+            dimension_columns=tuple(dimension_columns),
         )
\ No newline at end of file
@@ -1,3 +1,6 @@
+from typing import Mapping, Optional
+
+from compiler.runtime.immutable import FrozenDict
 from compiler.sql.passes.base import SqlCompilerPass
 from compiler.sql.runtime.ir import (
     SqlQuery,
@@ -12,31 +15,54 @@ class BindMeasureAggregationPass(SqlCompilerPass):
 
     Responsibilities:
     - attach aggregation operators to measures
+    - reject measures whose physical column is not numeric
     - preserve all previously inferred query semantics
     """
 
     DEFAULT_AGGREGATION = "SUM"
 
-    def run(self, query: SqlQuery) -> SqlQuery:
-        if not isinstance(query, SqlFactQuery):
-            return query
+    reads = frozenset({"from_table", "measures"})
+    writes = frozenset({"aggregations"})
+
+    def __init__(self, physical_columns: Optional[Mapping[str, Mapping]] = None):
+        """
+        physical_columns: fact → column → schema catalog Column.
+        Measures missing from it are not type-checked.
+        """
+        self.physical_columns = physical_columns or {}
 
-        aggregations = {}
+        # Aggregations are immutable, so one instance per measure is shared
+        # by every query that aggregates it
+        self._aggregations = {}
 
-        for measure in query.measures:
-            aggregations[measure] = SqlMeasureAggregation(
+    def _aggregation(self, measure: str) -> SqlMeasureAggregation:
+        aggregation = self._aggregations.get(measure)
+        if aggregation is None:
+            aggregation = SqlMeasureAggregation(
                 measure=measure,
                 aggregation=self.DEFAULT_AGGREGATION,
             )
+            self._aggregations[measure] = aggregation
+        return aggregation
+
+    def run(self, query: SqlQuery) -> SqlQuery:
+        if not isinstance(query, SqlFactQuery):
+            return query
+
+        columns = self.physical_columns.get(query.from_table)
+        if columns:
+            for measure in query.measures:
+                column = columns.get(measure)
+                if column is not None and not column.is_numeric:
+                    raise ValueError(
+                        f"cannot {self.DEFAULT_AGGREGATION} measure "
+                        f"'{query.from_table}.{measure}': column "
+                        f"'{column.name}' is {column.declared_type}"
+                    )
+
+        aggregations = FrozenDict(
+            (measure, self._aggregation(measure))
+            for measure in query.measures
+        )
 
-        return SqlFactQuery(
-            select=query.select,
-            from_table=query.from_table,
-            joins=query.joins,
-            group_by=query.group_by,
-            grain_columns=query.grain_columns,
-            foreign_keys=query.foreign_keys,
-            measures=query.measures,
-            dimension_columns=query.dimension_columns,
-            aggregations=aggregations,
-        )
\ No newline at end of file
+        return self.derive(query, aggregations=aggregations)
@@ -0,0 +1,65 @@
+from compiler.sql.passes.base import SqlCompilerPass, fact_group_by
+from compiler.sql.runtime.ir import SqlQuery, SqlFactQuery, SqlJoin
+
+
+class BindSurrogateKeysPass(SqlCompilerPass):
+    """
+    Replaces natural dimension keys with integer surrogate keys for
+    dimensions declaring `surrogate_key`.
+
+    For every such dimension column the fact gains a LEFT JOIN to the
+    key map on its own foreign key, and selects the surrogate key
+    column instead, grouping by it. Natural keys missing from the key map become NULL
+    (the blank member in Power BI) until the next key map load.
+
+    Runs after join elimination, so surrogate keys do not keep
+    dimension joins alive.
+    """
+
+    reads = frozenset({
+        "from_table",
+        "joins",
+        "grain_columns",
+        "dimension_columns",
+    })
+    writes = frozenset({"joins", "group_by", "dimension_columns"})
+
+    def __init__(self, semantic_ir):
+        """
+        semantic_ir: SemanticModelIR
+        Supplies the surrogate key declaration of every dimension.
+        """
+        self.semantic_ir = semantic_ir
+
+    def run(self, query: SqlQuery) -> SqlQuery:
+        if not isinstance(query, SqlFactQuery):
+            return query
+
+        joins = list(query.joins)
+        dimension_columns = []
+
+        for column in query.dimension_columns:
+            key = column.rpartition(".")[2]
+            dim = self.semantic_ir.dimension_for_key(key)
+            surrogate_key = dim.surrogate_key if dim is not None else None
+            if surrogate_key is None:
+                dimension_columns.append(column)
+                continue
+
+            joins.append(
+                SqlJoin(
+                    table=surrogate_key.table,
+                    on=f"{query.from_table}.{key} = {surrogate_key.table}.{dim.key}",
+                )
+            )
+            dimension_columns.append(f"{surrogate_key.table}.{surrogate_key.column}")
+
+        if len(joins) == len(query.joins):
+            return query
+
+        return self.derive(
+            query,
+            joins=tuple(joins),
+            group_by=fact_group_by(query.grain_columns, dimension_columns),
+            dimension_columns=tuple(dimension_columns),
+        )
@@ -0,0 +1,145 @@
+from typing import Dict, List, Optional, Set
+
+from compiler.sql.passes.base import SqlCompilerPass, fact_group_by
+from compiler.sql.runtime.ir import SqlQuery, SqlFactQuery, SqlJoin
+
+
+class EliminateDimensionJoinsPass(SqlCompilerPass):
+    """
+    Removes dimension joins that contribute nothing but the dimension key,
+    and prunes projections no downstream consumer reads.
+
+    A LEFT JOIN `fact.fk = dim.key` is eliminated when:
+    - `dim.key` is the dimension's declared key (unique by contract),
+      so the join can neither add nor drop fact rows
+    - the query reads no column of the dimension other than that key
+    - no other join is conditioned on the dimension
+
+    Reads of `dim.key` are rewritten to `fact.fk`, the same value for
+    every matched row. Orphan foreign keys keep their value instead of
+    becoming NULL; Power BI relationships map them to the blank member
+    either way.
+
+    Pruned projections:
+    - SELECT columns that are neither grain, dimension column, measure
+      nor grain column of a rollup derived from the fact
+    - dimension columns repeating a grain column or another dimension column
+
+    Eliminated joins are recorded on the query (`eliminated_joins`) so
+    renderers can report them.
+    """
+
+    reads = frozenset({
+        "select",
+        "from_table",
+        "joins",
+        "group_by",
+        "grain_columns",
+        "measures",
+        "dimension_columns",
+        "eliminated_joins",
+    })
+    writes = frozenset({
+        "select",
+        "joins",
+        "group_by",
+        "dimension_columns",
+        "eliminated_joins",
+    })
+
+    def __init__(self, semantic_ir):
+        """
+        semantic_ir: SemanticModelIR
+        Supplies the declared (unique) key of every dimension.
+        """
+        self.semantic_ir = semantic_ir
+
+    def run(self, query: SqlQuery) -> SqlQuery:
+        if not isinstance(query, SqlFactQuery):
+            return query
+
+        joins: List[SqlJoin] = []
+        eliminated: List[SqlJoin] = []
+        rewrites: Dict[str, str] = {}
+
+        for join in query.joins:
+            fk = self._eliminable_fk(query, join)
+            if fk is None:
+                joins.append(join)
+                continue
+            dim_key = self.semantic_ir.dimensions[join.table].key
+            rewrites[f"{join.table}.{dim_key}"] = f"{query.from_table}.{fk}"
+            eliminated.append(join)
+
+        # ---------- projection pruning ----------
+
+        seen = {_alias(column) for column in query.grain_columns}
+        dimension_columns = []
+        for column in query.dimension_columns:
+            column = rewrites.get(column, column)
+            alias = _alias(column)
+            if alias not in seen:
+                seen.add(alias)
+                dimension_columns.append(column)
+
+        needed = seen | self._rollup_columns(query) | set(query.measures)
+        select = tuple(
+            column for column in query.select if column.alias in needed
+        )
+
+        if (
+            not eliminated
+            and len(select) == len(query.select)
+            and len(dimension_columns) == len(query.dimension_columns)
+        ):
+            return query
+
+        return self.derive(
+            query,
+            select=select if len(select) < len(query.select) else query.select,
+            joins=tuple(joins),
+            group_by=fact_group_by(query.grain_columns, dimension_columns),
+            dimension_columns=tuple(dimension_columns),
+            eliminated_joins=query.eliminated_joins + tuple(eliminated),
+        )
+
+    def _eliminable_fk(self, query: SqlFactQuery, join: SqlJoin) -> Optional[str]:
+        """
+        The fact foreign key a join can be replaced by, or None.
+        """
+        dim = self.semantic_ir.dimensions.get(join.table)
+        if dim is None or join.join_type != "LEFT":
+            return None
+
+        sides = join.equi_columns()
+        if sides is None:
+            return None
+        (left_table, fk), (right_table, key) = sides
+        if (left_table, right_table, key) != (query.from_table, join.table, dim.key):
+            return None
+
+        prefix = f"{join.table}."
+        for column in query.dimension_columns + query.group_by + query.grain_columns:
+            if column.startswith(prefix) and column != f"{join.table}.{dim.key}":
+                return None
+
+        for other in query.joins:
+            if other is not join and prefix in other.on:
+                return None
+
+        return fk
+
+    def _rollup_columns(self, query: SqlFactQuery) -> Set[str]:
+        return {
+            column
+            for rollup in self.semantic_ir.rollups_for(query.from_table)
+            for column in rollup.grain
+        }
+
+
+def _alias(column: str) -> str:
+    """
+    Result column name of a (possibly qualified) column reference.
+    """
+    return column.rpartition(".")[2]
+
@@ -0,0 +1,111 @@
+from typing import Optional, Tuple
+
+from compiler.sql.cost.statistics import Statistics
+from compiler.sql.passes.base import SqlCompilerPass
+from compiler.sql.runtime.ir import (
+    SqlQuery,
+    SqlFactQuery,
+    SqlJoin,
+    SqlCostEstimate,
+)
+
+
+class EstimateQueryCostPass(SqlCompilerPass):
+    """
+    Orders joins smallest-first and attaches a statistics-based cost
+    estimate to fact queries.
+
+    Cost model (in rows processed):
+    - scan:     fact rows
+    - join:     dimension rows (build) + current rows (probe); rows
+                are multiplied by the dimension's rows per join key
+    - GROUP BY: current rows; the result is capped at the product of
+                the distinct counts of the grain columns (the other
+                grouped columns depend on the grain)
+
+    Joins are only reordered when every join is conditioned on the
+    fact alone, so each can run in any position. Dimensions without
+    statistics keep their relative order after the known ones.
+
+    Without statistics for the fact table, queries pass through
+    unchanged and carry no estimate.
+    """
+
+    reads = frozenset({"from_table", "joins", "group_by", "grain_columns"})
+    writes = frozenset({"joins", "estimate"})
+
+    def __init__(self, statistics: Optional[Statistics] = None):
+        self.statistics = statistics
+
+    def run(self, query: SqlQuery) -> SqlQuery:
+        if not isinstance(query, SqlFactQuery) or self.statistics is None:
+            return query
+
+        fact_rows = self.statistics.rows(query.from_table)
+        if fact_rows is None:
+            return query
+
+        joins = self._order_joins(query)
+
+        rows, cost = fact_rows, fact_rows
+        for join in joins:
+            rows, join_cost = self._join(rows, join)
+            cost += join_cost
+
+        if query.group_by:
+            cost += rows
+            groups = self._groups(query)
+            if groups is not None:
+                rows = min(rows, groups)
+
+        return self.derive(
+            query,
+            joins=joins if joins != query.joins else query.joins,
+            estimate=SqlCostEstimate(rows=round(rows), cost=round(cost)),
+        )
+
+    # ---------- joins ----------
+
+    def _order_joins(self, query: SqlFactQuery) -> Tuple[SqlJoin, ...]:
+        for join in query.joins:
+            sides = join.equi_columns()
+            if sides is None or {t for t, _ in sides} != {query.from_table, join.table}:
+                return query.joins
+
+        def size(join: SqlJoin) -> Tuple[int, int]:
+            rows = self.statistics.rows(join.table)
+            return (0, rows) if rows is not None else (1, 0)
+
+        return tuple(sorted(query.joins, key=size))
+
+    def _join(self, rows: float, join: SqlJoin) -> Tuple[float, float]:
+        """
+        (rows after the join, cost of the join)
+        """
+        dim_rows = self.statistics.rows(join.table)
+        if dim_rows is None:
+            return rows, rows
+
+        fanout = 1.0
+        sides = join.equi_columns()
+        if sides is not None:
+            for table, column in sides:
+                if table != join.table:
+                    continue
+                keys = self.statistics.distinct(table, column)
+                if keys:
+                    fanout = max(1.0, dim_rows / keys)
+
+        return rows * fanout, dim_rows + rows
+
+    # ---------- grouping ----------
+
+    def _groups(self, query: SqlFactQuery) -> Optional[int]:
+        groups = 1
+        for column in query.grain_columns:
+            table, _, name = column.rpartition(".")
+            distinct = self.statistics.distinct(table or query.from_table, name)
+            if distinct is None:
+                return None
+            groups *= max(1, distinct)
+        return groups
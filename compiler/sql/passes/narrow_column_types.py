@@ -0,0 +1,349 @@
+import datetime
+from typing import Mapping, Optional, Tuple
+
+from compiler.runtime.immutable import FrozenDict
+from compiler.sql.cost.model_size import (
+    FIXED_DECIMAL_MAX,
+    FIXED_DECIMAL_SCALE,
+    INT64_MAX,
+    INT64_MIN,
+    POWERBI_DATE,
+    POWERBI_DATETIME,
+    POWERBI_DECIMAL,
+    POWERBI_DOUBLE,
+    POWERBI_INT64,
+    POWERBI_STRING,
+    column_bytes,
+)
+from compiler.sql.cost.statistics import Statistics
+from compiler.sql.passes.base import SqlCompilerPass
+from compiler.sql.runtime.ir import SqlQuery, SqlFactQuery, SqlColumnType
+from validation.schema_catalog import Column
+
+
+INTEGER_BITS = {
+    "tinyint": 8,
+    "smallint": 16,
+    "mediumint": 24,
+    "int": 32,
+    "integer": 32,
+    "bigint": 64,
+}
+DECIMAL_TYPES = frozenset({"decimal", "dec", "numeric", "fixed"})
+DATETIME_TYPES = frozenset({"datetime", "timestamp"})
+
+
+def powerbi_type(column: Column) -> str:
+    """
+    Power BI type a MySQL column imports as.
+    """
+    if column.data_type in INTEGER_BITS or column.data_type == "bit":
+        return POWERBI_INT64
+    if column.is_numeric:
+        # Power BI imports MySQL DECIMAL as a (floating) decimal number
+        return POWERBI_DOUBLE
+    if column.data_type == "date":
+        return POWERBI_DATE
+    if column.data_type in DATETIME_TYPES:
+        return POWERBI_DATETIME
+    return POWERBI_STRING
+
+
+def _source_type(column: Column) -> str:
+    return column.declared_type + (" unsigned" if column.unsigned else "")
+
+
+def _scale(column: Column) -> int:
+    if column.data_type in DECIMAL_TYPES:
+        return column.args[1] if len(column.args) > 1 else 0
+    return 0
+
+
+def _declared_range(column: Column) -> Optional[Tuple[float, float]]:
+    bits = INTEGER_BITS.get(column.data_type)
+    if bits is not None:
+        if column.unsigned:
+            return 0, 2 ** bits - 1
+        return -(2 ** (bits - 1)), 2 ** (bits - 1) - 1
+
+    if column.data_type in DECIMAL_TYPES:
+        precision = column.args[0] if column.args else 10
+        largest = 10 ** (precision - _scale(column)) - 10 ** -_scale(column)
+        return (0 if column.unsigned else -largest), largest
+
+    return None
+
+
+def _exact_target(column: Column, scale: int):
+    """
+    (Power BI type, CAST target, (min, max) it holds, reason) for sums
+    of `column`; the first three are None when it cannot be narrowed.
+    """
+    if column.data_type not in INTEGER_BITS and column.data_type not in DECIMAL_TYPES:
+        return None, None, None, f"{column.data_type} is approximate"
+    if scale == 0:
+        return POWERBI_INT64, "SIGNED", (INT64_MIN, INT64_MAX), None
+    if scale <= FIXED_DECIMAL_SCALE:
+        return (
+            POWERBI_DECIMAL,
+            f"DECIMAL(19,{FIXED_DECIMAL_SCALE})",
+            (-FIXED_DECIMAL_MAX, FIXED_DECIMAL_MAX),
+            None,
+        )
+    return None, None, None, (
+        f"scale {scale} exceeds fixed decimal scale {FIXED_DECIMAL_SCALE}"
+    )
+
+
+class NarrowColumnTypesPass(SqlCompilerPass):
+    """
+    Chooses the narrowest Power BI type for every result column of a
+    fact query whose source column is known, and the CAST producing it.
+
+    Measures (MySQL returns SUM of exact numbers as DECIMAL, which
+    Power BI imports as a floating decimal number):
+    - integer sums (and DECIMAL(p,0)) → whole number, CAST AS SIGNED
+    - DECIMAL(p,s) sums with s <= 4 → fixed decimal,
+      CAST AS DECIMAL(19,4)
+    - FLOAT / DOUBLE sums stay decimal numbers
+
+    A SUM is only narrowed when its bounds fit the target: the per-row
+    value range (observed in statistics, else the declared type) times
+    the row count of the source table the fact view reads. Without
+    that row count in statistics, sums keep their imported type.
+
+    DATETIME keys of calendar dimensions hold one value per day, so
+    they are cast to DATE.
+
+    With statistics for the fact, every narrowed column also carries
+    an estimated model size before and after (see cost/model_size.py).
+    """
+
+    reads = frozenset({
+        "from_table",
+        "grain_columns",
+        "dimension_columns",
+        "aggregations",
+    })
+    writes = frozenset({"column_types"})
+
+    def __init__(
+        self,
+        semantic_ir,
+        physical: Optional[Mapping[str, Mapping[str, Column]]] = None,
+        statistics: Optional[Statistics] = None,
+        source_tables: Optional[Mapping[str, str]] = None,
+    ):
+        """
+        semantic_ir:   SemanticModelIR (calendar dimensions)
+        physical:      fact → column → schema catalog Column; columns
+                       missing from it keep their type and are not reported
+        statistics:    optional row counts, distinct counts and ranges
+        source_tables: fact → schema table its view reads, whose row
+                       count bounds the rows a SUM adds up
+        """
+        self.semantic_ir = semantic_ir
+        self.physical = physical or {}
+        self.statistics = statistics
+        self.source_tables = source_tables or {}
+
+    def run(self, query: SqlQuery) -> SqlQuery:
+        if not isinstance(query, SqlFactQuery):
+            return query
+
+        columns = self.physical.get(query.from_table)
+        if not columns:
+            return query
+
+        column_types = {}
+        for column in query.grain_columns + query.dimension_columns:
+            name = column.rpartition(".")[2]
+            source = columns.get(name)
+            if source is not None and name not in column_types:
+                column_types[name] = self._key_type(query, name, source)
+
+        for measure, aggregation in query.aggregations.items():
+            source = columns.get(measure)
+            if source is not None:
+                column_types[measure] = self._measure_type(
+                    query, measure, aggregation.aggregation, source
+                )
+
+        return self.derive(query, column_types=FrozenDict(column_types))
+
+    # ---------- keys and attributes ----------
+
+    def _key_type(self, query: SqlFactQuery, name: str, source: Column) -> SqlColumnType:
+        imported = powerbi_type(source)
+        dim = self.semantic_ir.dimension_for_key(name)
+
+        if imported == POWERBI_DATETIME and dim is not None and dim.calendar is not None:
+            return self._narrowed(
+                query, name, _source_type(source), imported, POWERBI_DATE, "DATE",
+                f"key of calendar dimension {dim.name} (one row per day)",
+            )
+
+        return SqlColumnType(
+            column=name,
+            source_type=_source_type(source),
+            source_powerbi_type=imported,
+            powerbi_type=imported,
+            cast=None,
+            reason="imported as declared",
+        )
+
+    # ---------- measures ----------
+
+    def _measure_type(
+        self,
+        query: SqlFactQuery,
+        measure: str,
+        aggregation: str,
+        source: Column,
+    ) -> SqlColumnType:
+        source_type = f"{aggregation}({_source_type(source)})"
+
+        if aggregation == "COUNT":
+            return SqlColumnType(
+                column=measure,
+                source_type=source_type,
+                source_powerbi_type=POWERBI_INT64,
+                powerbi_type=POWERBI_INT64,
+                cast=None,
+                reason="COUNT returns BIGINT",
+            )
+
+        imported = powerbi_type(source)
+        if aggregation == "SUM" and imported == POWERBI_INT64:
+            # MySQL widens integer sums to DECIMAL
+            imported = POWERBI_DOUBLE
+
+        scale = _scale(source)
+        target, cast, limit, reason = _exact_target(source, scale)
+
+        bounds, origin = self._bounds(query, measure, aggregation, source)
+        if target is not None and (
+            bounds is None or bounds[0] < limit[0] or bounds[1] > limit[1]
+        ):
+            target = None
+            reason = f"{aggregation} may not fit {cast} ({origin})"
+            if bounds is not None:
+                reason += "; declare a range in stats/tables.yml"
+
+        if target is None or target == imported:
+            return SqlColumnType(
+                column=measure,
+                source_type=source_type,
+                source_powerbi_type=imported,
+                powerbi_type=imported,
+                cast=None,
+                reason=reason or "imported as declared",
+            )
+
+        return self._narrowed(
+            query, measure, source_type, imported, target, cast,
+            f"{aggregation} fits {target} ({origin})",
+            scale=scale,
+        )
+
+    def _bounds(
+        self,
+        query: SqlFactQuery,
+        measure: str,
+        aggregation: str,
+        source: Column,
+    ) -> Tuple[Optional[Tuple[float, float]], str]:
+        """
+        ((lowest, highest) result value, where the bound comes from)
+        """
+        observed = self._numeric_range(query.from_table, measure)
+        if observed is not None:
+            values, origin = observed, "observed range"
+        else:
+            values, origin = _declared_range(source), "declared type range"
+        if values is None:
+            return None, origin
+
+        if aggregation != "SUM":
+            return values, origin
+
+        source_table = self.source_tables.get(query.from_table)
+        if source_table is None:
+            return None, "view does not read a single source table"
+        rows = self.statistics.rows(source_table) if self.statistics else None
+        if rows is None:
+            return None, f"no row count for {source_table} in statistics"
+
+        low, high = values
+        return (
+            (min(0, low) * rows, max(0, high) * rows),
+            f"{origin} over {rows:,} rows of {source_table}",
+        )
+
+    # ---------- statistics ----------
+
+    def _numeric_range(self, table: str, column: str) -> Optional[Tuple[float, float]]:
+        if self.statistics is None:
+            return None
+        value_range = self.statistics.range(table, column)
+        if value_range is None or isinstance(value_range[0], str):
+            return None
+        return value_range
+
+    def _span(self, table: str, column: str, scale: int) -> Optional[int]:
+        """
+        Values between the observed min and max: days for dates,
+        multiples of 10^-scale for numbers.
+        """
+        if self.statistics is None:
+            return None
+        value_range = self.statistics.range(table, column)
+        if value_range is None:
+            return None
+        low, high = value_range
+        if isinstance(low, str):
+            return (
+                datetime.date.fromisoformat(high[:10])
+                - datetime.date.fromisoformat(low[:10])
+            ).days
+        return round((high - low) * 10 ** scale)
+
+    def _narrowed(
+        self,
+        query: SqlFactQuery,
+        column: str,
+        source_type: str,
+        imported: str,
+        target: str,
+        cast: str,
+        reason: str,
+        scale: int = 0,
+    ) -> SqlColumnType:
+        bytes_before = bytes_after = None
+        rows = self.statistics.rows(query.from_table) if self.statistics else None
+        if rows is not None:
+            distinct = self.statistics.distinct(query.from_table, column)
+            if distinct is None:
+                # Unknown (e.g. aggregated measures): at worst every
+                # value is distinct
+                distinct = rows
+            span = self._span(query.from_table, column, scale)
+            bytes_before = column_bytes(imported, rows, distinct, span)
+
+            distinct_after = distinct
+            if target == POWERBI_DATE and span is not None:
+                # Times of day collapse into one value per day
+                distinct_after = min(distinct, span + 1)
+            bytes_after = column_bytes(target, rows, distinct_after, span)
+
+        return SqlColumnType(
+            column=column,
+            source_type=source_type,
+            source_powerbi_type=imported,
+            powerbi_type=target,
+            cast=cast,
+            reason=reason,
+            bytes_before=bytes_before,
+            bytes_after=bytes_after,
+        )
+
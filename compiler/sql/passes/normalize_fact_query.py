@@ -1,3 +1,4 @@
+from compiler.runtime.immutable import FrozenDict
 from compiler.sql.passes.base import SqlCompilerPass
 from compiler.sql.runtime.ir import (
     SqlQuery,
@@ -19,48 +20,62 @@ class NormalizeFactQueryPass(SqlCompilerPass):
     - bind aggregation semantics
     """
 
-    def run(self, query: SqlQuery) -> SqlQuery:
-        # Column aliases from the SELECT clause
-        column_aliases = [col.alias for col in query.select]
+    reads = frozenset({"select", "group_by"})
+    writes = frozenset({
+        "grain_columns",
+        "foreign_keys",
+        "measures",
+        "aggregations",
+        "dimension_columns",
+        "eliminated_joins",
+        "estimate",
+        "column_types",
+    })
+
+    # Shared empty mapping for aggregations and column types
+    EMPTY_AGGREGATIONS = FrozenDict()
 
+    def run(self, query: SqlQuery) -> SqlQuery:
         # Grain is defined by GROUP BY
-        grain_columns = list(query.group_by)
+        grain_columns = frozenset(query.group_by)
+
+        foreign_keys = []
+        date_columns = []
+        measures = []
+        seen_dates = set()
+
+        # Classify every SELECT alias once, with O(1) grain membership
+        for col in query.select:
+            alias = col.alias
+            if alias in grain_columns:
+                continue
 
-        # Foreign keys: heuristically, columns ending with "_id" and not part of the grain
-        foreign_keys = [
-            alias
-            for alias in column_aliases
-            if alias.endswith("_id") and alias not in grain_columns
-        ]
+            # Foreign keys: heuristically, columns ending with "_id"
+            if alias.endswith("_id"):
+                foreign_keys.append(alias)
 
-        # Dimension-like columns: foreign keys + date-like columns (e.g. *_date),
-        # excluding grain columns to avoid duplication
-        dimension_columns = list(foreign_keys)
-        for alias in column_aliases:
-            if (
-                alias.endswith("_date")
-                and alias not in dimension_columns
-                and alias not in grain_columns
-            ):
-                dimension_columns.append(alias)
+            # Date-like columns (e.g. *_date) are dimension-like, not measures
+            elif alias.endswith("_date"):
+                if alias not in seen_dates:
+                    seen_dates.add(alias)
+                    date_columns.append(alias)
 
-        # Measures: non-grain, non-FK, non-date columns
-        measures = [
-            alias
-            for alias in column_aliases
-            if alias not in grain_columns
-            and alias not in foreign_keys
-            and not alias.endswith("_date")
-        ]
+            # Measures: non-grain, non-FK, non-date columns
+            else:
+                measures.append(alias)
 
+        # Structural fields are shared with the input query
         return SqlFactQuery(
             select=query.select,
             from_table=query.from_table,
             joins=query.joins,
             group_by=query.group_by,
-            grain_columns=grain_columns,
-            foreign_keys=foreign_keys,
-            measures=measures,
-            aggregations={},
-            dimension_columns=dimension_columns,
-        )
\ No newline at end of file
+            grain_columns=query.group_by,
+            foreign_keys=tuple(foreign_keys),
+            measures=tuple(measures),
+            aggregations=self.EMPTY_AGGREGATIONS,
+            dimension_columns=tuple(foreign_keys + date_columns),
+            eliminated_joins=(),
+            estimate=None,
+            column_types=self.EMPTY_AGGREGATIONS,
+        )
@@ -1,18 +1,39 @@
-from typing import List
+import dataclasses
+from typing import List, Optional, Sequence
+from compiler.runtime.instrumentation import PipelineHooks, run_passes
 from compiler.sql.runtime.ir import SqlQuery
-from compiler.sql.passes.base import SqlCompilerPass
+from compiler.sql.passes.base import SqlCompilerPass, check_field_flow
+
+# Fields set on every query entering the pipeline (SQL IR builder)
+INPUT_FIELDS = frozenset(field.name for field in dataclasses.fields(SqlQuery))
 
 
 class SqlCompilerPipeline:
     """
     Sequential SQL compiler pipeline.
+
+    Raises ValueError on construction when a pass reads a field no
+    earlier pass writes.
     """
 
-    def __init__(self, passes: List[SqlCompilerPass]):
+    def __init__(
+        self,
+        passes: List[SqlCompilerPass],
+        hooks: Optional[List[PipelineHooks]] = None,
+    ):
+        check_field_flow(passes, INPUT_FIELDS)
         self._passes = passes
+        self._hooks = list(hooks or [])
+
+    def add_hook(self, hook: PipelineHooks) -> None:
+        self._hooks.append(hook)
 
     def run(self, query: SqlQuery) -> SqlQuery:
-        current = query
-        for compiler_pass in self._passes:
-            current = compiler_pass.run(current)
-        return current
\ No newline at end of file
+        return run_passes(self._passes, query, self._hooks)
+
+    def run_all(self, queries: Sequence[SqlQuery]) -> List[SqlQuery]:
+        """
+        Runs the pipeline over all queries of a model in one call.
+        Each pass processes the whole batch before the next pass starts.
+        """
+        return run_passes(self._passes, list(queries), self._hooks, batch=True)
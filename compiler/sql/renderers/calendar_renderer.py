@@ -0,0 +1,73 @@
+from typing import List
+
+from compiler.sql.renderers.base import SqlRenderer
+from compiler.sql.runtime.ir import SqlCalendar
+
+
+class CalendarTableRenderer(SqlRenderer):
+    """
+    Renders a generated calendar dimension as a self-contained script:
+    table DDL keyed on the integer date key, removal of days outside
+    the declared range, and REPLACE of every day in it.
+
+    Re-running the script is idempotent and reads no source table. A
+    view of the same name from an earlier deployment must be dropped
+    first. The statements run on both MySQL and SQLite (after stripping
+    table options).
+    """
+
+    BATCH_SIZE = 250
+
+    def __init__(self, calendar: SqlCalendar):
+        self.calendar = calendar
+
+    def render(self) -> str:
+        c = self.calendar
+        first_key, last_key = self._range_keys()
+        statements = [
+            f"-- Calendar dimension {c.table}: one row per day from "
+            f"{c.start} to {c.end} (exclusive).\n"
+            f"-- Generated from the semantic contract; reads no source table.\n"
+            + self._render_create(),
+            f"DELETE FROM `{c.table}`\n"
+            f"WHERE `{c.date_key}` < {first_key} "
+            f"OR `{c.date_key}` > {last_key};",
+        ]
+
+        column_list = ", ".join(f"`{column.name}`" for column in c.columns)
+        for i in range(0, len(c.rows), self.BATCH_SIZE):
+            values = ",\n".join(
+                self._render_row(row) for row in c.rows[i:i + self.BATCH_SIZE]
+            )
+            statements.append(
+                f"REPLACE INTO `{c.table}` ({column_list}) VALUES\n{values};"
+            )
+
+        return "\n\n".join(statements) + "\n"
+
+    def _range_keys(self):
+        rows = self.calendar.rows
+        if not rows:
+            return 0, -1
+        return rows[0][0], rows[-1][0]
+
+    def _render_create(self) -> str:
+        c = self.calendar
+        definitions: List[str] = [
+            f"  `{column.name}` {column.data_type} NOT NULL"
+            for column in c.columns
+        ]
+        definitions.append(f"  PRIMARY KEY (`{c.date_key}`)")
+        definitions.append(f"  UNIQUE (`{c.key}`)")
+        return (
+            f"CREATE TABLE IF NOT EXISTS `{c.table}` (\n"
+            + ",\n".join(definitions)
+            + "\n) ENGINE=InnoDB;"
+        )
+
+    @staticmethod
+    def _render_row(row) -> str:
+        return "(" + ", ".join(
+            f"'{value}'" if isinstance(value, str) else str(value)
+            for value in row
+        ) + ")"
@@ -0,0 +1,72 @@
+from typing import List, Optional
+
+from compiler.sql.renderers.base import SqlRenderer
+from compiler.sql.runtime.ir import SqlFactQuery
+
+
+def _size(size: Optional[int]) -> str:
+    if size is None:
+        return "—"
+    for unit in ("B", "KB", "MB"):
+        if size < 1024:
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GB"
+
+
+class ColumnTypeReportRenderer(SqlRenderer):
+    """
+    Renders a Markdown report of the Power BI type of every typed
+    column of a fact query, and the estimated model-size savings of
+    the narrowed ones.
+    """
+
+    def __init__(self, query: SqlFactQuery):
+        self.query = query
+
+    def render(self) -> str:
+        lines: List[str] = [
+            f"# Column Types — {self.query.from_table}",
+            "",
+            "| Column | MySQL type | Imported as | Narrowed to | CAST "
+            "| Est. size before | Est. size after | Reason |",
+            "|--------|------------|-------------|-------------|------"
+            "|------------------|-----------------|--------|",
+        ]
+
+        saved = 0
+        estimated = False
+        missing: List[str] = []
+        for column_type in self.query.column_types.values():
+            narrowed = column_type.cast is not None
+            lines.append(
+                f"| {column_type.column} "
+                f"| {column_type.source_type} "
+                f"| {column_type.source_powerbi_type} "
+                f"| {column_type.powerbi_type if narrowed else '—'} "
+                f"| {column_type.cast or '—'} "
+                f"| {_size(column_type.bytes_before)} "
+                f"| {_size(column_type.bytes_after)} "
+                f"| {column_type.reason} |"
+            )
+            if not narrowed:
+                continue
+            if column_type.bytes_before is not None and column_type.bytes_after is not None:
+                saved += column_type.bytes_before - column_type.bytes_after
+                estimated = True
+            else:
+                missing.append(column_type.column)
+
+        if estimated:
+            lines += ["", f"Estimated model-size savings: {_size(saved)}"]
+            if missing:
+                lines.append(
+                    f"Not estimated (no statistics): {', '.join(missing)}"
+                )
+        elif missing:
+            lines += [
+                "",
+                "Model-size savings are estimated only for facts with "
+                "statistics in stats/tables.yml.",
+            ]
+        return "\n".join(lines) + "\n"
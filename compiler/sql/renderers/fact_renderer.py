@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Optional
 
 from compiler.sql.renderers.base import SqlRenderer
 from compiler.sql.runtime.ir import (
@@ -6,6 +6,7 @@ from compiler.sql.runtime.ir import (
     SqlJoin,
     SqlSelectColumn,
     SqlMeasureAggregation,
+    SqlRangeFilter,
 )
 
 
@@ -14,31 +15,63 @@ class FactQueryRenderer(SqlRenderer):
     Renders a SqlFactQuery into a deterministic SQL string.
 
     Foundations:
-    - Single SELECT
+    - Header comment listing joins eliminated by the optimizer and
+      the cost estimate (full render mode only)
+    - Single SELECT, with a CAST for every column whose type was narrowed
     - FROM fact table
     - LEFT JOIN dimensions (if present)
+    - WHERE range filter (partitioned render mode only)
     - GROUP BY grain columns
+
+    Partitioned render mode: with a `range_filter` the fact rows are
+    restricted to lower <= column < upper, either for Power BI
+    incremental refresh (RangeStart / RangeEnd parameters) or for a
+    single period partition (date literals). The estimate covers the
+    unfiltered query, so it is not rendered in this mode.
     """
 
-    def __init__(self, query: SqlFactQuery):
+    def __init__(
+        self,
+        query: SqlFactQuery,
+        range_filter: Optional[SqlRangeFilter] = None,
+    ):
         self.query = query
+        self.range_filter = range_filter
 
     def render(self) -> str:
+        comment_clause = self._render_comments()
         select_clause = self._render_select()
         from_clause = self._render_from()
         join_clause = self._render_joins()
+        where_clause = self._render_where()
         group_by_clause = self._render_group_by()
 
         clauses = [
+            comment_clause,
             select_clause,
             from_clause,
             join_clause,
+            where_clause,
             group_by_clause,
         ]
 
         # Filter empty clauses deterministically
         return "\n".join([c for c in clauses if c])
 
+    def _render_comments(self) -> str:
+        comments = [
+            f"-- eliminated {join.join_type} JOIN {join.table} ON {join.on}"
+            for join in self.query.eliminated_joins
+        ]
+
+        estimate = self.query.estimate
+        if estimate is not None and self.range_filter is None:
+            comments.append(
+                f"-- estimated rows: {estimate.rows}, cost: {estimate.cost}"
+            )
+
+        return "\n".join(comments)
+
     def _render_select(self) -> str:
         columns: List[str] = []
 
@@ -52,13 +85,25 @@ class FactQueryRenderer(SqlRenderer):
             if col not in columns:
                 columns.append(col)
 
+        rendered = [
+            self._cast(col, col.rpartition(".")[2]) for col in columns
+        ]
+
         # Aggregated measures
         for measure, aggregation in self.query.aggregations.items():
-            columns.append(
-                f"{aggregation.aggregation}({measure}) AS {measure}"
+            rendered.append(
+                self._cast(f"{aggregation.aggregation}({measure})", measure)
             )
 
-        return "SELECT\n  " + ",\n  ".join(columns)
+        return "SELECT\n  " + ",\n  ".join(rendered)
+
+    def _cast(self, expression: str, alias: str) -> str:
+        column_type = self.query.column_types.get(alias)
+        if column_type is not None and column_type.cast is not None:
+            return f"CAST({expression} AS {column_type.cast}) AS {alias}"
+        if expression.rpartition(".")[2] == alias:
+            return expression
+        return f"{expression} AS {alias}"
 
     def _render_from(self) -> str:
         return f"FROM {self.query.from_table}"
@@ -75,6 +120,16 @@ class FactQueryRenderer(SqlRenderer):
 
         return "\n".join(rendered)
 
+    def _render_where(self) -> str:
+        if self.range_filter is None:
+            return ""
+
+        column = f"{self.query.from_table}.{self.range_filter.column}"
+        return (
+            f"WHERE {column} >= {self.range_filter.lower}\n"
+            f"  AND {column} < {self.range_filter.upper}"
+        )
+
     def _render_group_by(self) -> str:
         if not self.query.group_by:
             return ""
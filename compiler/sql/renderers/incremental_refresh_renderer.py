@@ -0,0 +1,49 @@
+from compiler.sql.renderers.base import SqlRenderer
+from compiler.sql.runtime.ir import RANGE_END_PARAMETER, RANGE_START_PARAMETER
+
+
+def m_string(text: str) -> str:
+    """
+    Power Query (M) text literal.
+    """
+    escaped = text.replace('"', '""').replace("\n", "#(lf)")
+    return f"\"{escaped}\""
+
+
+class IncrementalRefreshQueryRenderer(SqlRenderer):
+    """
+    Renders the Power Query (M) source of an incrementally refreshed
+    fact table.
+
+    The rendered SQL template filters on the RangeStart / RangeEnd
+    placeholders; the M expression binds them to the Power BI
+    parameters of the same name, which the service sets per partition.
+    Expects `Server` and `Database` parameters in the Power BI model.
+    """
+
+    DATETIME_FORMAT = "yyyy-MM-dd HH:mm:ss"
+
+    def __init__(self, sql: str):
+        self.sql = sql
+
+    def render(self) -> str:
+        return "\n".join([
+            "let",
+            f"    Query = {m_string(self.sql)},",
+            "    Bound = Text.Replace(",
+            "        Text.Replace(",
+            f"            Query, \"{RANGE_START_PARAMETER}\", "
+            f"{self._m_datetime('RangeStart')}",
+            "        ),",
+            f"        \"{RANGE_END_PARAMETER}\", {self._m_datetime('RangeEnd')}",
+            "    ),",
+            "    Source = MySQL.Database(Server, Database, [Query = Bound])",
+            "in",
+            "    Source",
+        ]) + "\n"
+
+    def _m_datetime(self, parameter: str) -> str:
+        return (
+            f"\"'\" & DateTime.ToText({parameter}, "
+            f"\"{self.DATETIME_FORMAT}\") & \"'\""
+        )
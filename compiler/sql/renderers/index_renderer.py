@@ -0,0 +1,60 @@
+from typing import List, Sequence
+
+from compiler.sql.advisor.index_advisor import IndexRecommendation
+from compiler.sql.renderers.base import SqlRenderer
+
+
+class IndexDdlRenderer(SqlRenderer):
+    """
+    Renders index recommendations as MySQL CREATE INDEX statements,
+    one per line, in recommendation order.
+    """
+
+    def __init__(self, recommendations: Sequence[IndexRecommendation]):
+        self.recommendations = recommendations
+
+    def render(self) -> str:
+        lines = [
+            "-- Generated by the index advisor from compiled SQL IR.",
+            "-- Apply to the source database; do not edit.",
+        ]
+        for recommendation in self.recommendations:
+            columns = ", ".join(
+                f"`{column}`" for column in recommendation.all_columns
+            )
+            lines.append(
+                f"CREATE INDEX `{recommendation.name}` "
+                f"ON `{recommendation.table}` ({columns});"
+            )
+        return "\n".join(lines) + "\n"
+
+
+class IndexReportRenderer(SqlRenderer):
+    """
+    Renders a Markdown report of which view or query benefits from
+    which recommended index.
+    """
+
+    def __init__(self, recommendations: Sequence[IndexRecommendation]):
+        self.recommendations = recommendations
+
+    def render(self) -> str:
+        lines: List[str] = [
+            "# Index Recommendations",
+            "",
+            "| Index | Table | Key columns | Covering columns | Used by |",
+            "|-------|-------|-------------|------------------|---------|",
+        ]
+        for recommendation in self.recommendations:
+            used_by = "<br>".join(
+                f"`{usage.source}` ({usage.access})"
+                for usage in recommendation.usages
+            )
+            lines.append(
+                f"| `{recommendation.name}` "
+                f"| `{recommendation.table}` "
+                f"| {', '.join(recommendation.columns)} "
+                f"| {', '.join(recommendation.covering) or '—'} "
+                f"| {used_by} |"
+            )
+        return "\n".join(lines) + "\n"
@@ -0,0 +1,111 @@
+from compiler.sql.renderers.base import SqlRenderer
+from compiler.sql.runtime.ir import SqlKeyMap
+
+
+class KeyMapTableRenderer(SqlRenderer):
+    """
+    Renders the DDL of a surrogate key map: the surrogate key as
+    primary key and the natural key as a unique column.
+
+    Idempotent (CREATE TABLE IF NOT EXISTS); run once per database.
+    The table statement also runs on SQLite (after stripping table options).
+    """
+
+    def __init__(self, key_map: SqlKeyMap):
+        self.key_map = key_map
+
+    def render(self) -> str:
+        k = self.key_map
+        return (
+            f"-- Surrogate key map of {k.dimension}; "
+            f"load with {k.dimension}.load.sql.\n"
+            f"CREATE TABLE IF NOT EXISTS `{k.table}` (\n"
+            f"  `{k.surrogate_key}` int unsigned NOT NULL,\n"
+            f"  `{k.key}` {k.key_type} NOT NULL,\n"
+            f"  PRIMARY KEY (`{k.surrogate_key}`),\n"
+            f"  UNIQUE (`{k.key}`)\n"
+            f") ENGINE=InnoDB;\n"
+        )
+
+
+class KeyMapLoadRenderer(SqlRenderer):
+    """
+    Renders the load script of a surrogate key map as a single
+    transaction inserting the natural keys not mapped yet.
+
+    Keys are stable: mapped keys are never updated or renumbered. New
+    keys continue densely from the highest assigned surrogate key, in
+    natural key order, so a load is deterministic for a given source.
+    The key map is locked for the transaction, so concurrent loads
+    cannot assign the same surrogate key.
+
+    Every load reads all source keys and inserts those with no row in
+    the key map (NOT EXISTS anti-join on its unique natural key), so
+    keys of late or backdated source rows are never missed. Requires
+    MySQL 8.0+ (window functions).
+    """
+
+    def __init__(self, key_map: SqlKeyMap):
+        self.key_map = key_map
+
+    def render(self) -> str:
+        k = self.key_map
+        statements = [
+            "START TRANSACTION;",
+            f"SELECT COALESCE(MAX({k.surrogate_key}), 0) INTO @last_key\n"
+            f"FROM {k.table}\n"
+            f"FOR UPDATE;",
+            self._render_insert(),
+            "COMMIT;",
+        ]
+        return self._render_header() + "\n\n".join(statements) + "\n"
+
+    def _render_header(self) -> str:
+        k = self.key_map
+        return (
+            f"-- Assigns surrogate keys to {k.key} values of "
+            f"{k.source_table} missing from {k.table}.\n"
+            f"-- Mapped keys are never renumbered.\n"
+        )
+
+    def _render_insert(self) -> str:
+        k = self.key_map
+        return (
+            f"INSERT INTO {k.table} ({k.surrogate_key}, {k.key})\n"
+            f"SELECT\n"
+            f"  @last_key + ROW_NUMBER() OVER (ORDER BY src.{k.key}),\n"
+            f"  src.{k.key}\n"
+            f"FROM (\n"
+            f"  SELECT DISTINCT {k.key_expression} AS {k.key}\n"
+            f"  FROM {k.source}\n"
+            f"  WHERE {k.filter}\n"
+            f"    AND NOT EXISTS (\n"
+            f"      SELECT 1 FROM {k.table} AS km\n"
+            f"      WHERE km.{k.key} = {k.key_expression}\n"
+            f"    )\n"
+            f") AS src;"
+        )
+
+
+class KeyedDimensionViewRenderer(SqlRenderer):
+    """
+    Renders the dimension view extended with its surrogate key, the
+    relationship column for facts carrying surrogate keys.
+
+    Members whose key is not mapped yet are hidden until the next
+    key map load.
+    """
+
+    def __init__(self, key_map: SqlKeyMap):
+        self.key_map = key_map
+
+    def render(self) -> str:
+        k = self.key_map
+        columns = [f"km.{k.surrogate_key}"] + [f"d.{c}" for c in k.columns]
+        return (
+            f"CREATE OR REPLACE VIEW {k.view} AS\n"
+            f"SELECT\n    "
+            + ",\n    ".join(columns)
+            + f"\nFROM {k.dimension} d\n"
+            f"JOIN {k.table} km ON km.{k.key} = d.{k.key};\n"
+        )
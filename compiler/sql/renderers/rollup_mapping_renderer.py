@@ -0,0 +1,65 @@
+import json
+from typing import Dict, List
+
+from compiler.sql.renderers.base import SqlRenderer
+from compiler.sql.runtime.ir import SqlRollupQuery
+
+
+class RollupMappingRenderer(SqlRenderer):
+    """
+    Renders the Power BI aggregation mapping of a SqlRollupQuery as JSON.
+
+    Every rollup column maps to its detail column on the fact:
+    - grain columns as GroupBy
+    - measures by the summarization matching their SQL aggregation
+
+    The rollup table is hidden; Power BI routes matching queries to it
+    (Manage aggregations), trying higher precedence first.
+    """
+
+    SUMMARIZATIONS: Dict[str, str] = {
+        "SUM": "Sum",
+        "COUNT": "Count",
+        "MIN": "Min",
+        "MAX": "Max",
+    }
+
+    def __init__(self, query: SqlRollupQuery):
+        self.query = query
+
+    def render(self) -> str:
+        mapping = {
+            "table": self.query.name,
+            "detail_table": self.query.from_table,
+            "precedence": self.query.precedence,
+            "is_hidden": True,
+            "columns": self._render_columns(),
+        }
+        return json.dumps(mapping, indent=2) + "\n"
+
+    def _render_columns(self) -> List[dict]:
+        # Surrogate keys are qualified by their key map
+        columns = [
+            self._column(column.rpartition(".")[2], "GroupBy")
+            for column in self.query.grain_columns
+        ]
+
+        for measure, aggregation in self.query.aggregations.items():
+            summarization = self.SUMMARIZATIONS.get(aggregation.aggregation)
+            if summarization is None:
+                raise ValueError(
+                    f"rollup '{self.query.name}' measure '{measure}': "
+                    f"aggregation {aggregation.aggregation} has no "
+                    f"Power BI summarization"
+                )
+            columns.append(self._column(measure, summarization))
+
+        return columns
+
+    def _column(self, column: str, summarization: str) -> dict:
+        return {
+            "column": column,
+            "summarization": summarization,
+            "detail_table": self.query.from_table,
+            "detail_column": column,
+        }
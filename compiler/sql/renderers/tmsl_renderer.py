@@ -0,0 +1,193 @@
+import datetime
+import json
+from typing import List
+
+from compiler.sql.cost.model_size import POWERBI_DATE, POWERBI_DATETIME
+from compiler.sql.renderers.base import SqlRenderer
+from compiler.sql.renderers.incremental_refresh_renderer import (
+    IncrementalRefreshQueryRenderer,
+    m_string,
+)
+from compiler.sql.runtime.ir import (
+    SqlModel,
+    SqlModelColumn,
+    SqlModelTable,
+    SqlRefreshPolicy,
+)
+
+
+class TmslModelRenderer(SqlRenderer):
+    """
+    Renders a SqlModel as a Power BI / Analysis Services model definition
+    (TMSL `model.bim`, JSON).
+
+    - every table reads its MySQL query through a Power Query partition
+      (`MySQL.Database(Server, Database, [Query = ...])`) in its
+      storage mode; the reason for the mode is kept as an annotation
+    - date columns are dateTime columns formatted as dates
+    - calendar dimensions are marked as date tables (Time data
+      category, key date column)
+    - aggregation tables map their columns to the detail fact
+      (`alternateOf`)
+    - imported partitioned facts carry an incremental refresh policy
+      with a rolling window over the declared range
+
+    `Server` and `Database` are model parameters to set before the
+    first refresh. RangeStart / RangeEnd default to the widest declared
+    refresh range.
+    """
+
+    COMPATIBILITY_LEVEL = 1567
+    MODEL_NAME = "SemanticModel"
+
+    def __init__(self, model: SqlModel):
+        self.model = model
+
+    def render(self) -> str:
+        model = {
+            "culture": "en-US",
+            "defaultPowerBIDataSourceVersion": "powerBI_V3",
+            "tables": [self._table(table) for table in self.model.tables],
+            "relationships": [
+                {
+                    "name": (
+                        f"{r.from_table}_{r.from_column}__"
+                        f"{r.to_table}_{r.to_column}"
+                    ),
+                    "fromTable": r.from_table,
+                    "fromColumn": r.from_column,
+                    "toTable": r.to_table,
+                    "toColumn": r.to_column,
+                }
+                for r in self.model.relationships
+            ],
+            "expressions": self._expressions(),
+        }
+        document = {
+            "name": self.MODEL_NAME,
+            "compatibilityLevel": self.COMPATIBILITY_LEVEL,
+            "model": model,
+        }
+        return json.dumps(document, indent=2) + "\n"
+
+    # ---------- tables ----------
+
+    def _table(self, table: SqlModelTable) -> dict:
+        rendered = {"name": table.name}
+        if table.is_hidden:
+            rendered["isHidden"] = True
+        if table.is_date_table:
+            rendered["dataCategory"] = "Time"
+
+        rendered["columns"] = [self._column(column) for column in table.columns]
+        rendered["partitions"] = [{
+            "name": table.name,
+            "mode": table.storage.mode,
+            "source": {
+                "type": "m",
+                "expression": self._m_lines(self._m_query(table.source)),
+            },
+        }]
+        if table.refresh_policy is not None:
+            rendered["refreshPolicy"] = self._refresh_policy(table.refresh_policy)
+
+        rendered["annotations"] = [
+            {"name": "StorageModeReason", "value": table.storage.reason},
+        ]
+        return rendered
+
+    def _column(self, column: SqlModelColumn) -> dict:
+        rendered = {
+            "name": column.name,
+            "dataType": (
+                POWERBI_DATETIME if column.data_type == POWERBI_DATE
+                else column.data_type
+            ),
+            "sourceColumn": column.name,
+            "summarizeBy": column.summarize_by,
+        }
+        if column.data_type == POWERBI_DATE:
+            rendered["formatString"] = "Long Date"
+        if column.is_key:
+            rendered["isKey"] = True
+        if column.is_hidden:
+            rendered["isHidden"] = True
+        if column.alternate_of is not None:
+            rendered["alternateOf"] = {
+                "baseColumn": {
+                    "table": column.alternate_of.table,
+                    "column": column.alternate_of.column,
+                },
+                "summarization": column.alternate_of.summarization,
+            }
+        if column.data_type == POWERBI_DATE:
+            rendered["annotations"] = [
+                {"name": "UnderlyingDateTimeDataType", "value": "Date"},
+            ]
+        return rendered
+
+    def _refresh_policy(self, policy: SqlRefreshPolicy) -> dict:
+        return {
+            "policyType": "basic",
+            "rollingWindowGranularity": policy.granularity,
+            "rollingWindowPeriods": policy.archive_periods,
+            "incrementalGranularity": policy.granularity,
+            "incrementalPeriods": policy.refresh_periods,
+            "sourceExpression": self._m_lines(
+                IncrementalRefreshQueryRenderer(policy.source).render()
+            ),
+        }
+
+    # ---------- parameters ----------
+
+    def _expressions(self) -> List[dict]:
+        expressions = [
+            self._parameter("Server", m_string("localhost"), "Text"),
+            self._parameter("Database", m_string("database"), "Text"),
+        ]
+
+        policies = [
+            table.refresh_policy for table in self.model.tables
+            if table.refresh_policy is not None
+        ]
+        if policies:
+            start = min(policy.start for policy in policies)
+            end = max(policy.end for policy in policies)
+            expressions += [
+                self._parameter("RangeStart", self._m_datetime(start), "DateTime"),
+                self._parameter("RangeEnd", self._m_datetime(end), "DateTime"),
+            ]
+        return expressions
+
+    @staticmethod
+    def _parameter(name: str, value: str, parameter_type: str) -> dict:
+        return {
+            "name": name,
+            "kind": "m",
+            "expression": (
+                f"{value} meta [IsParameterQuery=true, "
+                f"Type=\"{parameter_type}\", IsParameterQueryRequired=true]"
+            ),
+        }
+
+    # ---------- Power Query ----------
+
+    @staticmethod
+    def _m_query(sql: str) -> str:
+        return "\n".join([
+            "let",
+            f"    Source = MySQL.Database(Server, Database, "
+            f"[Query = {m_string(sql)}])",
+            "in",
+            "    Source",
+        ])
+
+    @staticmethod
+    def _m_datetime(iso_date: str) -> str:
+        day = datetime.date.fromisoformat(iso_date)
+        return f"#datetime({day.year}, {day.month}, {day.day}, 0, 0, 0)"
+
+    @staticmethod
+    def _m_lines(expression: str) -> List[str]:
+        # TMSL stores multi-line expressions as arrays of lines
+        return expression.rstrip("\n").split("\n")
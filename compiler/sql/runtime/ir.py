@@ -1,10 +1,11 @@
-from dataclasses import dataclass
-from typing import List, Dict
+from typing import Mapping, Optional, Tuple
+
+from compiler.runtime.immutable import frozen_slots
 
 
 # ---------- SQL SELECT ----------
 
-@dataclass(frozen=True)
+@frozen_slots
 class SqlSelectColumn:
     """
     Represents a single column in a SELECT clause.
@@ -15,7 +16,7 @@ class SqlSelectColumn:
 
 # ---------- SQL JOIN ----------
 
-@dataclass(frozen=True)
+@frozen_slots
 class SqlJoin:
     """
     Semantic representation of a SQL JOIN.
@@ -24,23 +25,59 @@ class SqlJoin:
     on: str
     join_type: str = "LEFT"
 
+    def equi_columns(self) -> Optional[Tuple[Tuple[str, str], Tuple[str, str]]]:
+        """
+        Splits an `a.x = b.y` condition into ((a, x), (b, y));
+        None for any other condition.
+        """
+        sides = [side.strip() for side in self.on.split("=")]
+        if len(sides) != 2:
+            return None
+        parsed = []
+        for side in sides:
+            table, dot, column = side.partition(".")
+            if not dot or not table or not column or " " in side:
+                return None
+            parsed.append((table, column))
+        return parsed[0], parsed[1]
+
+
+# ---------- SQL RANGE FILTER ----------
+
+# Power BI incremental refresh parameters, bound per partition at refresh
+RANGE_START_PARAMETER = "@RangeStart"
+RANGE_END_PARAMETER = "@RangeEnd"
+
+@frozen_slots
+class SqlRangeFilter:
+    """
+    Half-open range predicate: lower <= column < upper.
+
+    `lower` and `upper` are SQL expressions (literals or parameters).
+    `label` names the partition the range selects.
+    """
+    column: str
+    lower: str
+    upper: str
+    label: str
+
 
 # ---------- BASE SQL QUERY ----------
 
-@dataclass(frozen=True)
+@frozen_slots
 class SqlQuery:
     """
     Base SQL query abstraction.
     """
-    select: List[SqlSelectColumn]
+    select: Tuple[SqlSelectColumn, ...]
     from_table: str
-    joins: List[SqlJoin]
-    group_by: List[str]
+    joins: Tuple[SqlJoin, ...]
+    group_by: Tuple[str, ...]
 
 
 # ---------- MEASURE AGGREGATION ----------
 
-@dataclass(frozen=True)
+@frozen_slots
 class SqlMeasureAggregation:
     """
     Semantic definition of a measure aggregation.
@@ -49,15 +86,276 @@ class SqlMeasureAggregation:
     aggregation: str
 
 
+# ---------- COST ESTIMATE ----------
+
+@frozen_slots
+class SqlCostEstimate:
+    """
+    Statistics-based estimate of a query.
+
+    rows: estimated result cardinality
+    cost: estimated rows processed (scan, join build and probe, grouping)
+    """
+    rows: int
+    cost: int
+
+
+# ---------- COLUMN TYPE ----------
+
+@frozen_slots
+class SqlColumnType:
+    """
+    Power BI type of a result column, narrowed from its MySQL type.
+
+    source_type:         MySQL type the query returns without a cast
+    source_powerbi_type: Power BI type `source_type` imports as
+    powerbi_type:        narrowed Power BI type
+    cast:                MySQL CAST target producing `powerbi_type`;
+                         None when the column is imported unchanged
+    reason:              why the type was or was not narrowed
+    bytes_before/after:  estimated column size in the model, when
+                         statistics allow
+    """
+    column: str
+    source_type: str
+    source_powerbi_type: str
+    powerbi_type: str
+    cast: Optional[str]
+    reason: str
+    bytes_before: Optional[int] = None
+    bytes_after: Optional[int] = None
+
+
 # ---------- FACT SQL QUERY ----------
 
-@dataclass(frozen=True)
+@frozen_slots
 class SqlFactQuery(SqlQuery):
     """
     Specialized SQL query representing a FACT.
+
+    `eliminated_joins` are dimension joins removed by the optimizer,
+    kept for reporting only. `estimate` is set by the cost model when
+    table statistics are available. `column_types` maps result column
+    names to their narrowed Power BI types.
+    """
+    grain_columns: Tuple[str, ...]
+    foreign_keys: Tuple[str, ...]
+    measures: Tuple[str, ...]
+    aggregations: Mapping[str, SqlMeasureAggregation]
+    dimension_columns: Tuple[str, ...]
+    eliminated_joins: Tuple[SqlJoin, ...]
+    estimate: Optional[SqlCostEstimate]
+    column_types: Mapping[str, SqlColumnType]
+
+
+# ---------- ROLLUP SQL QUERY ----------
+
+@frozen_slots
+class SqlRollupQuery(SqlFactQuery):
+    """
+    Fact query re-aggregated at a coarser grain.
+
+    `from_table` is the detail fact the rollup summarizes; `name` is
+    the generated summary view.
+    """
+    name: str
+    precedence: int
+
+
+# ---------- MATERIALIZED DIMENSION ----------
+
+# Keyed by materialized table; holds the last loaded watermark
+WATERMARK_TABLE = "etl_watermark"
+
+@frozen_slots
+class SqlMaterializedColumn:
+    """
+    A column of a materialized table and the source expression that
+    fills it. `data_type` is the declared MySQL type of the source column.
+    """
+    name: str
+    expression: str
+    data_type: str
+    nullable: bool
+
+
+@frozen_slots
+class SqlMaterialization:
+    """
+    Keyed table materializing a dimension view, loaded by upsert.
+
+    source:       FROM clause of the view
+    source_table: base table read by the view
+    filter:       WHERE predicate of the load (view filter, non-NULL key)
+    watermark:    source column bounding incremental loads; None
+                  reloads the whole source
+    lookback_days: days before the stored watermark re-read by each
+                  incremental load
+    """
+    dimension: str
+    table: str
+    key: str
+    columns: Tuple[SqlMaterializedColumn, ...]
+    source: str
+    source_table: str
+    filter: str
+    watermark: Optional[str]
+    lookback_days: int
+
+
+# ---------- SURROGATE KEY MAP ----------
+
+@frozen_slots
+class SqlKeyMap:
+    """
+    Key-map table assigning dense integer surrogate keys to the values
+    of a dimension key, loaded from the dimension's source.
+
+    key_type:       declared MySQL type of the natural key source column
+    key_expression: source expression of the natural key in the view
+    source:         FROM clause of the dimension view
+    filter:         WHERE predicate of the load (view filter, non-NULL key)
+    view:           keyed dimension view (surrogate key + view columns)
+    columns:        columns of the dimension view, in order
+    """
+    dimension: str
+    table: str
+    key: str
+    key_type: str
+    surrogate_key: str
+    key_expression: str
+    source: str
+    source_table: str
+    filter: str
+    view: str
+    columns: Tuple[str, ...]
+
+
+# ---------- CALENDAR DIMENSION ----------
+
+@frozen_slots
+class SqlCalendarColumn:
+    """
+    A column of a generated calendar table; `data_type` is MySQL.
+    """
+    name: str
+    data_type: str
+
+
+@frozen_slots
+class SqlCalendar:
+    """
+    Generated calendar table with one precomputed row per day.
+
+    date_key: integer key (YYYYMMDD), first column of every row
+    key:      dimension key column holding the date itself
+    rows:     values in column order, for start <= date < end
+    """
+    table: str
+    date_key: str
+    key: str
+    columns: Tuple[SqlCalendarColumn, ...]
+    rows: Tuple[Tuple, ...]
+    start: str
+    end: str
+
+
+# ---------- POWER BI MODEL ----------
+
+# TMSL partition modes
+STORAGE_IMPORT = "import"
+STORAGE_DIRECTQUERY = "directQuery"
+STORAGE_DUAL = "dual"
+
+@frozen_slots
+class SqlStorageMode:
+    """
+    Power BI storage mode chosen for a model table.
+
+    rows:   row count the choice was based on; None when unknown
+    reason: why the mode was chosen
+    """
+    mode: str
+    rows: Optional[int]
+    reason: str
+
+
+@frozen_slots
+class SqlAlternateOf:
+    """
+    Detail column an aggregation-table column stands in for.
+    `summarization` is a TMSL summarization (groupBy, sum, ...).
+    """
+    table: str
+    column: str
+    summarization: str
+
+
+@frozen_slots
+class SqlModelColumn:
+    """
+    A column of a Power BI model table.
+
+    data_type:    TMSL data type
+    summarize_by: TMSL default summarization (none, sum, count, ...)
+    """
+    name: str
+    data_type: str
+    summarize_by: str = "none"
+    is_key: bool = False
+    is_hidden: bool = False
+    alternate_of: Optional[SqlAlternateOf] = None
+
+
+@frozen_slots
+class SqlRefreshPolicy:
+    """
+    Incremental refresh of an imported fact: the last `archive_periods`
+    periods of `granularity` before the refresh date are kept and the
+    last `refresh_periods` of them reloaded, each read by `source` with
+    RangeStart / RangeEnd bound. [start, end) (ISO dates) is the range
+    loaded before the first refresh.
+    """
+    granularity: str
+    archive_periods: int
+    refresh_periods: int
+    start: str
+    end: str
+    source: str
+
+
+@frozen_slots
+class SqlModelTable:
+    """
+    A table of the Power BI model and the MySQL query it reads.
+
+    is_date_table: marked as date table (calendar dimensions)
+    """
+    name: str
+    source: str
+    columns: Tuple[SqlModelColumn, ...]
+    storage: SqlStorageMode
+    is_hidden: bool = False
+    is_date_table: bool = False
+    refresh_policy: Optional[SqlRefreshPolicy] = None
+
+
+@frozen_slots
+class SqlModelRelationship:
+    """
+    Many-to-one relationship from a fact or rollup column to a
+    dimension key.
+    """
+    from_table: str
+    from_column: str
+    to_table: str
+    to_column: str
+
+
+@frozen_slots
+class SqlModel:
+    """
+    Power BI model (tables and relationships) over the compiled SQL.
     """
-    grain_columns: List[str]
-    foreign_keys: List[str]
-    measures: List[str]
-    aggregations: Dict[str, SqlMeasureAggregation]
-    dimension_columns: List[str]
\ No newline at end of file
+    tables: Tuple[SqlModelTable, ...]
+    relationships: Tuple[SqlModelRelationship, ...]
@@ -0,0 +1,397 @@
+import argparse
+import datetime
+import glob
+import json
+import os
+import random
+import re
+import sqlite3
+import sys
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Dict, List, Optional
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+from validation.sql_index import SqlParseError, parse_view
+
+SCHEMA_PATH = "schema/raw/mysql.sql"
+VIEW_GLOBS = ("sql/dimensions/*.sql", "sql/facts/*.sql", "sql/views/*.sql")
+OUTPUT_GLOB = "output/sql/*.sql"
+CALENDAR_GLOB = "output/calendar/*.sql"
+KEY_MAP_GLOB = "output/keys/*.create.sql"
+KEY_MAP_SUFFIX = ".create.sql"
+KEYED_VIEW_GLOB = "output/keys/views/*.sql"
+INDEX_DDL_PATH = "output/indexes/mysql.sql"
+
+# Bound to @RangeStart / @RangeEnd in incremental-refresh queries;
+# the range covers every synthetic order date
+RANGE_PARAMETERS = {"RangeStart": "2023-01-01", "RangeEnd": "2025-01-01"}
+
+# ---------- CATALOG ----------
+
+def mysql_ddl_to_sqlite(ddl: str) -> str:
+    """
+    Rewrites the MySQL CREATE TABLE subset used in schema/ for SQLite.
+    Column types are kept as declared; SQLite maps them by affinity.
+    """
+    # Table options after the closing parenthesis (ENGINE, CHARSET, ...)
+    ddl = re.sub(r"\)\s*ENGINE\s*=[^;]*;", ");", ddl, flags=re.IGNORECASE)
+    ddl = re.sub(
+        r"\s+(CHARACTER SET|COLLATE)\s+\w+", "", ddl, flags=re.IGNORECASE
+    )
+    return ddl
+
+
+def create_catalog(schema_path: str = SCHEMA_PATH) -> sqlite3.Connection:
+    connection = sqlite3.connect(":memory:")
+    with open(schema_path) as f:
+        connection.executescript(mysql_ddl_to_sqlite(f.read()))
+    return connection
+
+# ---------- SYNTHETIC DATA ----------
+
+def _sales_row(rng: random.Random, i: int, rows: int) -> dict:
+    orders = max(1, rows // 3)
+    customers = max(1, rows // 50)
+    products = max(1, min(500, rows // 20))
+    regions = ("North", "South", "East", "West")
+    channels = ("Online", "Retail", "Partner")
+
+    order = rng.randrange(orders)
+    customer = order % customers
+    product = rng.randrange(products)
+    quantity = rng.randint(1, 20)
+    unit_price = round(1 + (product * 7.31) % 500, 2)
+    order_date = datetime.date(2023, 1, 1) + datetime.timedelta(
+        days=order % 730
+    )
+
+    return {
+        "OrderID": f"O{order:08d}"[:10],
+        "CustomerID": f"C{customer:07d}"[:10],
+        "CustomerName": f"Customer {customer}",
+        "Region": regions[customer % len(regions)],
+        "ProductID": f"P{product:07d}"[:10],
+        "ProductName": f"Product {product}",
+        "Quantity": quantity,
+        "UnitPrice": unit_price,
+        "TotalAmount": round(quantity * unit_price, 2),
+        "OrderDate": order_date.isoformat(),
+        "SalesChannel": channels[(order + product) % len(channels)],
+    }
+
+
+def _generic_value(rng: random.Random, declared_type: str, i: int):
+    declared_type = declared_type.lower()
+    if "int" in declared_type:
+        return rng.randint(0, 1000)
+    if "dec" in declared_type or "float" in declared_type or "double" in declared_type:
+        return round(rng.uniform(0, 1000), 2)
+    if "date" in declared_type:
+        return (datetime.date(2023, 1, 1) + datetime.timedelta(days=i % 730)).isoformat()
+    return f"v{rng.randrange(max(1, i // 10 + 1))}"
+
+
+def load_synthetic_data(
+    connection: sqlite3.Connection,
+    rows: int,
+    seed: int = 42,
+) -> Dict[str, int]:
+    """
+    Fills every catalog table with `rows` deterministic synthetic rows.
+    sales_data gets realistic keys and cardinalities; other tables get
+    type-driven values.
+    """
+    rng = random.Random(seed)
+    loaded = {}
+
+    tables = [
+        name for (name,) in connection.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'table' ORDER BY name"
+        )
+    ]
+
+    for table in tables:
+        columns = [
+            (name, declared_type)
+            for _, name, declared_type, *_ in connection.execute(
+                f'PRAGMA table_info("{table}")'
+            )
+        ]
+        names = [name for name, _ in columns]
+        placeholders = ", ".join("?" for _ in names)
+        insert = (
+            f'INSERT INTO "{table}" ({", ".join(names)}) '
+            f"VALUES ({placeholders})"
+        )
+
+        if table == "sales_data":
+            def generate(i):
+                row = _sales_row(rng, i, rows)
+                return [row.get(name) for name in names]
+        else:
+            def generate(i):
+                return [_generic_value(rng, t, i) for _, t in columns]
+
+        connection.executemany(insert, (generate(i) for i in range(rows)))
+        loaded[table] = rows
+
+    connection.commit()
+    return loaded
+
+# ---------- EXECUTION ----------
+
+@dataclass
+class QueryReport:
+    name: str
+    path: str
+    rows: Optional[int] = None
+    seconds: Optional[float] = None
+    plan: List[str] = field(default_factory=list)
+    warnings: List[str] = field(default_factory=list)
+    error: Optional[str] = None
+
+
+def _sqlite_view_sql(sql: str) -> str:
+    return re.sub(
+        r"create\s+or\s+replace\s+view",
+        "CREATE VIEW",
+        sql,
+        count=1,
+        flags=re.IGNORECASE,
+    )
+
+
+def group_by_warnings(view_sql: str) -> List[str]:
+    """
+    Non-aggregated projections not covered by GROUP BY. SQLite picks an
+    arbitrary row for them; MySQL rejects them under ONLY_FULL_GROUP_BY.
+    """
+    try:
+        view = parse_view(view_sql)
+    except SqlParseError:
+        return []
+
+    if not view.group_by:
+        return []
+
+    return [
+        f"column '{p.alias}' is neither aggregated nor in GROUP BY"
+        for p in view.projections
+        if p.aggregate is None and not view.is_grouped(p.alias)
+    ]
+
+
+def create_views(connection: sqlite3.Connection, paths: List[str]) -> Dict[str, QueryReport]:
+    """
+    Creates every view, retrying until dependencies between views resolve.
+    """
+    reports: Dict[str, QueryReport] = {}
+    pending = {}
+    for path in paths:
+        with open(path) as f:
+            sql = f.read()
+        name = os.path.splitext(os.path.basename(path))[0]
+        reports[name] = QueryReport(
+            name=name, path=path, warnings=group_by_warnings(sql)
+        )
+        pending[name] = sql
+
+    while pending:
+        progressed = False
+        for name, sql in sorted(pending.items()):
+            try:
+                connection.executescript(_sqlite_view_sql(sql))
+            except sqlite3.Error as e:
+                reports[name].error = str(e)
+                continue
+            reports[name].error = None
+            del pending[name]
+            progressed = True
+        if not progressed:
+            break
+
+    return reports
+
+
+def load_key_maps(
+    connection: sqlite3.Connection,
+    paths: List[str],
+) -> Dict[str, int]:
+    """
+    Numbers the keys of each dimension view into its key map. The load
+    scripts are MySQL-only; this assigns the same dense keys a first
+    load does. Run after the dimension views exist.
+    """
+    loaded = {}
+    for path in paths:
+        dimension = os.path.basename(path)[: -len(KEY_MAP_SUFFIX)]
+        table = f"{dimension}__key_map"
+        surrogate_key, key = [
+            name for _, name, *_ in connection.execute(
+                f'PRAGMA table_info("{table}")'
+            )
+        ]
+        loaded[table] = connection.execute(
+            f'INSERT INTO "{table}" ({surrogate_key}, {key}) '
+            f"SELECT ROW_NUMBER() OVER (ORDER BY {key}), {key} "
+            f"FROM (SELECT DISTINCT {key} FROM {dimension} "
+            f"WHERE {key} IS NOT NULL)"
+        ).rowcount
+    connection.commit()
+    return loaded
+
+
+def row_count_mismatch(
+    generated: QueryReport,
+    hand_written: Dict[str, QueryReport],
+) -> Optional[str]:
+    """
+    Generated fact queries return one row per grain, like the
+    hand-written fact view they compile.
+    """
+    view = hand_written.get(generated.name.split(".")[0])
+    if view is None or view.rows is None or generated.rows is None:
+        return None
+    if generated.rows == view.rows:
+        return None
+    return (
+        f"returns {generated.rows} rows, hand-written {view.path} "
+        f"returns {view.rows}"
+    )
+
+
+def profile_query(
+    connection: sqlite3.Connection,
+    report: QueryReport,
+    select_sql: str,
+) -> None:
+    try:
+        report.plan = [
+            detail for *_, detail in connection.execute(
+                f"EXPLAIN QUERY PLAN {select_sql}", RANGE_PARAMETERS
+            )
+        ]
+        started = time.perf_counter()
+        report.rows = len(
+            connection.execute(select_sql, RANGE_PARAMETERS).fetchall()
+        )
+        report.seconds = time.perf_counter() - started
+    except sqlite3.Error as e:
+        report.error = str(e)
+
+
+def run_harness(
+    rows: int,
+    seed: int,
+    include_output: bool = True,
+    indexes: bool = False,
+) -> List[QueryReport]:
+    connection = create_catalog()
+    load_synthetic_data(connection, rows, seed)
+
+    # Generated calendar dimensions replace hand-written views. Key maps
+    # are filled once the dimension views exist.
+    key_map_paths = sorted(glob.glob(KEY_MAP_GLOB))
+    for path in sorted(glob.glob(CALENDAR_GLOB)) + key_map_paths:
+        with open(path) as f:
+            connection.executescript(mysql_ddl_to_sqlite(f.read()))
+
+    if indexes:
+        # The advisor's MySQL DDL is also valid SQLite
+        with open(INDEX_DDL_PATH) as f:
+            connection.executescript(f.read())
+        connection.execute("ANALYZE")
+
+    view_patterns = VIEW_GLOBS + ((KEYED_VIEW_GLOB,) if include_output else ())
+    view_paths = sorted(
+        path for pattern in view_patterns for path in glob.glob(pattern)
+    )
+    view_reports = create_views(connection, view_paths)
+    load_key_maps(connection, key_map_paths)
+    for report in view_reports.values():
+        if report.error is None:
+            profile_query(connection, report, f"SELECT * FROM {report.name}")
+
+    reports = sorted(view_reports.values(), key=lambda r: r.path)
+
+    if include_output:
+        for path in sorted(glob.glob(OUTPUT_GLOB)):
+            with open(path) as f:
+                sql = f.read().strip().rstrip(";")
+            report = QueryReport(
+                name=os.path.splitext(os.path.basename(path))[0],
+                path=path,
+                warnings=group_by_warnings(f"CREATE VIEW generated AS {sql}"),
+            )
+            profile_query(connection, report, sql)
+            if report.error is None:
+                report.error = row_count_mismatch(report, view_reports)
+            reports.append(report)
+
+    connection.close()
+    return reports
+
+# ---------- ENTRYPOINT ----------
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Execute hand-written and generated views against an "
+                    "in-memory SQLite catalog with synthetic data."
+    )
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument(
+        "--budget-ms",
+        type=float,
+        default=None,
+        help="fail when any query takes longer than this",
+    )
+    parser.add_argument(
+        "--strict",
+        action="store_true",
+        help="treat GROUP BY warnings as failures",
+    )
+    parser.add_argument(
+        "--indexes",
+        action="store_true",
+        help=f"create the advised indexes from {INDEX_DDL_PATH} first",
+    )
+    parser.add_argument("--json", default=None, help="write the report as JSON")
+    args = parser.parse_args()
+
+    reports = run_harness(args.rows, args.seed, indexes=args.indexes)
+
+    failures = 0
+    print(f"sales_data rows: {args.rows} (seed {args.seed})\n")
+    for report in reports:
+        if report.error:
+            print(f"ERROR {report.path}: {report.error}")
+            failures += 1
+            continue
+
+        elapsed_ms = report.seconds * 1000
+        print(f"{report.path}: {report.rows} rows in {elapsed_ms:.2f} ms")
+        for line in report.plan:
+            print(f"    plan: {line}")
+        for warning in report.warnings:
+            print(f"    WARN: {warning}")
+
+        if args.budget_ms is not None and elapsed_ms > args.budget_ms:
+            print(f"    FAIL: exceeds budget of {args.budget_ms:.2f} ms")
+            failures += 1
+        if args.strict and report.warnings:
+            failures += 1
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump([asdict(r) for r in reports], f, indent=2)
+
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
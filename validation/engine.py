@@ -1,7 +1,17 @@
 import sys
 import os
-import yaml
+import datetime
 import re
+import yaml
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Optional, Tuple
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+from validation.schema_catalog import SchemaCatalog, load_catalog
+from validation.sql_index import SqlParseError, SqlView, parse_view
 
 MODEL_PATH = os.environ.get(
     "MODEL_PATH",
@@ -12,135 +22,271 @@ MODEL_PATH = os.environ.get(
 
 FACT_SQL_DIR = "sql/facts"
 DIM_SQL_DIR = "sql/dimensions"
+SCHEMA_PATH = "schema/raw/mysql.sql"
 
-# ---------- CORE HELPERS ----------
+# ---------- DIAGNOSTICS ----------
 
-def fail(message: str):
-    print(f"FAIL: {message}")
-    sys.exit(1)
+@dataclass(frozen=True)
+class Diagnostic:
+    """
+    A single validation finding produced by a rule.
+    """
+    rule: str
+    message: str
 
-def pass_validation():
-    print("PASS: semantic model validation successful")
-    sys.exit(0)
+    def __str__(self) -> str:
+        return f"FAIL: {self.message}"
+
+class ModelLoadError(Exception):
+    """
+    Raised when the semantic model file cannot be loaded.
+    """
+
+# ---------- CORE HELPERS ----------
 
 def load_model(path: str) -> dict:
     if not os.path.exists(path):
-        fail(f"model file not found: {path}")
+        raise ModelLoadError(f"model file not found: {path}")
 
     with open(path, "r") as f:
         try:
             model = yaml.safe_load(f)
         except yaml.YAMLError as e:
-            fail(f"invalid YAML format: {e}")
+            raise ModelLoadError(f"invalid YAML format: {e}")
 
     if not model:
-        fail("model file is empty or invalid YAML")
+        raise ModelLoadError("model file is empty or invalid YAML")
 
     return model
 
+# ---------- SQL ARTIFACT CACHE ----------
+
+@dataclass(frozen=True)
+class SqlArtifact:
+    """
+    A SQL file read and parsed once from disk.
+
+    `content` is None when the file is missing; `error` is set
+    when the file exists but cannot be read. `view` holds the parsed
+    view index, or `parse_error` explains why parsing failed.
+    """
+    path: str
+    content: Optional[str]
+    error: Optional[str] = None
+    view: Optional[SqlView] = None
+    parse_error: Optional[str] = None
+
+    @property
+    def exists(self) -> bool:
+        return self.content is not None
+
+class SqlArtifactCache:
+    """
+    Loads every SQL artifact, and the schema catalog, at most once and
+    shares them across rules.
+    """
+
+    def __init__(
+        self,
+        fact_sql_dir: str = FACT_SQL_DIR,
+        dim_sql_dir: str = DIM_SQL_DIR,
+        schema_path: str = SCHEMA_PATH,
+    ):
+        self.fact_sql_dir = fact_sql_dir
+        self.dim_sql_dir = dim_sql_dir
+        self.schema_path = schema_path
+        self._artifacts: Dict[str, SqlArtifact] = {}
+        self._catalog: Optional[SchemaCatalog] = None
+        self.catalog_error: Optional[str] = None
+
+    def fact_path(self, fact_name: str) -> str:
+        return f"{self.fact_sql_dir}/{fact_name}.sql"
+
+    def dimension_path(self, dim_name: str) -> str:
+        return f"{self.dim_sql_dir}/{dim_name}.sql"
+
+    def fact(self, fact_name: str) -> SqlArtifact:
+        return self.get(self.fact_path(fact_name))
+
+    def dimension(self, dim_name: str) -> SqlArtifact:
+        return self.get(self.dimension_path(dim_name))
+
+    def get(self, path: str) -> SqlArtifact:
+        artifact = self._artifacts.get(path)
+        if artifact is None:
+            artifact = self._read(path)
+            self._artifacts[path] = artifact
+        return artifact
+
+    def invalidate(self, path: str) -> None:
+        """
+        Forgets a cached artifact so it is re-read on next access.
+        """
+        self._artifacts.pop(path, None)
+        if path == self.schema_path:
+            self._catalog = None
+            self.catalog_error = None
+
+    def catalog(self) -> Optional[SchemaCatalog]:
+        """
+        Typed catalog of the physical schema, or None when the schema
+        file is absent or cannot be parsed (see `catalog_error`).
+        """
+        if self._catalog is None and self.catalog_error is None:
+            if not os.path.exists(self.schema_path):
+                return None
+            try:
+                self._catalog = load_catalog(self.schema_path)
+            except (OSError, SqlParseError) as e:
+                self.catalog_error = str(e)
+        return self._catalog
+
+    def preload(self, model: dict) -> None:
+        for fact_name in model.get("facts", {}) or {}:
+            self.fact(fact_name)
+        for dim_name in model.get("dimensions", {}) or {}:
+            self.dimension(dim_name)
+
+    @staticmethod
+    def _read(path: str) -> SqlArtifact:
+        if not os.path.exists(path):
+            return SqlArtifact(path=path, content=None)
+
+        try:
+            with open(path, "r") as f:
+                content = f.read()
+        except OSError as e:
+            return SqlArtifact(path=path, content=None, error=str(e))
+
+        try:
+            view = parse_view(content)
+        except SqlParseError as e:
+            return SqlArtifact(path=path, content=content, parse_error=str(e))
+
+        return SqlArtifact(path=path, content=content, view=view)
+
 # ---------- BASIC STRUCTURE VALIDATION ----------
 
-def validate_facts(model: dict):
+def _names(definition: dict, field: str) -> List[str]:
+    """
+    Column names declared under `field` of a fact or dimension; empty
+    when the field is missing or not a list of names. Every rule runs,
+    so rules reading these fields must not trust their shape (the
+    structure rules report malformed fields).
+    """
+    value = definition.get(field)
+    if not isinstance(value, list):
+        return []
+    return [name for name in value if isinstance(name, str)]
+
+def _malformed_list(definition: dict, field: str) -> Optional[str]:
+    value = definition.get(field)
+    if value is None or isinstance(value, list):
+        if all(isinstance(name, str) for name in value or []):
+            return None
+        return f"{field} must be a list of column names"
+    return f"{field} must be a list, got {type(value).__name__}"
+
+def validate_facts(model: dict, sql: SqlArtifactCache) -> Iterator[Diagnostic]:
     facts = model.get("facts")
     if not facts:
-        fail("no facts defined in model")
+        yield Diagnostic("facts", "no facts defined in model")
+        return
 
     for fact_name, fact_def in facts.items():
         grain = fact_def.get("grain")
         if not grain:
-            fail(f"fact '{fact_name}' has no grain defined")
+            yield Diagnostic("facts", f"fact '{fact_name}' has no grain defined")
+            fields = ("measures", "attributes")
+        else:
+            fields = ("grain", "measures", "attributes")
 
-def validate_dimensions(model: dict):
+        # foreign_keys are checked by validate_fact_foreign_keys
+        for field in fields:
+            problem = _malformed_list(fact_def, field)
+            if problem is not None:
+                yield Diagnostic("facts", f"fact '{fact_name}' {problem}")
+
+def validate_dimensions(model: dict, sql: SqlArtifactCache) -> Iterator[Diagnostic]:
     dimensions = model.get("dimensions")
     if not dimensions:
-        fail("no dimensions defined in model")
+        yield Diagnostic("dimensions", "no dimensions defined in model")
+        return
 
     for dim_name, dim_def in dimensions.items():
         key = dim_def.get("key")
         if not key:
-            fail(f"dimension '{dim_name}' has no key defined")
+            yield Diagnostic(
+                "dimensions", f"dimension '{dim_name}' has no key defined"
+            )
+
+        problem = _malformed_list(dim_def, "attributes")
+        if problem is not None:
+            yield Diagnostic("dimensions", f"dimension '{dim_name}' {problem}")
 
 # ---------- RELATIONAL SEMANTICS ----------
 
-def validate_fact_foreign_keys(model: dict):
+def validate_fact_foreign_keys(model: dict, sql: SqlArtifactCache) -> Iterator[Diagnostic]:
     facts = model.get("facts", {})
     dimensions = model.get("dimensions", {})
 
+    # Build key → dimensions once instead of scanning per foreign key
+    dims_by_key: Dict[str, List[str]] = {}
+    for dim_name, dim_def in dimensions.items():
+        key = (dim_def.get("key") or "").lower()
+        dims_by_key.setdefault(key, []).append(dim_name)
+
     for fact_name, fact_def in facts.items():
-        fact_grain = {g.lower() for g in fact_def.get("grain", [])}
+        fact_grain = {g.lower() for g in _names(fact_def, "grain")}
         foreign_keys = fact_def.get("foreign_keys")
 
         if not foreign_keys:
-            fail(f"fact '{fact_name}' defines no foreign_keys")
-
-        if not isinstance(foreign_keys, list):
-            fail(
-                f"fact '{fact_name}' foreign_keys must be a list, "
-                f"got {type(foreign_keys).__name__}"
+            yield Diagnostic(
+                "fact_foreign_keys",
+                f"fact '{fact_name}' defines no foreign_keys",
             )
+            continue
 
-        for fk in foreign_keys:
+        problem = _malformed_list(fact_def, "foreign_keys")
+        if problem is not None:
+            yield Diagnostic("fact_foreign_keys", f"fact '{fact_name}' {problem}")
+            continue
+
+        for fk in _names(fact_def, "foreign_keys"):
             fk_lower = fk.lower()
-            matching_dims = [
-                dim_name
-                for dim_name, dim_def in dimensions.items()
-                if dim_def.get("key", "").lower() == fk_lower
-            ]
+            matching_dims = dims_by_key.get(fk_lower, [])
 
             if matching_dims:
                 if len(matching_dims) > 1:
-                    fail(
+                    yield Diagnostic(
+                        "fact_foreign_keys",
                         f"foreign key '{fk}' in fact '{fact_name}' "
-                        f"maps to multiple dimensions: {matching_dims}"
+                        f"maps to multiple dimensions: {matching_dims}",
                     )
             else:
                 if fk_lower not in fact_grain:
-                    fail(
+                    yield Diagnostic(
+                        "fact_foreign_keys",
                         f"foreign key '{fk}' in fact '{fact_name}' "
                         f"does not map to any dimension "
-                        f"and is not part of fact grain"
+                        f"and is not part of fact grain",
                     )
 
-def validate_grain_vs_foreign_keys(model: dict):
+def validate_grain_vs_foreign_keys(model: dict, sql: SqlArtifactCache) -> Iterator[Diagnostic]:
     facts = model.get("facts", {})
 
     for fact_name, fact_def in facts.items():
-        grain = {g.lower() for g in fact_def.get("grain", [])}
-        foreign_keys = {fk.lower() for fk in fact_def.get("foreign_keys", [])}
+        grain = {g.lower() for g in _names(fact_def, "grain")}
+        foreign_keys = {fk.lower() for fk in _names(fact_def, "foreign_keys")}
 
         overlap = grain.intersection(foreign_keys)
         if overlap:
-            fail(
-                f"fact '{fact_name}' has foreign keys in grain: {sorted(overlap)}"
+            yield Diagnostic(
+                "grain_vs_foreign_keys",
+                f"fact '{fact_name}' has foreign keys in grain: {sorted(overlap)}",
             )
 
-def validate_fact_grain_vs_sql(model: dict):
-    facts = model.get("facts", {})
-
-    for fact_name, fact_def in facts.items():
-        grain = fact_def.get("grain", [])
-        if not grain:
-            continue
-
-        sql_path = f"{FACT_SQL_DIR}/{fact_name}.sql"
-        if not os.path.exists(sql_path):
-            fail(f"missing SQL file for fact: {sql_path}")
-
-        try:
-            with open(sql_path, "r") as f:
-                sql_content = f.read().lower()
-        except OSError as e:
-            fail(f"cannot read SQL file {sql_path}: {e}")
-
-        for grain_col in grain:
-            token = grain_col.lower()
-            if token not in sql_content:
-                fail(
-                    f"fact '{fact_name}' grain column '{grain_col}' "
-                    f"not found in SQL definition"
-                )
-
-def validate_no_many_to_many(model: dict):
+def validate_no_many_to_many(model: dict, sql: SqlArtifactCache) -> Iterator[Diagnostic]:
     dimensions = model.get("dimensions", {})
     key_usage = {}
 
@@ -154,225 +300,894 @@ def validate_no_many_to_many(model: dict):
 
     for key, dims in key_usage.items():
         if len(dims) > 1:
-            fail(
+            yield Diagnostic(
+                "no_many_to_many",
                 f"many-to-many detected: key '{key}' "
-                f"is used by multiple dimensions: {dims}"
+                f"is used by multiple dimensions: {dims}",
             )
 
-def validate_fact_foreign_keys_vs_sql(model: dict):
-    facts = model.get("facts", {})
+# ---------- INCREMENTAL REFRESH ----------
 
-    for fact_name, fact_def in facts.items():
-        foreign_keys = fact_def.get("foreign_keys", [])
-        if not foreign_keys:
+REFRESH_GRANULARITIES = ("day", "month", "quarter", "year")
+REFRESH_PERIOD_FIELDS = ("archive_periods", "refresh_periods")
+
+def _iso_date(value) -> Optional[datetime.date]:
+    # YAML parses unquoted dates into datetime.date already
+    if isinstance(value, datetime.date):
+        return value
+    try:
+        return datetime.date.fromisoformat(str(value))
+    except ValueError:
+        return None
+
+def validate_fact_incremental_refresh(model: dict, sql: SqlArtifactCache) -> Iterator[Diagnostic]:
+    for fact_name, fact_def in model.get("facts", {}).items():
+        refresh = fact_def.get("incremental_refresh")
+        if refresh is None:
             continue
 
-        sql_path = f"{FACT_SQL_DIR}/{fact_name}.sql"
-        if not os.path.exists(sql_path):
-            fail(f"missing SQL file for fact: {sql_path}")
+        if not isinstance(refresh, dict):
+            yield Diagnostic(
+                "fact_incremental_refresh",
+                f"fact '{fact_name}' incremental_refresh must be a mapping",
+            )
+            continue
 
-        try:
-            with open(sql_path, "r") as f:
-                sql_content = f.read().lower()
-        except OSError as e:
-            fail(f"cannot read SQL file {sql_path}: {e}")
+        column = refresh.get("partition_column")
+        columns = {c.lower() for c in (
+            _names(fact_def, "grain") + _names(fact_def, "foreign_keys")
+        )}
+        if not column:
+            yield Diagnostic(
+                "fact_incremental_refresh",
+                f"fact '{fact_name}' incremental_refresh has no partition_column",
+            )
+        elif not isinstance(column, str):
+            yield Diagnostic(
+                "fact_incremental_refresh",
+                f"fact '{fact_name}' partition_column must be a string",
+            )
+        elif column.lower() not in columns:
+            yield Diagnostic(
+                "fact_incremental_refresh",
+                f"fact '{fact_name}' partition column '{column}' is not "
+                f"a grain column or foreign key of the fact",
+            )
 
-        for fk in foreign_keys:
-            token = fk.lower()
-            if token not in sql_content:
-                fail(
-                    f"fact '{fact_name}' foreign key '{fk}' "
-                    f"not found in SQL definition"
+        granularity = refresh.get("granularity", "month")
+        if granularity not in REFRESH_GRANULARITIES:
+            yield Diagnostic(
+                "fact_incremental_refresh",
+                f"fact '{fact_name}' partition granularity '{granularity}' "
+                f"must be one of {list(REFRESH_GRANULARITIES)}",
+            )
+
+        periods = {}
+        for field in REFRESH_PERIOD_FIELDS:
+            value = refresh.get(field)
+            if value is None:
+                continue
+            if not isinstance(value, int) or isinstance(value, bool) or value < 1:
+                yield Diagnostic(
+                    "fact_incremental_refresh",
+                    f"fact '{fact_name}' {field} must be a positive number "
+                    f"of periods, got {value!r}",
+                )
+            else:
+                periods[field] = value
+
+        archive_periods = periods.get("archive_periods")
+        refresh_periods = periods.get("refresh_periods")
+        if (
+            refresh.get("refresh_periods") is not None
+            and refresh.get("archive_periods") is None
+        ):
+            yield Diagnostic(
+                "fact_incremental_refresh",
+                f"fact '{fact_name}' declares refresh_periods without "
+                f"archive_periods",
+            )
+        elif (
+            refresh.get("archive_periods") is not None
+            and refresh.get("start") is None
+        ):
+            yield Diagnostic(
+                "fact_incremental_refresh",
+                f"fact '{fact_name}' archive_periods needs a start and end "
+                f"to bound RangeStart / RangeEnd",
+            )
+        elif (
+            archive_periods is not None
+            and refresh_periods is not None
+            and refresh_periods > archive_periods
+        ):
+            yield Diagnostic(
+                "fact_incremental_refresh",
+                f"fact '{fact_name}' refresh_periods {refresh_periods} "
+                f"exceed archive_periods {archive_periods}",
+            )
+
+        start, end = refresh.get("start"), refresh.get("end")
+        if (start is None) != (end is None):
+            yield Diagnostic(
+                "fact_incremental_refresh",
+                f"fact '{fact_name}' partition range needs both start and end",
+            )
+        elif start is not None:
+            start_date, end_date = _iso_date(start), _iso_date(end)
+            if start_date is None or end_date is None:
+                yield Diagnostic(
+                    "fact_incremental_refresh",
+                    f"fact '{fact_name}' partition range must use ISO dates "
+                    f"(YYYY-MM-DD)",
+                )
+            elif start_date >= end_date:
+                yield Diagnostic(
+                    "fact_incremental_refresh",
+                    f"fact '{fact_name}' partition range start {start_date} "
+                    f"is not before end {end_date}",
                 )
 
-def validate_fact_measures_vs_sql(model: dict):
+# ---------- ROLLUPS ----------
+
+def validate_rollups(model: dict, sql: SqlArtifactCache) -> Iterator[Diagnostic]:
+    rollups = model.get("rollups")
+    if rollups is None:
+        return
+
+    if not isinstance(rollups, dict):
+        yield Diagnostic(
+            "rollups",
+            f"rollups must be a mapping, got {type(rollups).__name__}",
+        )
+        return
+
     facts = model.get("facts", {})
+    reserved = set(facts) | set(model.get("dimensions", {}))
 
-    aggregations = ["sum(", "count(", "avg(", "min(", "max("]
+    for rollup_name, rollup_def in rollups.items():
+        if rollup_name in reserved:
+            yield Diagnostic(
+                "rollups",
+                f"rollup '{rollup_name}' collides with a fact or dimension name",
+            )
 
-    for fact_name, fact_def in facts.items():
-        measures = fact_def.get("measures", [])
-        grain = {g.lower() for g in fact_def.get("grain", [])}
-        foreign_keys = {fk.lower() for fk in fact_def.get("foreign_keys", [])}
+        if not isinstance(rollup_def, dict):
+            yield Diagnostic(
+                "rollups",
+                f"rollup '{rollup_name}' must be a mapping",
+            )
+            continue
+
+        fact_name = rollup_def.get("fact")
+        if not isinstance(fact_name, str):
+            yield Diagnostic(
+                "rollups",
+                f"rollup '{rollup_name}' fact must be a fact name",
+            )
+            continue
 
-        if not measures:
+        fact_def = facts.get(fact_name)
+        if fact_def is None:
+            yield Diagnostic(
+                "rollups",
+                f"rollup '{rollup_name}' references unknown fact '{fact_name}'",
+            )
             continue
 
-        sql_path = f"{FACT_SQL_DIR}/{fact_name}.sql"
-        if not os.path.exists(sql_path):
-            fail(f"missing SQL file for fact: {sql_path}")
+        problem = _malformed_list(rollup_def, "grain")
+        grain = _names(rollup_def, "grain")
+        if problem is not None or not grain:
+            yield Diagnostic(
+                "rollups",
+                f"rollup '{rollup_name}' must declare a non-empty grain list "
+                f"of column names",
+            )
+            continue
 
-        try:
-            with open(sql_path, "r") as f:
-                sql_content = f.read().lower()
-        except OSError as e:
-            fail(f"cannot read SQL file {sql_path}: {e}")
+        fact_grain = {g.lower() for g in _names(fact_def, "grain")}
+        groupable = fact_grain | {
+            fk.lower() for fk in _names(fact_def, "foreign_keys")
+        }
+        rollup_grain = {g.lower() for g in grain}
+
+        for column in grain:
+            if column.lower() not in groupable:
+                yield Diagnostic(
+                    "rollups",
+                    f"rollup '{rollup_name}' grain column '{column}' is not "
+                    f"a grain column or foreign key of fact '{fact_name}'",
+                )
+
+        if fact_grain and fact_grain <= rollup_grain:
+            yield Diagnostic(
+                "rollups",
+                f"rollup '{rollup_name}' is not coarser than fact "
+                f"'{fact_name}' (it contains the full fact grain)",
+            )
+
+        problem = _malformed_list(rollup_def, "measures")
+        if problem is not None:
+            yield Diagnostic("rollups", f"rollup '{rollup_name}' {problem}")
+
+        fact_measures = {m.lower() for m in _names(fact_def, "measures")}
+        for measure in _names(rollup_def, "measures"):
+            if measure.lower() not in fact_measures:
+                yield Diagnostic(
+                    "rollups",
+                    f"rollup '{rollup_name}' measure '{measure}' is not "
+                    f"a measure of fact '{fact_name}'",
+                )
+
+        precedence = rollup_def.get("precedence")
+        if precedence is not None and (
+            not isinstance(precedence, int) or isinstance(precedence, bool)
+        ):
+            yield Diagnostic(
+                "rollups",
+                f"rollup '{rollup_name}' precedence must be an integer",
+            )
+
+# ---------- STORAGE MODES ----------
+
+STORAGE_MODE_THRESHOLDS = ("fact_import_max_rows", "dimension_import_max_rows")
+
+def validate_storage_modes(model: dict, sql: SqlArtifactCache) -> Iterator[Diagnostic]:
+    storage_modes = model.get("storage_modes")
+    if storage_modes is None:
+        return
+
+    if not isinstance(storage_modes, dict):
+        yield Diagnostic(
+            "storage_modes",
+            f"storage_modes must be a mapping, got {type(storage_modes).__name__}",
+        )
+        return
+
+    for name, value in storage_modes.items():
+        if name not in STORAGE_MODE_THRESHOLDS:
+            yield Diagnostic(
+                "storage_modes",
+                f"unknown storage mode threshold '{name}' "
+                f"(expected one of {', '.join(STORAGE_MODE_THRESHOLDS)})",
+            )
+        elif not isinstance(value, int) or isinstance(value, bool) or value < 0:
+            yield Diagnostic(
+                "storage_modes",
+                f"storage mode threshold '{name}' must be a non-negative "
+                f"row count",
+            )
+
+# ---------- CALENDAR DIMENSIONS ----------
+
+# Attributes the calendar generator can compute
+# (compiler/sql/builders/calendar_builder.py)
+CALENDAR_ATTRIBUTES = (
+    "date_key",
+    "year",
+    "quarter",
+    "month",
+    "month_name",
+    "calendar_month",
+    "calendar_quarter",
+    "day_of_month",
+    "day_of_year",
+    "day_of_week",
+    "day_name",
+    "iso_week",
+    "iso_year",
+    "is_weekend",
+)
+
+def validate_dimension_calendar(model: dict, sql: SqlArtifactCache) -> Iterator[Diagnostic]:
+    for dim_name, dim_def in model.get("dimensions", {}).items():
+        calendar = dim_def.get("calendar")
+        if calendar is None:
+            continue
+
+        if not isinstance(calendar, dict):
+            yield Diagnostic(
+                "dimension_calendar",
+                f"dimension '{dim_name}' calendar must be a mapping",
+            )
+            continue
+
+        start_date = _iso_date(calendar.get("start"))
+        end_date = _iso_date(calendar.get("end"))
+        if start_date is None or end_date is None:
+            yield Diagnostic(
+                "dimension_calendar",
+                f"dimension '{dim_name}' calendar needs start and end "
+                f"ISO dates (YYYY-MM-DD)",
+            )
+        elif start_date >= end_date:
+            yield Diagnostic(
+                "dimension_calendar",
+                f"dimension '{dim_name}' calendar start {start_date} "
+                f"is not before end {end_date}",
+            )
+
+        for attribute in _names(dim_def, "attributes"):
+            if attribute not in CALENDAR_ATTRIBUTES:
+                yield Diagnostic(
+                    "dimension_calendar",
+                    f"dimension '{dim_name}' attribute '{attribute}' is not "
+                    f"a calendar attribute (expected one of "
+                    f"{', '.join(CALENDAR_ATTRIBUTES)})",
+                )
+
+        if dim_def.get("materialization") is not None:
+            yield Diagnostic(
+                "dimension_calendar",
+                f"dimension '{dim_name}' is generated from its calendar "
+                f"and cannot also be materialized",
+            )
+
+        artifact = sql.dimension(dim_name)
+        if artifact.exists:
+            yield Diagnostic(
+                "dimension_calendar",
+                f"dimension '{dim_name}' is generated from its calendar; "
+                f"remove the hand-written view {artifact.path}",
+            )
+
+# ---------- SQL ALIGNMENT ----------
+
+def _readable_fact_sql(
+    model: dict, sql: SqlArtifactCache
+) -> Iterator[Tuple[str, dict, SqlView]]:
+    """
+    Yields (fact_name, fact_def, view) for every fact whose SQL file
+    could be read and parsed. Missing or unparseable files are reported
+    by validate_sql_files_exist.
+    """
+    for fact_name, fact_def in model.get("facts", {}).items():
+        view = sql.fact(fact_name).view
+        if view is not None:
+            yield fact_name, fact_def, view
+
+def validate_fact_grain_vs_sql(model: dict, sql: SqlArtifactCache) -> Iterator[Diagnostic]:
+    for fact_name, fact_def, view in _readable_fact_sql(model, sql):
+        for grain_col in _names(fact_def, "grain"):
+            if view.projection(grain_col) is None:
+                yield Diagnostic(
+                    "fact_grain_vs_sql",
+                    f"fact '{fact_name}' grain column '{grain_col}' "
+                    f"not found in SQL definition",
+                )
+            elif view.group_by and not view.is_grouped(grain_col):
+                yield Diagnostic(
+                    "fact_grain_vs_sql",
+                    f"fact '{fact_name}' grain column '{grain_col}' "
+                    f"is not part of GROUP BY",
+                )
+
+def validate_fact_foreign_keys_vs_sql(model: dict, sql: SqlArtifactCache) -> Iterator[Diagnostic]:
+    for fact_name, fact_def, view in _readable_fact_sql(model, sql):
+        for fk in _names(fact_def, "foreign_keys"):
+            if view.projection(fk) is None:
+                yield Diagnostic(
+                    "fact_foreign_keys_vs_sql",
+                    f"fact '{fact_name}' foreign key '{fk}' "
+                    f"not found in SQL definition",
+                )
+
+def validate_fact_measures_vs_sql(model: dict, sql: SqlArtifactCache) -> Iterator[Diagnostic]:
+    for fact_name, fact_def, view in _readable_fact_sql(model, sql):
+        measures = _names(fact_def, "measures")
+        grain = {g.lower() for g in _names(fact_def, "grain")}
+        foreign_keys = {fk.lower() for fk in _names(fact_def, "foreign_keys")}
 
         for measure in measures:
             token = measure.lower()
+            projection = view.projection(token)
 
-            if token not in sql_content:
-                fail(
+            if projection is None:
+                yield Diagnostic(
+                    "fact_measures_vs_sql",
                     f"fact '{fact_name}' measure '{measure}' "
-                    f"not found in SQL definition"
+                    f"not found in SQL definition",
                 )
 
             if token in grain:
-                fail(
+                yield Diagnostic(
+                    "fact_measures_vs_sql",
                     f"fact '{fact_name}' measure '{measure}' "
-                    f"is part of grain — invalid fact design"
+                    f"is part of grain — invalid fact design",
                 )
 
             if token in foreign_keys:
-                fail(
+                yield Diagnostic(
+                    "fact_measures_vs_sql",
                     f"fact '{fact_name}' measure '{measure}' "
-                    f"is also a foreign key — invalid fact design"
+                    f"is also a foreign key — invalid fact design",
                 )
 
-            if not any(agg in sql_content for agg in aggregations):
-                fail(
+            if projection is not None and projection.aggregate is None:
+                yield Diagnostic(
+                    "fact_measures_vs_sql",
                     f"fact '{fact_name}' measure '{measure}' "
-                    f"is not aggregated in SQL"
+                    f"is not aggregated in SQL",
                 )
 
 def extract_sql_columns(sql: str) -> list[str]:
-    select_match = re.search(
-        r"select\s+(.*?)\s+from",
-        sql,
-        re.IGNORECASE | re.DOTALL,
-    )
-    if not select_match:
+    try:
+        return parse_view(sql).columns
+    except SqlParseError:
         return []
 
-    columns_block = select_match.group(1)
-
-    columns = []
-    for line in columns_block.split(","):
-        line = line.strip()
-        if " as " in line.lower():
-            alias = line.split()[-1]
-            columns.append(alias)
-        else:
-            columns.append(line.split(".")[-1])
-
-    return [c.strip() for c in columns]
-
-def validate_fact_attributes(model: dict):
-    facts = model.get("facts", {})
+def validate_fact_attributes(model: dict, sql: SqlArtifactCache) -> Iterator[Diagnostic]:
+    for fact_name, fact_def, view in _readable_fact_sql(model, sql):
+        allowed = {c.lower() for c in (
+            _names(fact_def, "grain")
+            + _names(fact_def, "foreign_keys")
+            + _names(fact_def, "measures")
+            + _names(fact_def, "attributes")
+        )}
 
-    for fact_name, fact_def in facts.items():
-        path = f"{FACT_SQL_DIR}/{fact_name}.sql"
-        if not os.path.exists(path):
-            fail(f"missing SQL file for fact: {path}")
+        for col in view.columns:
+            if col not in allowed:
+                yield Diagnostic(
+                    "fact_attributes",
+                    f"fact '{fact_name}' has undeclared column '{col}' "
+                    f"in SQL view (allowed: {sorted(allowed)})",
+                )
 
-        with open(path) as f:
-            sql = f.read()
+def validate_dimension_attributes(model: dict, sql: SqlArtifactCache) -> Iterator[Diagnostic]:
+    for dim_name, dim_def in model.get("dimensions", {}).items():
+        view = sql.dimension(dim_name).view
+        if view is None:
+            continue
 
-        sql_columns = [c.lower() for c in extract_sql_columns(sql)]
         allowed = {c.lower() for c in (
-            fact_def.get("grain", [])
-            + fact_def.get("foreign_keys", [])
-            + fact_def.get("measures", [])
-            + fact_def.get("attributes", [])
+            [dim_def.get("key") or ""]
+            + _names(dim_def, "attributes")
         )}
 
-        for col in sql_columns:
+        for col in view.columns:
             if col not in allowed:
-                fail(
-                    f"fact '{fact_name}' has undeclared column '{col}' "
-                    f"in SQL view (allowed: {sorted(allowed)})"
+                yield Diagnostic(
+                    "dimension_attributes",
+                    f"dimension '{dim_name}' has undeclared column '{col}' "
+                    f"in SQL view (allowed: {sorted(allowed)})",
                 )
 
-def validate_dimension_attributes(model: dict):
+# ---------- PHYSICAL SCHEMA ----------
+
+def _readable_views(model: dict, sql: SqlArtifactCache) -> Iterator[Tuple[str, SqlView]]:
+    for fact_name in model.get("facts", {}):
+        artifact = sql.fact(fact_name)
+        if artifact.view is not None:
+            yield artifact.path, artifact.view
+    for dim_name in model.get("dimensions", {}):
+        artifact = sql.dimension(dim_name)
+        if artifact.view is not None:
+            yield artifact.path, artifact.view
+
+def validate_sql_columns_vs_schema(model: dict, sql: SqlArtifactCache) -> Iterator[Diagnostic]:
+    catalog = sql.catalog()
+    if sql.catalog_error:
+        yield Diagnostic(
+            "sql_columns_vs_schema",
+            f"cannot parse schema {sql.schema_path}: {sql.catalog_error}",
+        )
+    if catalog is None:
+        return
+
+    views = {
+        name.lower()
+        for name in list(model.get("facts", {})) + list(model.get("dimensions", {}))
+    }
+
+    for path, view in _readable_views(model, sql):
+        tables = []
+        for table_name in view.tables:
+            table = catalog.table(table_name)
+            if table is not None:
+                tables.append(table)
+            elif table_name not in views:
+                yield Diagnostic(
+                    "sql_columns_vs_schema",
+                    f"{path} reads table '{table_name}' "
+                    f"not defined in {sql.schema_path}",
+                )
+
+        # Columns can only be checked when every source is a known table
+        if not tables or len(tables) != len(view.tables):
+            continue
+
+        referenced = [c for p in view.projections for c in p.columns]
+        referenced += sorted(view.group_by)
+        for column in dict.fromkeys(referenced):
+            if not any(table.column(column) for table in tables):
+                yield Diagnostic(
+                    "sql_columns_vs_schema",
+                    f"{path} reads column '{column}' that does not exist "
+                    f"in {', '.join(t.name for t in tables)}",
+                )
+
+def validate_fact_measure_types(model: dict, sql: SqlArtifactCache) -> Iterator[Diagnostic]:
+    catalog = sql.catalog()
+    if catalog is None:
+        return
+
+    for fact_name, fact_def, view in _readable_fact_sql(model, sql):
+        tables = [catalog.table(t) for t in view.tables]
+        tables = [t for t in tables if t is not None]
+
+        for measure in _names(fact_def, "measures"):
+            projection = view.projection(measure)
+            if projection is None:
+                continue
+            for column_name in projection.columns:
+                column = next(
+                    (t.column(column_name) for t in tables if t.column(column_name)),
+                    None,
+                )
+                if column is not None and not column.is_numeric:
+                    yield Diagnostic(
+                        "fact_measure_types",
+                        f"fact '{fact_name}' measure '{measure}' reads "
+                        f"non-numeric column '{column.name}' "
+                        f"({column.declared_type})",
+                    )
+
+# Watermark types a lookback window (in days) can be subtracted from
+TEMPORAL_TYPES = ("date", "datetime", "timestamp")
+
+def validate_dimension_materialization(model: dict, sql: SqlArtifactCache) -> Iterator[Diagnostic]:
     dimensions = model.get("dimensions", {})
+    reserved = (
+        set(model.get("facts", {}))
+        | set(dimensions)
+        | set(model.get("rollups") or {})
+    )
+    catalog = sql.catalog()
 
     for dim_name, dim_def in dimensions.items():
-        path = f"{DIM_SQL_DIR}/{dim_name}.sql"
-        if not os.path.exists(path):
-            fail(f"missing SQL file for dimension: {path}")
+        materialization = dim_def.get("materialization")
+        if materialization is None:
+            continue
 
-        with open(path) as f:
-            sql = f.read()
+        if not isinstance(materialization, dict):
+            yield Diagnostic(
+                "dimension_materialization",
+                f"dimension '{dim_name}' materialization must be a mapping",
+            )
+            continue
 
-        sql_columns = [c.lower() for c in extract_sql_columns(sql)]
-        allowed = {c.lower() for c in (
-            [dim_def.get("key")]
-            + dim_def.get("attributes", [])
-        )}
+        table_name = materialization.get("table", f"{dim_name}__materialized")
+        if table_name in reserved:
+            yield Diagnostic(
+                "dimension_materialization",
+                f"dimension '{dim_name}' materialized table '{table_name}' "
+                f"collides with a fact, dimension or rollup name",
+            )
 
-        for col in sql_columns:
-            if col not in allowed:
-                fail(
-                    f"dimension '{dim_name}' has undeclared column '{col}' "
-                    f"in SQL view (allowed: {sorted(allowed)})"
+        lookback_days = materialization.get("lookback_days", 0)
+        if (
+            not isinstance(lookback_days, int)
+            or isinstance(lookback_days, bool)
+            or lookback_days < 0
+        ):
+            yield Diagnostic(
+                "dimension_materialization",
+                f"dimension '{dim_name}' lookback_days must be a "
+                f"non-negative number of days, got {lookback_days!r}",
+            )
+            lookback_days = 0
+        elif lookback_days and materialization.get("watermark") is None:
+            yield Diagnostic(
+                "dimension_materialization",
+                f"dimension '{dim_name}' declares lookback_days "
+                f"without a watermark",
+            )
+
+        view = sql.dimension(dim_name).view
+        if catalog is None or view is None:
+            continue
+
+        table = catalog.table(view.tables[0]) if len(view.tables) == 1 else None
+        if table is None:
+            yield Diagnostic(
+                "dimension_materialization",
+                f"dimension '{dim_name}' must read exactly one table of "
+                f"{sql.schema_path} to be materialized",
+            )
+            continue
+
+        for projection in view.projections:
+            if (
+                len(projection.columns) != 1
+                or projection.aggregate is not None
+                or table.column(projection.columns[0]) is None
+            ):
+                yield Diagnostic(
+                    "dimension_materialization",
+                    f"dimension '{dim_name}' column '{projection.alias}' "
+                    f"must read a single column of '{table.name}' to be "
+                    f"materialized",
                 )
 
-# ---------- SQL CONTRACT VALIDATION ----------
+        watermark = materialization.get("watermark")
+        if watermark is None:
+            continue
+        watermark_column = table.column(str(watermark))
+        if watermark_column is None:
+            yield Diagnostic(
+                "dimension_materialization",
+                f"dimension '{dim_name}' watermark column '{watermark}' "
+                f"does not exist in '{table.name}'",
+            )
+        elif lookback_days and watermark_column.data_type not in TEMPORAL_TYPES:
+            yield Diagnostic(
+                "dimension_materialization",
+                f"dimension '{dim_name}' lookback_days needs a date or "
+                f"time watermark; '{watermark}' is {watermark_column.data_type}",
+            )
 
-def validate_sql_files_exist(model: dict):
-    facts = model.get("facts", {})
-    for fact_name in facts.keys():
-        path = f"{FACT_SQL_DIR}/{fact_name}.sql"
-        if not os.path.exists(path):
-            fail(f"missing SQL file for fact: {path}")
+SURROGATE_KEY_FIELDS = ("table", "column")
+IDENTIFIER = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
 
+def validate_dimension_surrogate_key(model: dict, sql: SqlArtifactCache) -> Iterator[Diagnostic]:
     dimensions = model.get("dimensions", {})
-    for dim_name in dimensions.keys():
-        path = f"{DIM_SQL_DIR}/{dim_name}.sql"
-        if not os.path.exists(path):
-            fail(f"missing SQL file for dimension: {path}")
+    reserved = (
+        set(model.get("facts", {}))
+        | set(dimensions)
+        | set(model.get("rollups") or {})
+    )
+    catalog = sql.catalog()
+
+    for dim_name, dim_def in dimensions.items():
+        surrogate_key = dim_def.get("surrogate_key")
+        if not surrogate_key:
+            continue
+        if surrogate_key is True:
+            surrogate_key = {}
+
+        if not isinstance(surrogate_key, dict):
+            yield Diagnostic(
+                "dimension_surrogate_key",
+                f"dimension '{dim_name}' surrogate_key must be true or a mapping",
+            )
+            continue
+
+        unknown = sorted(
+            str(field) for field in surrogate_key
+            if field not in SURROGATE_KEY_FIELDS
+        )
+        if unknown:
+            yield Diagnostic(
+                "dimension_surrogate_key",
+                f"dimension '{dim_name}' surrogate_key has unknown field(s) "
+                f"{unknown} (allowed: {list(SURROGATE_KEY_FIELDS)})",
+            )
+
+        malformed = [
+            field for field in SURROGATE_KEY_FIELDS
+            if field in surrogate_key and not (
+                isinstance(surrogate_key[field], str)
+                and IDENTIFIER.fullmatch(surrogate_key[field])
+            )
+        ]
+        for field in malformed:
+            yield Diagnostic(
+                "dimension_surrogate_key",
+                f"dimension '{dim_name}' surrogate_key {field} must be an "
+                f"identifier, got {surrogate_key[field]!r}",
+            )
+        if malformed:
+            continue
+
+        if dim_def.get("calendar") is not None:
+            yield Diagnostic(
+                "dimension_surrogate_key",
+                f"dimension '{dim_name}' is a calendar and already has an "
+                f"integer date key",
+            )
+            continue
+
+        table_name = surrogate_key.get("table", f"{dim_name}__key_map")
+        if table_name in reserved:
+            yield Diagnostic(
+                "dimension_surrogate_key",
+                f"dimension '{dim_name}' key map table '{table_name}' "
+                f"collides with a fact, dimension or rollup name",
+            )
+
+        key = str(dim_def.get("key"))
+        stem = key[:-len("_id")] if key.endswith("_id") else key
+        column_name = surrogate_key.get("column", f"{stem}_sk")
+        if column_name == key or column_name in _names(dim_def, "attributes"):
+            yield Diagnostic(
+                "dimension_surrogate_key",
+                f"dimension '{dim_name}' surrogate key column "
+                f"'{column_name}' collides with a dimension column",
+            )
+
+        view = sql.dimension(dim_name).view
+        if catalog is None or view is None:
+            continue
+
+        table = catalog.table(view.tables[0]) if len(view.tables) == 1 else None
+        projection = view.projection(key)
+        if (
+            table is None
+            or projection is None
+            or len(projection.columns) != 1
+            or projection.aggregate is not None
+            or table.column(projection.columns[0]) is None
+        ):
+            yield Diagnostic(
+                "dimension_surrogate_key",
+                f"dimension '{dim_name}' must select its key '{key}' from a "
+                f"single column of one table of {sql.schema_path} to have "
+                f"a surrogate key",
+            )
+
+# ---------- SQL CONTRACT VALIDATION ----------
+
+def validate_sql_files_exist(model: dict, sql: SqlArtifactCache) -> Iterator[Diagnostic]:
+    for fact_name in model.get("facts", {}).keys():
+        artifact = sql.fact(fact_name)
+        if artifact.error:
+            yield Diagnostic(
+                "sql_files_exist",
+                f"cannot read SQL file {artifact.path}: {artifact.error}",
+            )
+        elif not artifact.exists:
+            yield Diagnostic(
+                "sql_files_exist",
+                f"missing SQL file for fact: {artifact.path}",
+            )
+        elif artifact.parse_error:
+            yield Diagnostic(
+                "sql_files_exist",
+                f"cannot parse SQL file {artifact.path}: {artifact.parse_error}",
+            )
+
+    for dim_name, dim_def in model.get("dimensions", {}).items():
+        if (dim_def or {}).get("calendar") is not None:
+            # Generated by the compiler; see validate_dimension_calendar
+            continue
 
-def validate_sql_view_names(model: dict):
+        artifact = sql.dimension(dim_name)
+        if artifact.error:
+            yield Diagnostic(
+                "sql_files_exist",
+                f"cannot read SQL file {artifact.path}: {artifact.error}",
+            )
+        elif not artifact.exists:
+            yield Diagnostic(
+                "sql_files_exist",
+                f"missing SQL file for dimension: {artifact.path}",
+            )
+        elif artifact.parse_error:
+            yield Diagnostic(
+                "sql_files_exist",
+                f"cannot parse SQL file {artifact.path}: {artifact.parse_error}",
+            )
+
+def validate_sql_view_names(model: dict, sql: SqlArtifactCache) -> Iterator[Diagnostic]:
     objects = []
     objects.extend(model.get("facts", {}).keys())
     objects.extend(model.get("dimensions", {}).keys())
 
     for obj in objects:
         if obj.startswith("fact_"):
-            path = f"{FACT_SQL_DIR}/{obj}.sql"
+            artifact = sql.fact(obj)
         else:
-            path = f"{DIM_SQL_DIR}/{obj}.sql"
-
-        if not os.path.exists(path):
-            fail(f"SQL file not found for view name validation: {path}")
-
-        with open(path, "r") as f:
-            content = f.read().lower()
+            artifact = sql.dimension(obj)
 
-        expected = f"create or replace view {obj}".lower()
-        if expected not in content:
-            fail(f"SQL view name mismatch in {path}")
+        view = artifact.view
+        if view is None:
+            continue
 
-# ---------- ENTRYPOINT ----------
+        if not view.or_replace or view.name != obj.lower():
+            yield Diagnostic(
+                "sql_view_names",
+                f"SQL view name mismatch in {artifact.path}",
+            )
 
-def main():
-    model = load_model(MODEL_PATH)
+# ---------- VALIDATOR ----------
 
+RULES = (
     # 1. SQL filesystem contract
-    validate_sql_files_exist(model)
+    validate_sql_files_exist,
 
     # 2. Core semantic structure
-    validate_facts(model)
-    validate_dimensions(model)
+    validate_facts,
+    validate_dimensions,
 
     # 3. Relational semantics
-    validate_fact_foreign_keys(model)
-    validate_grain_vs_foreign_keys(model)
-    validate_no_many_to_many(model)
+    validate_fact_foreign_keys,
+    validate_grain_vs_foreign_keys,
+    validate_no_many_to_many,
+    validate_fact_incremental_refresh,
+    validate_rollups,
+    validate_dimension_calendar,
+    validate_storage_modes,
 
     # 4. SQL naming & relational alignment
-    validate_sql_view_names(model)
-    validate_fact_grain_vs_sql(model)
-    validate_fact_foreign_keys_vs_sql(model)
+    validate_sql_view_names,
+    validate_fact_grain_vs_sql,
+    validate_fact_foreign_keys_vs_sql,
 
     # 5. Measures semantics
-    validate_fact_measures_vs_sql(model)
+    validate_fact_measures_vs_sql,
 
     # 6. Attribute contract (strictest)
-    validate_fact_attributes(model)
-    validate_dimension_attributes(model)
+    validate_fact_attributes,
+    validate_dimension_attributes,
+
+    # 7. Physical schema
+    validate_sql_columns_vs_schema,
+    validate_fact_measure_types,
+    validate_dimension_materialization,
+    validate_dimension_surrogate_key,
+)
+
+class Validator:
+    """
+    In-process semantic model validator.
+
+    Every SQL artifact referenced by the model is read once into a
+    shared cache, all rules run in a single pass, and every finding
+    is returned as a Diagnostic instead of aborting on the first one.
+    """
+
+    def __init__(
+        self,
+        fact_sql_dir: str = FACT_SQL_DIR,
+        dim_sql_dir: str = DIM_SQL_DIR,
+        schema_path: str = SCHEMA_PATH,
+    ):
+        self.fact_sql_dir = fact_sql_dir
+        self.dim_sql_dir = dim_sql_dir
+        self.schema_path = schema_path
+
+    def new_cache(self) -> SqlArtifactCache:
+        return SqlArtifactCache(
+            self.fact_sql_dir, self.dim_sql_dir, self.schema_path
+        )
+
+    def validate(
+        self,
+        model: dict,
+        sql: Optional[SqlArtifactCache] = None,
+    ) -> List[Diagnostic]:
+        """
+        `sql` lets long-lived callers (watch mode) keep parsed artifacts
+        warm between runs; by default every call starts from disk.
+        """
+        if sql is None:
+            sql = self.new_cache()
+        sql.preload(model)
+
+        diagnostics: List[Diagnostic] = []
+        for rule in RULES:
+            diagnostics.extend(rule(model, sql))
+        return diagnostics
+
+    def validate_file(self, path: str) -> List[Diagnostic]:
+        try:
+            model = load_model(path)
+        except ModelLoadError as e:
+            return [Diagnostic("load_model", str(e))]
+        return self.validate(model)
 
-    pass_validation()
+# ---------- ENTRYPOINT ----------
+
+def main():
+    diagnostics = Validator().validate_file(MODEL_PATH)
+
+    if diagnostics:
+        for diagnostic in diagnostics:
+            print(diagnostic)
+        sys.exit(1)
+
+    print("PASS: semantic model validation successful")
+    sys.exit(0)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -1,8 +1,17 @@
+import argparse
 import os
-import subprocess
 import sys
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
 
-VALIDATOR_PATH = "validation/engine.py"
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+from validation.engine import Validator
 
 # ---------- PATH CONTRACT ----------
 TEST_ROOT = "validation/tests"
@@ -10,30 +19,54 @@ POSITIVE_DIR = f"{TEST_ROOT}/positive"
 NEGATIVE_DIR = f"{TEST_ROOT}/negative"
 
 
-def run_test(model_path: str) -> int:
-    env = os.environ.copy()
-    env["MODEL_PATH"] = model_path
-
-    result = subprocess.run(
-        [sys.executable, VALIDATOR_PATH],
-        env=env,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        text=True,
+@dataclass(frozen=True)
+class TestResult:
+    path: str
+    expected: int
+    exit_code: int
+    output: List[str]
+    duration: float
+    crashed: bool = False
+
+    @property
+    def ok(self) -> bool:
+        # A crash is a validator defect, even where a failure is expected
+        return not self.crashed and (self.exit_code == 0) == (self.expected == 0)
+
+
+def run_test(case: Tuple[str, int]) -> TestResult:
+    """
+    Validates a single model in-process.
+
+    Each case gets a fresh Validator (and SQL cache), so cases never share
+    state even when a worker process executes several of them.
+    """
+    model_path, expected = case
+    started = time.perf_counter()
+    crashed = False
+
+    try:
+        diagnostics = Validator().validate_file(model_path)
+        output = [str(d) for d in diagnostics]
+        exit_code = 1 if diagnostics else 0
+        if not diagnostics:
+            output.append("PASS: semantic model validation successful")
+    except Exception:
+        output = [traceback.format_exc().strip()]
+        exit_code = 1
+        crashed = True
+
+    return TestResult(
+        path=model_path,
+        expected=expected,
+        exit_code=exit_code,
+        output=output,
+        duration=time.perf_counter() - started,
+        crashed=crashed,
     )
 
-    print(result.stdout.strip())
-    if result.stderr:
-        print(result.stderr.strip())
-
-    return result.returncode
-
-
-def main():
-    if not os.path.isdir(TEST_ROOT):
-        print("No test directory found.")
-        sys.exit(1)
 
+def discover_tests() -> List[Tuple[str, int]]:
     tests = []
 
     # iterate explicitly over positive/negative dirs
@@ -46,24 +79,85 @@ def main():
                 expected = 0 if "positive" in root else 1
                 tests.append((full_path, expected))
 
+    return sorted(tests)
+
+
+def run_tests(
+    tests: List[Tuple[str, int]],
+    jobs: Optional[int] = None,
+) -> List[TestResult]:
+    jobs = jobs or os.cpu_count() or 1
+
+    if jobs == 1 or len(tests) == 1:
+        return [run_test(case) for case in tests]
+
+    # Large chunks amortize IPC overhead across thousands of small cases
+    chunksize = max(1, len(tests) // (jobs * 4))
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        return list(pool.map(run_test, tests, chunksize=chunksize))
+
+
+def print_summary(results: List[TestResult], wall_time: float) -> None:
+    print("Timings:")
+    for result in sorted(results, key=lambda r: r.duration, reverse=True):
+        status = "ok" if result.ok else "UNEXPECTED"
+        print(f"  {result.duration * 1000:8.1f} ms  {status:<10} {result.path}")
+
+    total = sum(r.duration for r in results)
+    failures = sum(1 for r in results if not r.ok)
+    print()
+    print(
+        f"Ran {len(results)} test cases in {wall_time:.2f}s "
+        f"(cumulative {total:.2f}s), "
+        f"{len(results) - failures} as expected, {failures} unexpected"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Run semantic model validation test cases."
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=None,
+        help="number of worker processes (default: CPU count)",
+    )
+    args = parser.parse_args()
+
+    if not os.path.isdir(TEST_ROOT):
+        print("No test directory found.")
+        sys.exit(1)
+
+    tests = discover_tests()
+
     if not tests:
         print("No test cases found.")
         sys.exit(1)
 
     print(f"Discovered {len(tests)} test cases\n")
 
+    started = time.perf_counter()
+    results = run_tests(tests, jobs=args.jobs)
+    wall_time = time.perf_counter() - started
+
     failures = 0
 
-    for test_path, expected in sorted(tests):
-        print(f"Running test: {test_path}")
-        exit_code = run_test(test_path)
+    for result in results:
+        print(f"Running test: {result.path}")
+        for line in result.output:
+            print(line)
 
-        if (exit_code == 0 and expected != 0) or (exit_code != 0 and expected == 0):
-            print(f"UNEXPECTED RESULT for {test_path}")
+        if not result.ok:
+            print(f"UNEXPECTED RESULT for {result.path}")
             failures += 1
 
         print("-" * 40)
 
+    print_summary(results, wall_time)
+    print()
+
     if failures:
         print(f"Test run failed. Unexpected results: {failures}")
         sys.exit(1)
@@ -73,4 +167,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,334 @@
+import hashlib
+import json
+import os
+import re
+from dataclasses import asdict, dataclass, field, replace
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from validation.sql_index import SqlParseError, SqlView
+
+# Bump whenever parsing or the cached layout changes
+CATALOG_FORMAT = 1
+CATALOG_CACHE_DIR = os.environ.get("SCHEMA_CATALOG_CACHE", ".cache/schema_catalog")
+
+NUMERIC_TYPES = frozenset({
+    "bit", "tinyint", "smallint", "mediumint", "int", "integer", "bigint",
+    "decimal", "dec", "numeric", "fixed", "float", "double", "real",
+})
+
+# ---------- TOKENIZER ----------
+
+_DDL_TOKEN_RE = re.compile(
+    r"""
+    (?P<ws>\s+)
+    |(?P<comment>--[^\n]*|\#[^\n]*|/\*.*?\*/)
+    |(?P<string>'(?:[^'\\]|\\.|'')*')
+    |(?P<quoted>`[^`]*`|"[^"]*")
+    |(?P<number>\d+(?:\.\d+)?)
+    |(?P<ident>[A-Za-z_][A-Za-z_0-9$]*)
+    |(?P<op>[(),.;=])
+    """,
+    re.VERBOSE | re.DOTALL,
+)
+
+
+class _DdlToken(NamedTuple):
+    kind: str   # ident | number | string | op
+    value: str  # identifiers keep their declared case, unquoted
+
+
+def _tokenize(ddl: str) -> List[_DdlToken]:
+    tokens: List[_DdlToken] = []
+    pos = 0
+    while pos < len(ddl):
+        match = _DDL_TOKEN_RE.match(ddl, pos)
+        if not match:
+            raise SqlParseError(
+                f"unexpected character {ddl[pos]!r} at offset {pos}"
+            )
+        pos = match.end()
+
+        kind = match.lastgroup
+        value = match.group(kind)
+        if kind in ("ws", "comment"):
+            continue
+        if kind == "quoted":
+            tokens.append(_DdlToken("ident", value[1:-1]))
+        else:
+            tokens.append(_DdlToken(kind, value))
+    return tokens
+
+# ---------- CATALOG ----------
+
+@dataclass(frozen=True)
+class Column:
+    """
+    A column of a physical table as declared in the DDL.
+
+    `data_type` is the lowercased base type (varchar, decimal, ...);
+    `args` holds its length or precision/scale.
+    """
+    name: str
+    data_type: str
+    args: Tuple[int, ...] = ()
+    nullable: bool = True
+    unsigned: bool = False
+
+    @property
+    def is_numeric(self) -> bool:
+        return self.data_type in NUMERIC_TYPES
+
+    @property
+    def declared_type(self) -> str:
+        if not self.args:
+            return self.data_type
+        return f"{self.data_type}({','.join(str(a) for a in self.args)})"
+
+
+@dataclass(frozen=True)
+class Table:
+    """
+    A physical table with O(1) case-insensitive column lookup.
+    """
+    name: str
+    columns: Tuple[Column, ...]
+    primary_key: Tuple[str, ...] = ()
+    by_name: Dict[str, Column] = field(compare=False, repr=False, default_factory=dict)
+
+    def column(self, name: str) -> Optional[Column]:
+        return self.by_name.get(name.lower())
+
+
+def _table(name: str, columns: List[Column], primary_key: Tuple[str, ...]) -> Table:
+    return Table(
+        name=name,
+        columns=tuple(columns),
+        primary_key=primary_key,
+        by_name={c.name.lower(): c for c in columns},
+    )
+
+
+@dataclass(frozen=True)
+class SchemaCatalog:
+    """
+    Typed catalog of the tables declared in a DDL file.
+
+    `source_hash` is the SHA-256 of the DDL the catalog was built from.
+    """
+    source_hash: str
+    tables: Dict[str, Table]
+
+    def table(self, name: str) -> Optional[Table]:
+        return self.tables.get(name.lower())
+
+    def column(self, table: str, column: str) -> Optional[Column]:
+        found = self.tables.get(table.lower())
+        return found.column(column) if found is not None else None
+
+    def to_dict(self) -> dict:
+        return {
+            "format": CATALOG_FORMAT,
+            "source_hash": self.source_hash,
+            "tables": [
+                {
+                    "name": t.name,
+                    "primary_key": list(t.primary_key),
+                    "columns": [asdict(c) for c in t.columns],
+                }
+                for t in self.tables.values()
+            ],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "SchemaCatalog":
+        tables = {}
+        for table in data["tables"]:
+            columns = [
+                Column(**{**column, "args": tuple(column["args"])})
+                for column in table["columns"]
+            ]
+            tables[table["name"].lower()] = _table(
+                table["name"], columns, tuple(table["primary_key"])
+            )
+        return cls(source_hash=data["source_hash"], tables=tables)
+
+# ---------- PARSER ----------
+
+# Constraint clauses inside CREATE TABLE that do not declare a column
+_CONSTRAINTS = frozenset({
+    "primary", "key", "index", "unique", "constraint", "foreign",
+    "fulltext", "spatial", "check",
+})
+
+
+def _split(tokens: List[_DdlToken]) -> List[List[_DdlToken]]:
+    """
+    Splits a parenthesised definition list on top-level commas.
+    """
+    items: List[List[_DdlToken]] = [[]]
+    depth = 0
+    for token in tokens:
+        if token.value == "(":
+            depth += 1
+        elif token.value == ")":
+            depth -= 1
+        if depth == 0 and token.value == ",":
+            items.append([])
+        else:
+            items[-1].append(token)
+    return [item for item in items if item]
+
+
+def _column(tokens: List[_DdlToken]) -> Column:
+    if len(tokens) < 2 or tokens[1].kind != "ident":
+        raise SqlParseError(f"invalid column definition near '{tokens[0].value}'")
+
+    args: List[int] = []
+    rest = tokens[2:]
+    if rest and rest[0].value == "(":
+        end = next(i for i, t in enumerate(rest) if t.value == ")")
+        args = [int(float(t.value)) for t in rest[1:end] if t.kind == "number"]
+        rest = rest[end + 1:]
+
+    words = [t.value.lower() for t in rest if t.kind == "ident"]
+    not_null = any(
+        a == "not" and b == "null" for a, b in zip(words, words[1:])
+    )
+
+    return Column(
+        name=tokens[0].value,
+        data_type=tokens[1].value.lower(),
+        args=tuple(args),
+        nullable=not not_null and "primary" not in words,
+        unsigned="unsigned" in words,
+    )
+
+
+def _primary_key(tokens: List[_DdlToken]) -> Tuple[str, ...]:
+    values = [t.value.lower() for t in tokens[:2]]
+    if values != ["primary", "key"]:
+        return ()
+    return tuple(t.value for t in tokens[2:] if t.kind == "ident")
+
+
+def parse_schema(ddl: str) -> SchemaCatalog:
+    """
+    Parses every CREATE TABLE statement of a MySQL DDL file.
+    Other statements are ignored.
+    """
+    tokens = _tokenize(ddl)
+    tables: Dict[str, Table] = {}
+    pos = 0
+
+    while pos < len(tokens):
+        words = [t.value.lower() for t in tokens[pos:pos + 2]]
+        if words != ["create", "table"]:
+            pos += 1
+            continue
+
+        pos += 2
+        if [t.value.lower() for t in tokens[pos:pos + 3]] == ["if", "not", "exists"]:
+            pos += 3
+
+        name = tokens[pos].value
+        pos += 1
+        # Qualified names (schema.table) are indexed by their last part
+        while pos + 1 < len(tokens) and tokens[pos].value == ".":
+            name = tokens[pos + 1].value
+            pos += 2
+
+        if pos >= len(tokens) or tokens[pos].value != "(":
+            raise SqlParseError(f"expected '(' after CREATE TABLE {name}")
+
+        depth, start = 0, pos + 1
+        while pos < len(tokens):
+            if tokens[pos].value == "(":
+                depth += 1
+            elif tokens[pos].value == ")":
+                depth -= 1
+                if depth == 0:
+                    break
+            pos += 1
+        if depth != 0:
+            raise SqlParseError(f"unterminated CREATE TABLE {name}")
+
+        columns: List[Column] = []
+        primary_key: Tuple[str, ...] = ()
+        for item in _split(tokens[start:pos]):
+            if item[0].kind == "ident" and item[0].value.lower() in _CONSTRAINTS:
+                primary_key = _primary_key(item) or primary_key
+                continue
+            columns.append(_column(item))
+
+        if primary_key:
+            keys = {k.lower() for k in primary_key}
+            columns = [
+                replace(c, nullable=False) if c.name.lower() in keys else c
+                for c in columns
+            ]
+
+        tables[name.lower()] = _table(name, columns, primary_key)
+        pos += 1
+
+    return SchemaCatalog(
+        source_hash=hashlib.sha256(ddl.encode("utf-8")).hexdigest(),
+        tables=tables,
+    )
+
+# ---------- DISK CACHE ----------
+
+def load_catalog(path: str, cache_dir: str = CATALOG_CACHE_DIR) -> SchemaCatalog:
+    """
+    Returns the catalog of the DDL file at `path`.
+
+    Parsed catalogs are cached as JSON under `cache_dir`, keyed by the
+    SHA-256 of the file, so unchanged schemas are never re-parsed.
+    """
+    with open(path, "r") as f:
+        ddl = f.read()
+
+    source_hash = hashlib.sha256(ddl.encode("utf-8")).hexdigest()
+    cache_path = os.path.join(cache_dir, f"{source_hash}.v{CATALOG_FORMAT}.json")
+
+    try:
+        with open(cache_path, "r") as f:
+            data = json.load(f)
+        if data.get("format") == CATALOG_FORMAT and data.get("source_hash") == source_hash:
+            return SchemaCatalog.from_dict(data)
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
+    catalog = parse_schema(ddl)
+
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(catalog.to_dict(), f, indent=1, sort_keys=True)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        # A read-only checkout still gets a catalog, just not a cached one
+        pass
+
+    return catalog
+
+# ---------- VIEW RESOLUTION ----------
+
+def physical_columns(view: SqlView, catalog: SchemaCatalog) -> Dict[str, Column]:
+    """
+    Maps each projection of a view reading exactly one column of a
+    catalog table to that column: alias → Column.
+    """
+    tables = [catalog.table(name) for name in view.tables]
+    tables = [t for t in tables if t is not None]
+
+    resolved = {}
+    for projection in view.projections:
+        if len(projection.columns) != 1:
+            continue
+        for table in tables:
+            column = table.column(projection.columns[0])
+            if column is not None:
+                resolved[projection.alias] = column
+                break
+    return resolved
@@ -0,0 +1,398 @@
+import re
+from dataclasses import dataclass, field
+from typing import Dict, FrozenSet, List, NamedTuple, Optional, Tuple
+
+# ---------- TOKENIZER ----------
+
+AGGREGATE_FUNCTIONS = frozenset({"sum", "count", "avg", "min", "max"})
+
+# Keywords that can never be a column reference or an implicit alias
+KEYWORDS = frozenset({
+    "select", "distinct", "all", "from", "where", "group", "by", "having",
+    "order", "limit", "as", "on", "join", "left", "right", "inner", "outer",
+    "cross", "full", "and", "or", "not", "is", "null", "in", "like",
+    "between", "case", "when", "then", "else", "end", "asc", "desc",
+    "create", "replace", "view", "union", "true", "false", "interval",
+})
+
+_CLAUSE_END = frozenset({"where", "group", "having", "order", "limit", "union"})
+
+_TOKEN_RE = re.compile(
+    r"""
+    (?P<ws>\s+)
+    |(?P<comment>--[^\n]*|\#[^\n]*|/\*.*?\*/)
+    |(?P<string>'(?:[^'\\]|\\.|'')*')
+    |(?P<quoted>`[^`]*`|"[^"]*")
+    |(?P<number>\d+(?:\.\d+)?)
+    |(?P<param>@[A-Za-z_][A-Za-z_0-9]*)
+    |(?P<ident>[A-Za-z_][A-Za-z_0-9$]*)
+    |(?P<op><=|>=|<>|!=|\|\||[(),.;*+\-/%=<>])
+    """,
+    re.VERBOSE | re.DOTALL,
+)
+
+
+class SqlParseError(ValueError):
+    """
+    Raised when a SQL file is outside the supported CREATE VIEW subset.
+    """
+
+
+class Token(NamedTuple):
+    kind: str   # ident | number | string | param | op
+    value: str  # identifiers are lowercased and unquoted
+    text: str   # as written in the source file
+
+
+def tokenize(sql: str) -> List[Token]:
+    tokens: List[Token] = []
+    pos = 0
+    length = len(sql)
+
+    while pos < length:
+        match = _TOKEN_RE.match(sql, pos)
+        if not match:
+            raise SqlParseError(
+                f"unexpected character {sql[pos]!r} at offset {pos}"
+            )
+        pos = match.end()
+
+        kind = match.lastgroup
+        value = match.group(kind)
+        if kind in ("ws", "comment"):
+            continue
+        if kind == "quoted":
+            tokens.append(Token("ident", value[1:-1].lower(), value))
+        elif kind == "ident":
+            tokens.append(Token("ident", value.lower(), value))
+        else:
+            tokens.append(Token(kind, value, value))
+
+    return tokens
+
+# ---------- VIEW INDEX ----------
+
+@dataclass(frozen=True)
+class Projection:
+    """
+    A single SELECT item of a view; `expression` is SQL text as written.
+    """
+    alias: str
+    expression: str
+    columns: Tuple[str, ...]
+    aggregate: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class SqlView:
+    """
+    Parsed CREATE VIEW statement with O(1) lookup structures.
+
+    `source` and `where` hold the FROM clause and WHERE predicate as SQL
+    text with identifiers as written, so they can be emitted verbatim.
+    """
+    name: str
+    or_replace: bool
+    distinct: bool
+    projections: Tuple[Projection, ...]
+    tables: Tuple[str, ...]
+    group_by: FrozenSet[str]
+    identifiers: FrozenSet[str]
+    by_alias: Dict[str, Projection] = field(compare=False, repr=False)
+    source: Optional[str] = None
+    where: Optional[str] = None
+
+    @property
+    def columns(self) -> List[str]:
+        return [p.alias for p in self.projections]
+
+    def projection(self, alias: str) -> Optional[Projection]:
+        return self.by_alias.get(alias.lower())
+
+    def is_aggregated(self, alias: str) -> bool:
+        projection = self.projection(alias)
+        return projection is not None and projection.aggregate is not None
+
+    def is_grouped(self, alias: str) -> bool:
+        """
+        True when the projection is covered by GROUP BY, either through
+        its alias or through every source column it reads.
+        """
+        alias = alias.lower()
+        if alias in self.group_by:
+            return True
+
+        projection = self.by_alias.get(alias)
+        if projection is None or not projection.columns:
+            return False
+        return all(col in self.group_by for col in projection.columns)
+
+# ---------- PARSER ----------
+
+class _Parser:
+    def __init__(self, tokens: List[Token]):
+        self.tokens = tokens
+        self.pos = 0
+
+    def peek(self, offset: int = 0) -> Optional[Token]:
+        index = self.pos + offset
+        return self.tokens[index] if index < len(self.tokens) else None
+
+    def at(self, *words: str) -> bool:
+        for offset, word in enumerate(words):
+            token = self.peek(offset)
+            if token is None or token.value != word:
+                return False
+        return True
+
+    def accept(self, *words: str) -> bool:
+        if self.at(*words):
+            self.pos += len(words)
+            return True
+        return False
+
+    def expect(self, word: str) -> None:
+        if not self.accept(word):
+            token = self.peek()
+            found = token.value if token else "end of input"
+            raise SqlParseError(f"expected '{word}', found '{found}'")
+
+    def identifier(self) -> str:
+        token = self.peek()
+        if token is None or token.kind != "ident":
+            found = token.value if token else "end of input"
+            raise SqlParseError(f"expected identifier, found '{found}'")
+        self.pos += 1
+
+        # Qualified names (schema.view) are indexed by their last part
+        while self.at(".") and self.peek(1) and self.peek(1).kind == "ident":
+            self.pos += 1
+            token = self.peek()
+            self.pos += 1
+        return token.value
+
+    def split_until(self, stop: FrozenSet[str]) -> List[List[Token]]:
+        """
+        Splits tokens on top-level commas until a top-level stop word,
+        a ';' or the end of input.
+        """
+        items: List[List[Token]] = []
+        current: List[Token] = []
+        depth = 0
+
+        while self.pos < len(self.tokens):
+            token = self.tokens[self.pos]
+            if depth == 0 and (token.value in stop or token.value == ";"):
+                break
+            if token.value == "(":
+                depth += 1
+            elif token.value == ")":
+                depth -= 1
+                if depth < 0:
+                    break
+            if depth == 0 and token.value == ",":
+                items.append(current)
+                current = []
+            else:
+                current.append(token)
+            self.pos += 1
+
+        if current:
+            items.append(current)
+        return items
+
+    def parse_view(self) -> SqlView:
+        self.expect("create")
+        or_replace = self.accept("or", "replace")
+        self.expect("view")
+        name = self.identifier()
+        self.expect("as")
+        nested = self.accept("(")
+
+        self.expect("select")
+        distinct = self.accept("distinct")
+        self.accept("all")
+
+        projections = tuple(
+            _projection(item)
+            for item in self.split_until(frozenset({"from"}))
+        )
+
+        tables: List[str] = []
+        source = None
+        if self.accept("from"):
+            start = self.pos
+            for item in self.split_until(_CLAUSE_END):
+                tables.extend(_tables(item))
+            source = _render(self.tokens[start:self.pos])
+
+        group_by: set = set()
+        where = None
+        while self.pos < len(self.tokens) and not self.at(";"):
+            if self.accept("group", "by"):
+                for item in self.split_until(_CLAUSE_END):
+                    group_by.update(_column_refs(item))
+            elif self.accept("where"):
+                start = self.pos
+                self.split_until(_CLAUSE_END)
+                where = _render(self.tokens[start:self.pos])
+            elif nested and self.at(")"):
+                self.pos += 1
+            else:
+                self.split_until(_CLAUSE_END - {self.peek().value})
+                if self.pos < len(self.tokens) and self.tokens[self.pos].value == ")":
+                    self.pos += 1
+
+        identifiers = frozenset(
+            token.value for token in self.tokens if token.kind == "ident"
+        )
+
+        return SqlView(
+            name=name,
+            or_replace=or_replace,
+            distinct=distinct,
+            projections=projections,
+            tables=tuple(tables),
+            group_by=frozenset(group_by),
+            identifiers=identifiers,
+            by_alias={p.alias: p for p in projections},
+            source=source,
+            where=where,
+        )
+
+
+def _column_refs(tokens: List[Token]) -> List[str]:
+    """
+    Column names referenced by an expression, with qualifiers stripped.
+    """
+    columns = []
+    for i, token in enumerate(tokens):
+        if token.kind != "ident" or token.value in KEYWORDS:
+            continue
+        following = tokens[i + 1].value if i + 1 < len(tokens) else None
+        if following in (".", "("):
+            continue
+        if i > 0 and tokens[i - 1].value == "as":
+            # CAST(... AS <type>)
+            continue
+        columns.append(token.value)
+    return columns
+
+
+def _uncast(tokens: List[Token]) -> List[Token]:
+    """
+    Operand of a CAST(... AS <type>) wrapping the whole expression, or
+    the expression itself.
+    """
+    if len(tokens) < 6 or tokens[0].value != "cast" or tokens[1].value != "(":
+        return tokens
+
+    depth = 0
+    as_index = None
+    for i, token in enumerate(tokens[1:], start=1):
+        if token.value == "(":
+            depth += 1
+        elif token.value == ")":
+            depth -= 1
+            if depth == 0:
+                if i != len(tokens) - 1 or as_index is None:
+                    return tokens
+                return tokens[2:as_index]
+        elif token.value == "as" and depth == 1:
+            as_index = i
+    return tokens
+
+
+def _aggregate(tokens: List[Token]) -> Optional[str]:
+    """
+    Name of the aggregate function wrapping the whole expression (or
+    the operand of a CAST wrapping it), if any.
+    """
+    tokens = _uncast(tokens)
+    if (
+        len(tokens) < 3
+        or tokens[0].value not in AGGREGATE_FUNCTIONS
+        or tokens[1].value != "("
+    ):
+        return None
+
+    depth = 0
+    for i, token in enumerate(tokens[1:], start=1):
+        if token.value == "(":
+            depth += 1
+        elif token.value == ")":
+            depth -= 1
+            if depth == 0:
+                return tokens[0].value if i == len(tokens) - 1 else None
+    return None
+
+
+def _projection(tokens: List[Token]) -> Projection:
+    if not tokens:
+        raise SqlParseError("empty SELECT item")
+
+    expression = tokens
+    alias = None
+
+    if len(tokens) >= 3 and tokens[-2].value == "as":
+        expression, alias = tokens[:-2], tokens[-1].value
+    elif (
+        len(tokens) >= 2
+        and tokens[-1].kind == "ident"
+        and tokens[-1].value not in KEYWORDS
+        and tokens[-2].value != "."
+        and (tokens[-2].kind == "ident" or tokens[-2].value == ")")
+        and tokens[-2].value not in KEYWORDS - {"end"}
+    ):
+        expression, alias = tokens[:-1], tokens[-1].value
+
+    columns = tuple(_column_refs(expression))
+    if alias is None:
+        alias = tokens[-1].value
+
+    return Projection(
+        alias=alias,
+        expression=_render(expression),
+        columns=columns,
+        aggregate=_aggregate(expression),
+    )
+
+
+def _tables(tokens: List[Token]) -> List[str]:
+    """
+    Table names of a FROM item, including joined tables.
+    """
+    tables = []
+    expect_table = True
+    for i, token in enumerate(tokens):
+        if token.value == "join":
+            expect_table = True
+        elif expect_table and token.kind == "ident" and token.value not in KEYWORDS:
+            following = tokens[i + 1].value if i + 1 < len(tokens) else None
+            if following != ".":
+                tables.append(token.value)
+                expect_table = False
+    return tables
+
+
+def _render(tokens: List[Token]) -> str:
+    rendered = ""
+    for token in tokens:
+        if rendered and not (
+            token.value in (".", ")", ",")
+            or rendered.endswith((".", "("))
+            or (token.value == "(" and rendered[-1].isalnum())
+        ):
+            rendered += " "
+        rendered += token.text
+    return rendered
+
+
+def parse_view(sql: str) -> SqlView:
+    """
+    Parses a single CREATE [OR REPLACE] VIEW ... AS SELECT statement.
+    """
+    tokens = tokenize(sql)
+    if not tokens:
+        raise SqlParseError("empty SQL file")
+    return _Parser(tokens).parse_view()